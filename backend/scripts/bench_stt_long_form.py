@@ -0,0 +1,112 @@
+"""Benchmark STT latency versus utterance length, single-pass vs long-form.
+
+Usage (from backend/):
+    uv run python scripts/bench_stt_long_form.py --audio speech.wav
+    uv run python scripts/bench_stt_long_form.py --lengths 5 15 30 60 --repeat 3
+
+The input recording (16 kHz mono recommended; other rates are resampled) is
+tiled or cropped to each length. Without ``--audio`` a synthetic signal is
+used, which measures latency only (the transcript is meaningless).
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import numpy as np
+
+from voice_assistant.audio import StreamingResampler
+from voice_assistant.stt import STT_SAMPLE_RATE, ReazonSpeechSTT, get_stt_device
+
+
+def load_audio(path: str | None) -> np.ndarray:
+    """Load a recording as 16 kHz float32, or synthesize 10 s of audio."""
+    if path is None:
+        rng = np.random.default_rng(0)
+        t = np.arange(10 * STT_SAMPLE_RATE) / STT_SAMPLE_RATE
+        envelope = 0.5 + 0.5 * np.sin(2 * np.pi * 0.7 * t)
+        tone = np.sin(2 * np.pi * 180 * t) + 0.1 * rng.standard_normal(len(t))
+        return (0.2 * envelope * tone).astype(np.float32)
+
+    import soundfile as sf
+
+    audio, sample_rate = sf.read(path, dtype="float32", always_2d=True)
+    audio = audio.mean(axis=1).astype(np.float32)
+    if sample_rate != STT_SAMPLE_RATE:
+        audio = StreamingResampler(sample_rate, STT_SAMPLE_RATE).process(audio)
+    return audio
+
+
+def fit_length(audio: np.ndarray, seconds: float) -> np.ndarray:
+    """Tile or crop audio to the given duration."""
+    samples = int(seconds * STT_SAMPLE_RATE)
+    repeats = -(-samples // len(audio))
+    return np.tile(audio, repeats)[:samples]
+
+
+async def measure(
+    stt: ReazonSpeechSTT, audio: np.ndarray, repeat: int
+) -> tuple[float, str]:
+    """Return the median latency (ms) and the last transcript."""
+    latencies = []
+    text = ""
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = await stt.transcribe(audio.tobytes(), STT_SAMPLE_RATE)
+        latencies.append((time.perf_counter() - start) * 1000)
+        text = result.text
+    return statistics.median(latencies), text
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--audio", help="WAV/FLAC recording to tile (default: synthetic)"
+    )
+    parser.add_argument(
+        "--lengths", type=float, nargs="+", default=[5, 10, 20, 30, 45, 60]
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--segment-sec", type=float, default=15.0)
+    parser.add_argument("--overlap-sec", type=float, default=0.5)
+    parser.add_argument("--max-batch-size", type=int, default=4)
+    parser.add_argument("--device", default=None)
+    args = parser.parse_args()
+
+    device = args.device or get_stt_device()
+    source = load_audio(args.audio)
+    single = ReazonSpeechSTT(
+        device=device, max_batch_size=args.max_batch_size, segment_sec=None
+    )
+    long_form = ReazonSpeechSTT(
+        device=device,
+        max_batch_size=args.max_batch_size,
+        segment_sec=args.segment_sec,
+        segment_overlap_sec=args.overlap_sec,
+    )
+
+    # Load both models and warm up kernels outside the measurements
+    warmup = fit_length(source, 2)
+    await measure(single, warmup, 1)
+    await measure(long_form, warmup, 1)
+
+    print(
+        f"device={device} segment_sec={args.segment_sec} "
+        f"overlap_sec={args.overlap_sec} max_batch_size={args.max_batch_size}"
+    )
+    print(
+        f"{'length_s':>8} {'single_ms':>10} {'long_form_ms':>12} {'speedup':>8}  same_text"
+    )
+    for seconds in args.lengths:
+        audio = fit_length(source, seconds)
+        single_ms, single_text = await measure(single, audio, args.repeat)
+        long_ms, long_text = await measure(long_form, audio, args.repeat)
+        print(
+            f"{seconds:>8.1f} {single_ms:>10.1f} {long_ms:>12.1f} "
+            f"{single_ms / long_ms:>7.2f}x  {single_text == long_text}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,89 @@
+"""Benchmark TTS throughput, per-sentence vs batched inference.
+
+Usage (from backend/):
+    uv run python scripts/bench_tts_batching.py --sessions 4 --batch-sizes 2 4 8
+
+Simulates concurrent sessions that each synthesize the same list of
+sentences one after another (as a conversation turn does) and reports
+wall time, throughput and batch occupancy for each configuration.
+"""
+
+import argparse
+import asyncio
+import gc
+import time
+
+from voice_assistant.tts import StyleBertVits2TTS, get_tts_device
+
+SENTENCES = [
+    "こんにちは。",
+    "今日はとても良い天気ですね。",
+    "明日の予定を確認しましょうか。",
+    "はい、承知しました。",
+    "駅までは歩いて十分ほどかかります。",
+    "他に何かお手伝いできることはありますか。",
+]
+
+
+async def run_session(tts: StyleBertVits2TTS, sentences: list[str]) -> float:
+    """Synthesize sentences in order; return seconds of audio produced."""
+    audio_sec = 0.0
+    for sentence in sentences:
+        result = await tts.synthesize(sentence)
+        audio_sec += len(result.audio) / 2 / result.sample_rate
+    return audio_sec
+
+
+async def measure(
+    tts: StyleBertVits2TTS, sessions: int, rounds: int
+) -> tuple[float, float]:
+    """Return (wall seconds, audio seconds) for concurrent sessions."""
+    start = time.perf_counter()
+    audio_sec = 0.0
+    for _ in range(rounds):
+        results = await asyncio.gather(
+            *(run_session(tts, SENTENCES) for _ in range(sessions))
+        )
+        audio_sec += sum(results)
+    return time.perf_counter() - start, audio_sec
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=4)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[2, 4])
+    parser.add_argument("--batch-wait-ms", type=float, default=30.0)
+    parser.add_argument("--rounds", type=int, default=2)
+    parser.add_argument("--device", default=None)
+    args = parser.parse_args()
+
+    device = args.device or get_tts_device()
+    sentences = args.sessions * len(SENTENCES) * args.rounds
+    print(f"device={device} sessions={args.sessions} sentences={sentences}")
+    print(
+        f"{'batch':>5} {'wall_s':>7} {'sent/s':>7} {'RTF':>6} "
+        f"{'occupancy':>9} {'padding':>8} {'speedup':>8}"
+    )
+
+    baseline_wall = None
+    for batch_size in [1, *args.batch_sizes]:
+        # One model in memory at a time
+        tts = StyleBertVits2TTS(
+            device=device, max_batch_size=batch_size, batch_wait_ms=args.batch_wait_ms
+        )
+        await tts.warmup()
+        wall, audio_sec = await measure(tts, args.sessions, args.rounds)
+        batching = tts.stats()["batching"]
+        baseline_wall = baseline_wall or wall
+        occupancy = batching["occupancy"] if batch_size > 1 else 1.0
+        print(
+            f"{batch_size:>5} {wall:>7.2f} {sentences / wall:>7.2f} "
+            f"{wall / audio_sec:>6.3f} {occupancy:>9.2%} "
+            f"{batching['padding_efficiency']:>8.2%} {baseline_wall / wall:>7.2f}x"
+        )
+        del tts
+        gc.collect()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,152 @@
+"""Compare latency and character error rate of float32 vs int8 STT on CPU.
+
+Usage (from backend/):
+    uv run python scripts/compare_stt_quantization.py --data path/to/set
+
+The data directory holds audio files (.wav/.flac, any rate, mono or
+stereo) with reference transcripts in same-named .txt files:
+
+    set/0001.wav  set/0001.txt
+    set/0002.wav  set/0002.txt
+
+CER is the character-level edit distance divided by the reference length,
+after NFKC normalization with whitespace and punctuation removed.
+"""
+
+import argparse
+import asyncio
+import gc
+import statistics
+import time
+import unicodedata
+from pathlib import Path
+
+import numpy as np
+
+from voice_assistant.audio import StreamingResampler
+from voice_assistant.stt import STT_SAMPLE_RATE, ReazonSpeechSTT
+
+AUDIO_SUFFIXES = (".wav", ".flac")
+
+
+def normalize(text: str) -> str:
+    """Normalize a transcript for CER (NFKC, no whitespace/punctuation)."""
+    text = unicodedata.normalize("NFKC", text)
+    return "".join(
+        ch
+        for ch in text
+        if not ch.isspace() and not unicodedata.category(ch).startswith("P")
+    )
+
+
+def edit_distance(reference: str, hypothesis: str) -> int:
+    """Levenshtein distance between two strings."""
+    previous = list(range(len(hypothesis) + 1))
+    for i, ref_char in enumerate(reference, 1):
+        current = [i]
+        for j, hyp_char in enumerate(hypothesis, 1):
+            current.append(
+                min(
+                    previous[j] + 1,
+                    current[j - 1] + 1,
+                    previous[j - 1] + (ref_char != hyp_char),
+                )
+            )
+        previous = current
+    return previous[-1]
+
+
+def load_dataset(data_dir: Path) -> list[tuple[str, np.ndarray, str]]:
+    """Load (name, 16 kHz float32 audio, reference) for each audio file."""
+    import soundfile as sf
+
+    items = []
+    for path in sorted(data_dir.iterdir()):
+        if path.suffix.lower() not in AUDIO_SUFFIXES:
+            continue
+        reference_path = path.with_suffix(".txt")
+        if not reference_path.exists():
+            print(f"skipping {path.name}: no {reference_path.name}")
+            continue
+        audio, sample_rate = sf.read(path, dtype="float32", always_2d=True)
+        audio = audio.mean(axis=1).astype(np.float32)
+        if sample_rate != STT_SAMPLE_RATE:
+            audio = StreamingResampler(sample_rate, STT_SAMPLE_RATE).process(audio)
+        reference = reference_path.read_text(encoding="utf-8").strip()
+        items.append((path.stem, audio, reference))
+    return items
+
+
+async def evaluate(
+    stt: ReazonSpeechSTT, items: list[tuple[str, np.ndarray, str]], repeat: int
+) -> dict:
+    """Transcribe every item; return latencies, errors and hypotheses."""
+    await stt.warmup()
+    latencies, hypotheses = [], []
+    errors = 0
+    for _, audio, reference in items:
+        runs = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = await stt.transcribe(audio.tobytes(), STT_SAMPLE_RATE)
+            runs.append((time.perf_counter() - start) * 1000)
+        latencies.append(statistics.median(runs))
+        hypotheses.append(result.text)
+        errors += edit_distance(normalize(reference), normalize(result.text))
+    return {"latencies": latencies, "errors": errors, "hypotheses": hypotheses}
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--data", type=Path, required=True)
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=Path("data/stt_cache"),
+        help="Quantized encoder cache (same default as the server)",
+    )
+    parser.add_argument("--verbose", action="store_true", help="Print every file")
+    args = parser.parse_args()
+
+    items = load_dataset(args.data)
+    if not items:
+        raise SystemExit(f"no audio/transcript pairs found in {args.data}")
+    audio_sec = sum(len(audio) for _, audio, _ in items) / STT_SAMPLE_RATE
+    reference_chars = sum(len(normalize(ref)) for _, _, ref in items)
+
+    results = {}
+    for mode, quantize in (("fp32", False), ("int8", True)):
+        # One model in memory at a time
+        stt = ReazonSpeechSTT(
+            device="cpu", quantize=quantize, quantized_cache_dir=args.cache_dir
+        )
+        results[mode] = await evaluate(stt, items, args.repeat)
+        del stt
+        gc.collect()
+
+    if args.verbose:
+        for i, (name, _, reference) in enumerate(items):
+            print(f"[{name}] ref : {reference}")
+            for mode in results:
+                result = results[mode]
+                print(
+                    f"[{name}] {mode}: {result['hypotheses'][i]} "
+                    f"({result['latencies'][i]:.0f} ms)"
+                )
+
+    print(f"files={len(items)} audio={audio_sec:.1f}s ref_chars={reference_chars}")
+    print(f"{'mode':<5} {'CER':>7} {'total_ms':>9} {'median_ms':>10} {'RTF':>6}")
+    for mode, result in results.items():
+        total_ms = sum(result["latencies"])
+        print(
+            f"{mode:<5} {result['errors'] / max(1, reference_chars):>7.2%} "
+            f"{total_ms:>9.0f} {statistics.median(result['latencies']):>10.0f} "
+            f"{total_ms / 1000 / audio_sec:>6.3f}"
+        )
+    speedup = sum(results["fp32"]["latencies"]) / sum(results["int8"]["latencies"])
+    print(f"int8 speedup: {speedup:.2f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,30 +1,71 @@
 """WebSocket endpoint for real-time voice chat"""
 
+import asyncio
 import base64
 import json
 import os
 import threading
 import time
+from collections import deque
+from collections.abc import AsyncIterator, Coroutine, Mapping
+from contextlib import aclosing, suppress
+from dataclasses import dataclass
+from typing import Any
 
+import numpy as np
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 from openai import APIError, AuthenticationError, RateLimitError
 from sqlmodel import Session
 
+from voice_assistant.audio import (
+    DownlinkEncoder,
+    DownlinkUsage,
+    UnsupportedAudioFormatError,
+    UplinkDecoder,
+    decode_pcm,
+    opus_encoder_available,
+)
+from voice_assistant.audio.downlink import PCM_SAMPLE_RATES
+from voice_assistant.audio.uplink import OPUS_SAMPLE_RATES
+from voice_assistant.core.config import settings
+from voice_assistant.core.executor import InferenceExecutor, set_torch_threads
 from voice_assistant.core.logging import get_logger
 from voice_assistant.db import (
     ConversationRepository,
     MessageRepository,
     get_engine,
+    get_write_behind_queue,
+)
+from voice_assistant.db.models import generate_id
+from voice_assistant.llm import ConversationContext, DeltaCoalescer, OpenAICompatLLM
+from voice_assistant.stt import (
+    STT_SAMPLE_RATE,
+    BaseSTT,
+    ProcessPoolSTT,
+    ReazonSpeechSTT,
+    SpeechGate,
+    TranscriptCache,
+    WindowedSTTStream,
+    get_stt_device,
+)
+from voice_assistant.tts import (
+    AudioBank,
+    ChunkGaps,
+    LookaheadSynthesizer,
+    PhraseCache,
+    SentenceBuffer,
+    StyleBertVits2TTS,
+    TextFrontendCache,
+    TTSResult,
+    get_tts_device,
+    iter_pcm16_frames,
 )
-from voice_assistant.llm import ConversationContext, OpenAICompatLLM
-from voice_assistant.stt import ReazonSpeechSTT, get_stt_device
-from voice_assistant.tts import SentenceBuffer, StyleBertVits2TTS, get_tts_device
 
 router = APIRouter()
 logger = get_logger(__name__)
 
 # Global STT service instance (lazy loaded, thread-safe)
-_stt_service: ReazonSpeechSTT | None = None
+_stt_service: BaseSTT | None = None
 _stt_service_lock = threading.Lock()
 
 # Global LLM service instance (lazy loaded, thread-safe)
@@ -35,20 +76,104 @@ _llm_service_lock = threading.Lock()
 _tts_service: StyleBertVits2TTS | None = None
 _tts_service_lock = threading.Lock()
 
+# Gaps between tts.chunk frames, accumulated over all turns
+_tts_chunk_gaps = ChunkGaps()
+
+# tts.chunk bytes sent vs native-rate PCM16, accumulated over all utterances
+_tts_downlink_usage = DownlinkUsage()
+
+# Global audio bank (empty until built at startup, thread-safe)
+_audio_bank: AudioBank | None = None
+_audio_bank_lock = threading.Lock()
+
+
+def create_stt_engine() -> ReazonSpeechSTT:
+    """Build the in-process STT engine from settings.
+
+    Module-level so that STT worker processes can build it too.
+    """
+    device = get_stt_device()
+    logger.info("initializing_stt_service", device=device)
+    speech_gate = (
+        SpeechGate(
+            threshold_db=settings.stt_gate_threshold_db,
+            min_speech_ms=settings.stt_gate_min_speech_ms,
+            pad_ms=settings.stt_gate_pad_ms,
+        )
+        if settings.stt_speech_gate
+        else None
+    )
+    return ReazonSpeechSTT(
+        device=device,
+        max_batch_size=settings.stt_max_batch_size,
+        batch_wait_ms=settings.stt_batch_wait_ms,
+        speech_gate=speech_gate,
+        segment_sec=settings.stt_segment_sec if settings.stt_long_form else None,
+        segment_overlap_sec=settings.stt_segment_overlap_sec,
+        executor=InferenceExecutor(
+            "stt",
+            max_workers=settings.stt_workers,
+            cpu_affinity=settings.stt_cpu_affinity,
+        ),
+        quantize=settings.stt_quantize,
+        quantized_cache_dir=settings.stt_quantized_cache_dir,
+        cache=(
+            TranscriptCache(
+                max_bytes=int(settings.stt_cache_max_mb * 1024 * 1024),
+                disk_dir=settings.stt_cache_dir,
+            )
+            if settings.stt_cache
+            else None
+        ),
+    )
+
+
+def create_stt_worker_engine() -> ReazonSpeechSTT:
+    """Build the STT engine in a worker process.
+
+    Worker processes start with torch's defaults, so the process-wide
+    thread limit is applied here once before the engine is built.
+    """
+    set_torch_threads(settings.torch_threads)
+    return create_stt_engine()
 
-def get_stt_service() -> ReazonSpeechSTT:
+
+def get_stt_service() -> BaseSTT:
     """Get or create the global STT service instance (thread-safe)."""
     global _stt_service
     if _stt_service is None:
         with _stt_service_lock:
             # Double-check locking pattern
             if _stt_service is None:
-                device = get_stt_device()
-                logger.info("initializing_stt_service", device=device)
-                _stt_service = ReazonSpeechSTT(device=device)
+                if settings.stt_worker_processes > 0:
+                    logger.info(
+                        "initializing_stt_worker_pool",
+                        workers=settings.stt_worker_processes,
+                    )
+                    _stt_service = ProcessPoolSTT(
+                        create_stt_worker_engine,
+                        workers=settings.stt_worker_processes,
+                        request_timeout_sec=settings.stt_worker_timeout_sec,
+                    )
+                else:
+                    _stt_service = create_stt_engine()
     return _stt_service
 
 
+def peek_stt_service() -> BaseSTT | None:
+    """Get the global STT service if it was created, without creating it."""
+    return _stt_service
+
+
+def close_stt_service() -> None:
+    """Close the global STT service if it was created (e.g. stop workers)."""
+    global _stt_service
+    with _stt_service_lock:
+        if _stt_service is not None:
+            _stt_service.close()
+            _stt_service = None
+
+
 def get_llm_service() -> OpenAICompatLLM:
     """Get or create the global LLM service instance (thread-safe)."""
     global _llm_service
@@ -72,91 +197,740 @@ def get_tts_service() -> StyleBertVits2TTS:
             if _tts_service is None:
                 device = get_tts_device()
                 logger.info("initializing_tts_service", device=device)
-                _tts_service = StyleBertVits2TTS(device=device)
+                _tts_service = StyleBertVits2TTS(
+                    device=device,
+                    clause_min_chars=settings.tts_clause_min_chars,
+                    executor=InferenceExecutor(
+                        "tts",
+                        max_workers=settings.tts_workers,
+                        cpu_affinity=settings.tts_cpu_affinity,
+                    ),
+                    max_batch_size=settings.tts_max_batch_size,
+                    batch_wait_ms=settings.tts_batch_wait_ms,
+                    batch_max_length_ratio=settings.tts_batch_max_length_ratio,
+                    speaker_id=settings.tts_speaker_id,
+                    style=settings.tts_style,
+                    cache=(
+                        PhraseCache(
+                            max_bytes=int(settings.tts_cache_max_mb * 1024 * 1024),
+                            disk_dir=settings.tts_cache_dir,
+                            max_chars=settings.tts_cache_max_chars,
+                        )
+                        if settings.tts_cache
+                        else None
+                    ),
+                    frontend_cache=(
+                        TextFrontendCache(
+                            max_bytes=int(
+                                settings.tts_frontend_cache_max_mb * 1024 * 1024
+                            )
+                        )
+                        if settings.tts_frontend_cache
+                        else None
+                    ),
+                )
     return _tts_service
 
 
+def peek_tts_service() -> StyleBertVits2TTS | None:
+    """Get the global TTS service if it was created, without creating it."""
+    return _tts_service
+
+
+def get_audio_bank() -> AudioBank:
+    """Get or create the global audio bank instance (thread-safe)."""
+    global _audio_bank
+    if _audio_bank is None:
+        with _audio_bank_lock:
+            # Double-check locking pattern
+            if _audio_bank is None:
+                _audio_bank = AudioBank(
+                    settings.tts_audio_bank_phrases,
+                    disk_dir=settings.tts_audio_bank_dir,
+                )
+    return _audio_bank
+
+
+def peek_audio_bank() -> AudioBank | None:
+    """Get the global audio bank if it was created, without creating it."""
+    return _audio_bank
+
+
+def get_tts_pipeline_stats() -> dict[str, Any]:
+    """Get TTS lookahead, tts.chunk gap and downlink byte statistics."""
+    return {
+        "lookahead": settings.tts_lookahead,
+        "gaps": _tts_chunk_gaps.stats(),
+        "downlink": _tts_downlink_usage.stats(),
+    }
+
+
+@dataclass
+class ConnectionOptions:
+    """Protocol options negotiated by the client at connect time.
+
+    Read from the WebSocket URL query string, e.g.
+    ``/api/v1/ws/chat?tts_transport=binary&tts_format=opus``.
+    """
+
+    # Send tts.chunk audio as binary frames instead of base64 inside JSON
+    binary_tts: bool = False
+    # tts.chunk audio codec: "pcm16" or "opus" (length-prefixed packets,
+    # about tts_frame_ms of audio per chunk)
+    tts_format: str = "pcm16"
+    # tts.chunk sample rate (None keeps the TTS engine's rate for PCM16)
+    tts_sample_rate: int | None = None
+
+    @classmethod
+    def from_query_params(cls, params: Mapping[str, str]) -> "ConnectionOptions":
+        """Build options from connection query parameters.
+
+        Unknown values fall back to the defaults (JSON/base64 transport,
+        PCM16 at the engine's rate). Opus falls back to PCM16 when its
+        encoder is not installed; the chunk header tells the client.
+
+        Args:
+            params: The WebSocket URL query parameters.
+
+        Returns:
+            The negotiated connection options.
+        """
+        tts_transport = params.get("tts_transport", "json")
+        if tts_transport not in ("json", "binary"):
+            logger.warning("unknown_tts_transport", tts_transport=tts_transport)
+
+        tts_format = params.get("tts_format", "pcm16")
+        if tts_format == "opus" and not opus_encoder_available():
+            logger.error("opus_encoder_unavailable")
+            tts_format = "pcm16"
+        elif tts_format not in ("pcm16", "opus"):
+            logger.warning("unknown_tts_format", tts_format=tts_format)
+            tts_format = "pcm16"
+
+        tts_sample_rate = None
+        rate_param = params.get("tts_sample_rate")
+        if rate_param is not None:
+            supported = OPUS_SAMPLE_RATES if tts_format == "opus" else PCM_SAMPLE_RATES
+            try:
+                tts_sample_rate = int(rate_param)
+            except ValueError:
+                pass
+            if tts_sample_rate not in supported:
+                logger.warning(
+                    "unsupported_tts_sample_rate",
+                    tts_sample_rate=rate_param,
+                    tts_format=tts_format,
+                )
+                tts_sample_rate = None
+
+        return cls(
+            binary_tts=tts_transport == "binary",
+            tts_format=tts_format,
+            tts_sample_rate=tts_sample_rate,
+        )
+
+    def downlink_encoder(self) -> DownlinkEncoder:
+        """Create an encoder for one utterance in the negotiated format."""
+        return DownlinkEncoder(
+            self.tts_format,
+            self.tts_sample_rate,
+            settings.tts_opus_bitrate,
+            chunk_ms=settings.tts_frame_ms,
+        )
+
+
+def encode_binary_frame(header: dict[str, Any], payload: bytes) -> bytes:
+    """Encode a binary WebSocket frame.
+
+    Same layout as inbound ``vad.audio`` frames: 4-byte little-endian header
+    length, then the JSON header, then the raw payload.
+
+    Args:
+        header: JSON-serializable frame header (must include "type").
+        payload: Raw payload bytes (e.g. PCM16 audio).
+
+    Returns:
+        The encoded frame.
+    """
+    header_bytes = json.dumps(header, ensure_ascii=False).encode("utf-8")
+    return b"".join(
+        (len(header_bytes).to_bytes(4, byteorder="little"), header_bytes, payload)
+    )
+
+
+async def send_tts_chunk(
+    websocket: WebSocket,
+    audio: bytes,
+    sample_rate: int,
+    options: ConnectionOptions | None,
+    audio_format: str = "pcm16",
+) -> int:
+    """Send one encoded audio frame as a tts.chunk event.
+
+    Args:
+        websocket: The WebSocket connection.
+        audio: PCM16 audio or packed Opus packets.
+        sample_rate: Sample rate of the audio.
+        options: Negotiated connection options (defaults to JSON/base64).
+        audio_format: Codec of ``audio``, recorded in the header.
+
+    Returns:
+        Bytes sent, including the header (and base64 for JSON).
+    """
+    header: dict[str, Any] = {
+        "type": "tts.chunk",
+        "sampleRate": sample_rate,
+        "format": audio_format,
+    }
+
+    if options is not None and options.binary_tts:
+        # Raw audio in a binary frame: no base64 inflation or encode cost
+        frame = encode_binary_frame(header, audio)
+        await websocket.send_bytes(frame)
+        return len(frame)
+
+    # Base64 encode the audio data for JSON transmission (fallback); the
+    # text is serialized here (as send_json would) so its size is known
+    header["audio"] = base64.b64encode(audio).decode("utf-8")
+    text = json.dumps(header, separators=(",", ":"), ensure_ascii=False)
+    await websocket.send_text(text)
+    return len(text.encode("utf-8"))
+
+
+async def send_tts_audio(
+    websocket: WebSocket,
+    encoder: DownlinkEncoder,
+    frame: TTSResult | None,
+    options: ConnectionOptions | None,
+) -> int:
+    """Encode a PCM16 frame in the negotiated format and send it.
+
+    Args:
+        websocket: The WebSocket connection.
+        encoder: The utterance's encoder.
+        frame: Audio from the TTS engine (None flushes the encoder at the
+            end of the utterance).
+        options: Negotiated connection options (defaults to JSON/base64).
+
+    Returns:
+        The number of tts.chunk events sent.
+    """
+    if frame is None:
+        payloads, sample_rate = encoder.flush(), encoder.sample_rate or 0
+    else:
+        payloads, sample_rate = encoder.encode(frame.audio, frame.sample_rate)
+    for payload in payloads:
+        encoder.usage.bytes_out += await send_tts_chunk(
+            websocket, payload, sample_rate, options, encoder.format
+        )
+    return len(payloads)
+
+
+async def play_bank_audio(
+    websocket: WebSocket,
+    name: str,
+    client_info: str,
+    options: ConnectionOptions | None = None,
+) -> bool:
+    """Stream a pre-rendered utterance from the audio bank as tts.chunk.
+
+    Args:
+        websocket: The WebSocket connection.
+        name: Utterance name (e.g. a lowercased error code).
+        client_info: Client identification string for logging.
+        options: Negotiated connection options for the TTS audio transport.
+
+    Returns:
+        True if the utterance was in the bank and sent.
+    """
+    clip = get_audio_bank().get(name)
+    if clip is None:
+        return False
+    encoder = (options or ConnectionOptions()).downlink_encoder()
+    for audio in iter_pcm16_frames(clip.audio, clip.sample_rate, settings.tts_frame_ms):
+        await send_tts_audio(
+            websocket,
+            encoder,
+            TTSResult(audio=audio, sample_rate=clip.sample_rate, latency_ms=0.0),
+            options,
+        )
+    await send_tts_audio(websocket, encoder, None, options)
+    _tts_downlink_usage.add(encoder.usage)
+    logger.info(
+        "audio_bank_played",
+        client=client_info,
+        name=name,
+        audio_bytes=len(clip.audio),
+        bytes_sent=encoder.usage.bytes_out,
+    )
+    return True
+
+
 async def handle_tts_streaming(
     websocket: WebSocket,
     sentence: str,
     client_info: str,
     e2e_start_time: float | None = None,
     is_first_chunk: bool = False,
+    options: ConnectionOptions | None = None,
+    frames: AsyncIterator[TTSResult] | None = None,
+    gaps: ChunkGaps | None = None,
 ) -> float:
     """Process a sentence with TTS and send audio chunks.
 
+    Audio is forwarded frame by frame as the TTS engine produces it, so long
+    sentences start playing before they are fully synthesized.
+
     Args:
         websocket: The WebSocket connection.
         sentence: The sentence to synthesize.
         client_info: Client identification string for logging.
         e2e_start_time: Start time for E2E latency measurement (from vad.end).
         is_first_chunk: Whether this is the first TTS chunk (for E2E latency logging).
+        options: Negotiated connection options (defaults to JSON/base64).
+        frames: Frames already being synthesized for the sentence
+            (default: synthesize it now).
+        gaps: Tracker the time between sent chunks is recorded in.
 
     Returns:
         The TTS processing latency in milliseconds.
     """
-    tts_service = get_tts_service()
-    result = await tts_service.synthesize(sentence)
-
-    if result.audio:
-        # Base64 encode the audio data for WebSocket transmission
-        audio_base64 = base64.b64encode(result.audio).decode("utf-8")
-
-        await websocket.send_json(
-            {
-                "type": "tts.chunk",
-                "audio": audio_base64,
-                "sampleRate": result.sample_rate,
-                "format": "pcm16",
-            }
+    if frames is None:
+        frames = get_tts_service().synthesize_stream(
+            sentence, frame_ms=settings.tts_frame_ms
         )
+    start_time = time.perf_counter()
+    frame_count = 0
+    audio_bytes = 0
+    first_frame_ms = 0.0
+    sample_rate = 0
+    encoder = (options or ConnectionOptions()).downlink_encoder()
+
+    async with aclosing(frames) as sentence_frames:
+        async for frame in sentence_frames:
+            if not frame.audio:
+                continue
+
+            await send_tts_audio(websocket, encoder, frame, options)
+            if gaps is not None:
+                gaps.record(sentence_start=frame_count == 0)
+
+            if frame_count == 0:
+                first_frame_ms = (time.perf_counter() - start_time) * 1000
+                # Log E2E latency for first TTS chunk (vad.end → first tts.chunk)
+                if is_first_chunk and e2e_start_time is not None:
+                    e2e_latency_ms = (time.perf_counter() - e2e_start_time) * 1000
+                    logger.info(
+                        "e2e_first_chunk_latency",
+                        client=client_info,
+                        e2e_ms=round(e2e_latency_ms, 2),
+                    )
 
-        # Log E2E latency for first TTS chunk (vad.end → first tts.chunk)
-        if is_first_chunk and e2e_start_time is not None:
-            e2e_latency_ms = (time.perf_counter() - e2e_start_time) * 1000
-            logger.info(
-                "e2e_first_chunk_latency",
-                client=client_info,
-                e2e_ms=round(e2e_latency_ms, 2),
-            )
+            frame_count += 1
+            audio_bytes += len(frame.audio)
+            sample_rate = frame.sample_rate
+
+    await send_tts_audio(websocket, encoder, None, options)
+    _tts_downlink_usage.add(encoder.usage)
+    latency_ms = (time.perf_counter() - start_time) * 1000
 
+    if frame_count:
+        usage = encoder.usage.stats()
         logger.info(
             "tts_chunk_sent",
             client=client_info,
             text_length=len(sentence),
-            audio_bytes=len(result.audio),
-            sample_rate=result.sample_rate,
-            latency_ms=round(result.latency_ms, 2),
+            audio_bytes=audio_bytes,
+            frames=frame_count,
+            sample_rate=sample_rate,
+            format=encoder.format,
+            output_sample_rate=encoder.sample_rate or sample_rate,
+            bytes_sent=usage["bytes_out"],
+            saved_bytes_per_sec=usage["saved_bytes_per_sec"],
+            first_frame_ms=round(first_frame_ms, 2),
+            latency_ms=round(latency_ms, 2),
         )
 
-    return result.latency_ms
+    return latency_ms
+
+
+async def run_tts_worker(
+    websocket: WebSocket,
+    sentence_queue: asyncio.Queue[str | None],
+    client_info: str,
+    e2e_start_time: float | None = None,
+    options: ConnectionOptions | None = None,
+) -> float:
+    """Synthesize queued sentences in order and stream them to the client.
+
+    Consumer side of the LLM → TTS pipeline. Runs until a ``None`` sentinel
+    is received, so the LLM reader never waits on synthesis. Up to
+    ``settings.tts_lookahead`` sentences are synthesized ahead of the one
+    being sent; audio still leaves in sentence order.
+
+    Args:
+        websocket: The WebSocket connection.
+        sentence_queue: Queue of completed sentences (``None`` ends the turn).
+        client_info: Client identification string for logging.
+        e2e_start_time: Start time for E2E latency measurement (from vad.end).
+        options: Negotiated connection options for the TTS audio transport.
+
+    Returns:
+        The total TTS processing latency in milliseconds.
+    """
+    tts_total_latency = 0.0
+    is_first_tts_chunk = True  # Track first TTS chunk for E2E latency
+    tts_error_spoken = False
+    gaps = ChunkGaps()
+    lookahead = LookaheadSynthesizer(
+        lambda text: get_tts_service().synthesize_stream(
+            text, frame_ms=settings.tts_frame_ms
+        ),
+        lookahead=settings.tts_lookahead,
+    )
+
+    async def feed_sentences() -> None:
+        # Start synthesis as sentences arrive, not when the previous one is sent
+        while (sentence := await sentence_queue.get()) is not None:
+            await lookahead.submit(sentence)
+        lookahead.end()
+
+    feeder = asyncio.create_task(feed_sentences())
+    try:
+        async with aclosing(lookahead.sentences()) as sentences:
+            async for sentence, frames in sentences:
+                try:
+                    tts_latency = await handle_tts_streaming(
+                        websocket,
+                        sentence,
+                        client_info,
+                        e2e_start_time=e2e_start_time,
+                        is_first_chunk=is_first_tts_chunk,
+                        options=options,
+                        frames=frames,
+                        gaps=gaps,
+                    )
+                    is_first_tts_chunk = False  # Only first chunk gets E2E timing
+                    tts_total_latency += tts_latency
+                except Exception as e:
+                    logger.error(
+                        "tts_streaming_error",
+                        client=client_info,
+                        sentence=sentence[:50],
+                        error=str(e),
+                    )
+                    await websocket.send_json(
+                        {
+                            "type": "error",
+                            "code": "TTS_ERROR",
+                            "message": "音声合成に失敗しました",
+                        }
+                    )
+                    # Pre-rendered, so it plays even when synthesis is broken
+                    if not tts_error_spoken:
+                        tts_error_spoken = await play_bank_audio(
+                            websocket, "tts_error", client_info, options
+                        )
+    finally:
+        feeder.cancel()
+        lookahead.cancel()
+        _tts_chunk_gaps.add(gaps)
+
+    if gaps.chunks:
+        logger.info(
+            "tts_chunk_gaps",
+            client=client_info,
+            lookahead=lookahead.lookahead,
+            **gaps.stats(),
+        )
+    return tts_total_latency
+
+
+async def enqueue_sentence(
+    sentence_queue: asyncio.Queue[str | None],
+    sentence: str | None,
+    tts_task: asyncio.Task[float],
+) -> None:
+    """Put a sentence on the TTS queue without deadlocking on a dead worker.
+
+    Args:
+        sentence_queue: Queue consumed by ``run_tts_worker``.
+        sentence: The sentence to synthesize (``None`` ends the turn).
+        tts_task: The TTS worker task draining the queue.
+
+    Raises:
+        Exception: Re-raises the worker's error if it stopped unexpectedly.
+    """
+    if not sentence_queue.full():
+        sentence_queue.put_nowait(sentence)
+        return
+
+    # Queue is full: wait for room, but stop if the worker dies meanwhile
+    put_task = asyncio.ensure_future(sentence_queue.put(sentence))
+    await asyncio.wait({put_task, tts_task}, return_when=asyncio.FIRST_COMPLETED)
+    if not put_task.done():
+        put_task.cancel()
+        tts_task.result()
 
 
 class AudioBuffer:
-    """Buffer for accumulating audio chunks from VAD."""
+    """Buffer for accumulating float32 audio chunks from VAD.
 
-    def __init__(self) -> None:
-        self.chunks: list[bytes] = []
-        self.sample_rate: int = 16000
+    Samples are copied once into a preallocated float32 array that grows
+    geometrically up to ``max_duration_sec``. Audio past the limit is
+    dropped and recorded in ``dropped_samples``; with the ``"error"`` policy
+    the utterance is rejected at ``vad.end``.
+
+    When streaming STT is enabled the buffer also owns the utterance's
+    ``stt_stream``, which is fed every chunk as it arrives. ``uplink`` holds
+    the connection's codec and resampler state and stays with the
+    connection's buffer when the audio is detached.
+    """
+
+    # Preallocated capacity (seconds)
+    INITIAL_DURATION_SEC = 5.0
+
+    def __init__(
+        self,
+        max_duration_sec: float | None = None,
+        overflow_policy: str | None = None,
+    ) -> None:
+        """Initialize the buffer.
 
-    def add_chunk(self, data: bytes, sample_rate: int = 16000) -> None:
-        self.chunks.append(data)
-        self.sample_rate = sample_rate
+        Args:
+            max_duration_sec: Max audio kept per utterance
+                (defaults to settings.audio_buffer_max_sec).
+            overflow_policy: "truncate" or "error"
+                (defaults to settings.audio_buffer_overflow).
+        """
+        self.max_duration_sec = (
+            settings.audio_buffer_max_sec
+            if max_duration_sec is None
+            else max_duration_sec
+        )
+        self.overflow_policy = overflow_policy or settings.audio_buffer_overflow
+        self.sample_rate: int = STT_SAMPLE_RATE
+        self.chunk_count = 0
+        self.dropped_samples = 0
+        self.stt_stream: WindowedSTTStream | None = None
+        self.uplink = UplinkDecoder()
+        self._data: np.ndarray | None = None
+        self._length = 0
+
+    @property
+    def overflowed(self) -> bool:
+        """Whether audio was dropped because the buffer was full."""
+        return self.dropped_samples > 0
+
+    @property
+    def duration_sec(self) -> float:
+        """Duration of the buffered audio in seconds."""
+        return self._length / self.sample_rate
+
+    def add_chunk(
+        self, data: bytes | memoryview | np.ndarray, sample_rate: int = STT_SAMPLE_RATE
+    ) -> int:
+        """Append a chunk of float32 samples.
+
+        All chunks of an utterance must share one sample rate (uplink audio
+        is resampled before it gets here); a chunk at a different rate than
+        the buffered audio is dropped rather than mislabelled.
+
+        Args:
+            data: Float32 samples, or raw float32 audio (bytes or a
+                memoryview of a frame).
+            sample_rate: Sample rate of the audio in Hz.
 
-    def get_audio(self) -> bytes:
-        return b"".join(self.chunks)
+        Returns:
+            Number of samples stored (fewer than sent on overflow).
+        """
+        if self._length == 0:
+            self.sample_rate = sample_rate
+        elif sample_rate != self.sample_rate:
+            logger.warning(
+                "audio_sample_rate_mismatch",
+                buffered=self.sample_rate,
+                received=sample_rate,
+            )
+            return 0
+        self.chunk_count += 1
+        if isinstance(data, np.ndarray):
+            samples = data.astype(np.float32, copy=False)
+        else:
+            samples = decode_pcm(data, "f32")
+
+        max_samples = int(self.max_duration_sec * sample_rate)
+        accepted = min(len(samples), max(0, max_samples - self._length))
+        if accepted < len(samples):
+            if not self.overflowed:
+                logger.warning(
+                    "audio_buffer_overflow",
+                    max_duration_sec=self.max_duration_sec,
+                    policy=self.overflow_policy,
+                )
+            self.dropped_samples += len(samples) - accepted
+        if accepted == 0:
+            return 0
+
+        buffer = self._reserve(self._length + accepted, max_samples)
+        buffer[self._length : self._length + accepted] = samples[:accepted]
+        self._length += accepted
+
+        if self.stt_stream is not None:
+            self.stt_stream.feed(memoryview(samples[:accepted]).cast("B"), sample_rate)
+        return accepted
+
+    def get_array(self) -> np.ndarray:
+        """Get the buffered samples as a float32 view (no copy)."""
+        if self._data is None:
+            return np.empty(0, dtype=np.float32)
+        return self._data[: self._length]
+
+    def get_audio(self) -> memoryview:
+        """Get the buffered audio as raw float32 bytes (no copy)."""
+        return memoryview(self.get_array()).cast("B")
+
+    def detach(self) -> "AudioBuffer":
+        """Move the buffered audio into a new buffer and clear this one.
+
+        Lets a background turn own its utterance while the connection keeps
+        receiving audio for the next one. The sample array is handed over,
+        not copied.
+        """
+        detached = AudioBuffer(self.max_duration_sec, self.overflow_policy)
+        detached._data = self._data
+        detached._length = self._length
+        detached.sample_rate = self.sample_rate
+        detached.chunk_count = self.chunk_count
+        detached.dropped_samples = self.dropped_samples
+        detached.stt_stream = self.stt_stream
+        self._data = None
+        self._reset()
+        self.stt_stream = None
+        return detached
 
     def clear(self) -> None:
-        self.chunks = []
+        """Drop the buffered audio (the allocation is kept for reuse)."""
+        self._reset()
+        if self.stt_stream is not None:
+            self.stt_stream.close()
+            self.stt_stream = None
 
     def has_audio(self) -> bool:
-        return len(self.chunks) > 0
+        return self._length > 0
+
+    def _reset(self) -> None:
+        self._length = 0
+        self.chunk_count = 0
+        self.dropped_samples = 0
+
+    def _reserve(self, needed: int, max_samples: int) -> np.ndarray:
+        """Grow the array geometrically to hold ``needed`` samples."""
+        if self._data is not None and needed <= len(self._data):
+            return self._data
+
+        capacity = 0 if self._data is None else len(self._data)
+
+        new_capacity = max(
+            capacity * 2, int(self.INITIAL_DURATION_SEC * self.sample_rate)
+        )
+        new_capacity = min(max(new_capacity, needed), max_samples)
+        data = np.empty(new_capacity, dtype=np.float32)
+        if self._data is not None:
+            data[: self._length] = self._data[: self._length]
+        self._data = data
+        return data
+
+
+@dataclass
+class TurnState:
+    """Progress of a single conversation turn.
+
+    Filled in as the turn runs so a cancelled turn can report what it
+    already persisted.
+    """
+
+    user_message_id: str | None = None
+    assistant_message_id: str | None = None
+    assistant_text: str = ""
+
+
+class TurnRunner:
+    """Runs conversation turns as background tasks owned by a connection.
+
+    Keeps the WebSocket receive loop free while STT, LLM and TTS run.
+    Turns are executed one at a time, in the order they were started,
+    and can be cancelled as a whole (barge-in).
+    """
+
+    def __init__(self, client_info: str) -> None:
+        self.client_info = client_info
+        self._pending: deque[tuple[Coroutine[Any, Any, None], TurnState]] = deque()
+        self._task: asyncio.Task[None] | None = None
+        self._current: TurnState | None = None
+
+    @property
+    def is_running(self) -> bool:
+        """Check if a turn is currently running or queued."""
+        return self._task is not None and not self._task.done()
+
+    def start(
+        self, turn: Coroutine[Any, Any, None], state: TurnState | None = None
+    ) -> None:
+        """Schedule a turn to run after any turn already in progress.
+
+        Args:
+            turn: The turn coroutine (e.g. ``handle_vad_end(...)``).
+            state: The state object the turn coroutine fills in.
+        """
+        self._pending.append((turn, state or TurnState()))
+        if not self.is_running:
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        """Run queued turns until none are left."""
+        while self._pending:
+            turn, state = self._pending.popleft()
+            self._current = state
+            try:
+                await turn
+            except Exception as e:
+                logger.error("turn_error", client=self.client_info, error=str(e))
+            finally:
+                self._current = None
+
+    async def cancel(self) -> TurnState | None:
+        """Cancel the running turn and drop queued ones.
+
+        Cancellation is cooperative: the turn's LLM stream is closed and its
+        TTS worker stops before this returns.
+
+        Returns:
+            The state of the interrupted turn, or None if no turn was running.
+        """
+        for turn, _ in self._pending:
+            turn.close()
+        self._pending.clear()
+
+        current = self._current
+        task = self._task
+        self._task = None
+        if task is not None and not task.done():
+            task.cancel()
+            await asyncio.wait({task})
+        return current
+
+    async def close(self) -> None:
+        """Cancel any turn still running when the connection closes."""
+        await self.cancel()
 
 
 class ConversationSession:
     """Manages conversation persistence for a WebSocket session.
 
     Handles creating conversations and saving messages to the database.
+    Writes go through the write-behind queue, so they never block the
+    event loop; IDs are assigned up front and returned immediately.
     """
 
     def __init__(self) -> None:
@@ -177,22 +951,21 @@ class ConversationSession:
             The conversation ID.
         """
         if self.conversation_id is None:
-            with self._get_session() as session:
-                repo = ConversationRepository(session)
-                conv = repo.create()
-                self.conversation_id = conv.id
-                logger.info("conversation_created", conversation_id=conv.id)
+            conversation_id = generate_id()
+            get_write_behind_queue().create_conversation(conversation_id)
+            self.conversation_id = conversation_id
+            logger.info("conversation_created", conversation_id=conversation_id)
         return self.conversation_id
 
     def save_user_message(self, text: str, stt_latency_ms: int) -> str | None:
-        """Save a user message to the database.
+        """Queue a user message for saving to the database.
 
         Args:
             text: The transcribed text.
             stt_latency_ms: STT latency in milliseconds.
 
         Returns:
-            The message ID if saved, None on error.
+            The message ID if queued, None on error.
         """
         if not text.strip():
             return None
@@ -200,21 +973,21 @@ class ConversationSession:
         conv_id = self.ensure_conversation()
 
         try:
-            with self._get_session() as session:
-                repo = MessageRepository(session)
-                msg = repo.create(
-                    conversation_id=conv_id,
-                    role="user",
-                    content=text,
-                    stt_latency_ms=int(stt_latency_ms),
-                )
-                self._last_user_message_id = msg.id
-                logger.debug(
-                    "user_message_saved",
-                    message_id=msg.id,
-                    conversation_id=conv_id,
-                )
-                return msg.id
+            message_id = generate_id()
+            get_write_behind_queue().create_message(
+                message_id,
+                conversation_id=conv_id,
+                role="user",
+                content=text,
+                stt_latency_ms=int(stt_latency_ms),
+            )
+            self._last_user_message_id = message_id
+            logger.debug(
+                "user_message_saved",
+                message_id=message_id,
+                conversation_id=conv_id,
+            )
+            return message_id
         except Exception as e:
             logger.error("save_user_message_error", error=str(e))
             return None
@@ -225,7 +998,7 @@ class ConversationSession:
         llm_latency_ms: float,
         tts_latency_ms: float | None = None,
     ) -> str | None:
-        """Save an assistant message to the database.
+        """Queue an assistant message for saving to the database.
 
         Args:
             text: The LLM response text.
@@ -233,7 +1006,7 @@ class ConversationSession:
             tts_latency_ms: TTS latency in milliseconds (optional).
 
         Returns:
-            The message ID if saved, None on error.
+            The message ID if queued, None on error.
         """
         if not text.strip():
             return None
@@ -241,27 +1014,27 @@ class ConversationSession:
         conv_id = self.ensure_conversation()
 
         try:
-            with self._get_session() as session:
-                repo = MessageRepository(session)
-                msg = repo.create(
-                    conversation_id=conv_id,
-                    role="assistant",
-                    content=text,
-                    llm_latency_ms=int(llm_latency_ms),
-                    tts_latency_ms=int(tts_latency_ms) if tts_latency_ms else None,
-                )
-                logger.debug(
-                    "assistant_message_saved",
-                    message_id=msg.id,
-                    conversation_id=conv_id,
-                )
-                return msg.id
+            message_id = generate_id()
+            get_write_behind_queue().create_message(
+                message_id,
+                conversation_id=conv_id,
+                role="assistant",
+                content=text,
+                llm_latency_ms=int(llm_latency_ms),
+                tts_latency_ms=int(tts_latency_ms) if tts_latency_ms else None,
+            )
+            logger.debug(
+                "assistant_message_saved",
+                message_id=message_id,
+                conversation_id=conv_id,
+            )
+            return message_id
         except Exception as e:
             logger.error("save_assistant_message_error", error=str(e))
             return None
 
     def update_conversation_title(self, title: str) -> None:
-        """Update the conversation title (e.g., from first user message).
+        """Queue a conversation title update (e.g., from first user message).
 
         Args:
             title: The new title for the conversation.
@@ -270,16 +1043,16 @@ class ConversationSession:
             return
 
         try:
-            with self._get_session() as session:
-                repo = ConversationRepository(session)
-                # Use first 50 chars of the message as title
-                truncated_title = title[:50] + "..." if len(title) > 50 else title
-                repo.update(self.conversation_id, title=truncated_title)
-                logger.debug(
-                    "conversation_title_updated",
-                    conversation_id=self.conversation_id,
-                    title=truncated_title,
-                )
+            # Use first 50 chars of the message as title
+            truncated_title = title[:50] + "..." if len(title) > 50 else title
+            get_write_behind_queue().update_conversation_title(
+                self.conversation_id, truncated_title
+            )
+            logger.debug(
+                "conversation_title_updated",
+                conversation_id=self.conversation_id,
+                title=truncated_title,
+            )
         except Exception as e:
             logger.error("update_conversation_title_error", error=str(e))
 
@@ -295,6 +1068,9 @@ class ConversationSession:
         Returns:
             True if conversation was found and loaded, False otherwise.
         """
+        # Make sure queued writes are visible before reading history
+        get_write_behind_queue().flush()
+
         try:
             with self._get_session() as session:
                 conv_repo = ConversationRepository(session)
@@ -334,6 +1110,8 @@ class ConversationSession:
         Returns:
             The conversation ID if one exists, None otherwise.
         """
+        get_write_behind_queue().flush()
+
         try:
             with self._get_session() as session:
                 repo = ConversationRepository(session)
@@ -351,9 +1129,16 @@ async def handle_llm_completion(
     client_info: str,
     conversation_session: ConversationSession,
     e2e_start_time: float | None = None,
+    turn: TurnState | None = None,
+    options: ConnectionOptions | None = None,
 ) -> None:
     """Handle LLM completion after STT with streaming response and TTS.
 
+    Tokens are forwarded as they arrive while completed sentences are handed
+    to a TTS worker task, so synthesis overlaps with LLM streaming.
+    If the turn is cancelled, the LLM stream is closed, queued sentences are
+    dropped and the partial response is kept in context and persisted.
+
     Args:
         websocket: The WebSocket connection.
         text: The transcribed text from STT.
@@ -361,68 +1146,83 @@ async def handle_llm_completion(
         client_info: Client identification string for logging.
         conversation_session: Session for persisting messages to DB.
         e2e_start_time: Start time for E2E latency measurement (from vad.end).
+        turn: Turn state to record progress in (for cancellation reports).
+        options: Negotiated connection options for the TTS audio transport.
     """
     if not text.strip():
         logger.debug("llm_skip_empty_text", client=client_info)
         return
 
+    if turn is None:
+        turn = TurnState()
+
     # Add user message to context
     context.add_user_message(text)
 
+    tts_task: asyncio.Task[float] | None = None
+    sentence_queue: asyncio.Queue[str | None] | None = None
+    start_time = time.perf_counter()
+    # Set once the reply is in context, so a barge-in does not add it twice
+    assistant_recorded = False
+
+    async def send_delta(delta: str) -> None:
+        await websocket.send_json({"type": "llm.delta", "text": delta})
+
+    async def speak_error(code: str) -> None:
+        # Stop the partial reply's audio so the spoken error is not mixed in
+        if tts_task is not None and not tts_task.done():
+            tts_task.cancel()
+            await asyncio.wait([tts_task])
+        await play_bank_audio(websocket, code.lower(), client_info, options)
+
+    # Batch tokens into fewer llm.delta frames (first token is sent at once)
+    delta_coalescer = DeltaCoalescer(
+        send_delta,
+        flush_ms=settings.llm_delta_flush_ms,
+        flush_chars=settings.llm_delta_flush_chars,
+    )
     try:
         # Send llm.start event
         await websocket.send_json({"type": "llm.start"})
         logger.info("llm_start_sent", client=client_info)
 
         llm_service = get_llm_service()
-        start_time = time.perf_counter()
         ttft: float | None = None
         full_response = ""
 
-        # Sentence buffer for TTS streaming
+        # Sentence buffer feeding the TTS worker through a bounded queue
         sentence_buffer = SentenceBuffer()
-        tts_total_latency = 0.0
-        is_first_tts_chunk = True  # Track first TTS chunk for E2E latency
+        sentence_queue = asyncio.Queue(maxsize=settings.tts_queue_size)
+        tts_task = asyncio.create_task(
+            run_tts_worker(
+                websocket, sentence_queue, client_info, e2e_start_time, options
+            )
+        )
 
-        async for token in llm_service.stream_completion(context.get_messages()):
-            if ttft is None:
-                ttft = (time.perf_counter() - start_time) * 1000
+        # aclosing() closes the upstream LLM stream as soon as the turn ends
+        async with aclosing(
+            llm_service.stream_completion(context.get_messages())
+        ) as tokens:
+            async for token in tokens:
+                if ttft is None:
+                    ttft = (time.perf_counter() - start_time) * 1000
 
-            full_response += token
-            await websocket.send_json({"type": "llm.delta", "text": token})
+                full_response += token
+                turn.assistant_text = full_response
+                await delta_coalescer.add(token)
 
-            # Buffer tokens and process complete sentences for TTS
-            sentences = sentence_buffer.add(token)
-            for sentence in sentences:
-                try:
-                    tts_latency = await handle_tts_streaming(
-                        websocket,
-                        sentence,
-                        client_info,
-                        e2e_start_time=e2e_start_time,
-                        is_first_chunk=is_first_tts_chunk,
-                    )
-                    is_first_tts_chunk = False  # Only first chunk gets E2E timing
-                    tts_total_latency += tts_latency
-                except Exception as e:
-                    logger.error(
-                        "tts_streaming_error",
-                        client=client_info,
-                        sentence=sentence[:50],
-                        error=str(e),
-                    )
-                    await websocket.send_json(
-                        {
-                            "type": "error",
-                            "code": "TTS_ERROR",
-                            "message": "音声合成に失敗しました",
-                        }
-                    )
+                # Hand complete sentences to the TTS worker without waiting on it
+                for sentence in sentence_buffer.add(token):
+                    await enqueue_sentence(sentence_queue, sentence, tts_task)
+
+        # Send tokens still waiting in the coalescing window
+        await delta_coalescer.flush()
 
         latency_ms = (time.perf_counter() - start_time) * 1000
 
         # Add assistant response to context
         context.add_assistant_message(full_response)
+        assistant_recorded = True
 
         # Send llm.end event
         await websocket.send_json(
@@ -439,28 +1239,16 @@ async def handle_llm_completion(
             response_length=len(full_response),
             latency_ms=round(latency_ms, 2),
             ttft_ms=round(ttft or 0, 2),
+            token_count=delta_coalescer.token_count,
+            delta_frames=delta_coalescer.frame_count,
         )
 
-        # Flush remaining text in sentence buffer for TTS
+        # Flush remaining text in sentence buffer, then wait for TTS to drain
         remaining = sentence_buffer.flush()
         if remaining:
-            try:
-                tts_latency = await handle_tts_streaming(
-                    websocket,
-                    remaining,
-                    client_info,
-                    e2e_start_time=e2e_start_time,
-                    is_first_chunk=is_first_tts_chunk,
-                )
-                is_first_tts_chunk = False  # Mark as consumed
-                tts_total_latency += tts_latency
-            except Exception as e:
-                logger.error(
-                    "tts_flush_error",
-                    client=client_info,
-                    remaining=remaining[:50],
-                    error=str(e),
-                )
+            await enqueue_sentence(sentence_queue, remaining, tts_task)
+        await enqueue_sentence(sentence_queue, None, tts_task)
+        tts_total_latency = await tts_task
 
         # Send tts.end event with total TTS latency
         await websocket.send_json(
@@ -477,12 +1265,30 @@ async def handle_llm_completion(
         )
 
         # Save assistant message to database with latency info
-        conversation_session.save_assistant_message(
+        turn.assistant_message_id = conversation_session.save_assistant_message(
             text=full_response,
             llm_latency_ms=latency_ms,
             tts_latency_ms=tts_total_latency,
         )
 
+    except asyncio.CancelledError:
+        # Barge-in: keep what was already said so the next turn has context
+        dropped = sentence_queue.qsize() if sentence_queue is not None else 0
+        logger.info(
+            "llm_cancelled",
+            client=client_info,
+            response_length=len(turn.assistant_text),
+            dropped_sentences=dropped,
+        )
+        if turn.assistant_text.strip():
+            if not assistant_recorded:
+                context.add_assistant_message(turn.assistant_text)
+            turn.assistant_message_id = conversation_session.save_assistant_message(
+                text=turn.assistant_text,
+                llm_latency_ms=(time.perf_counter() - start_time) * 1000,
+            )
+        raise
+
     except RateLimitError:
         logger.warning("llm_rate_limit", client=client_info)
         await websocket.send_json(
@@ -492,6 +1298,7 @@ async def handle_llm_completion(
                 "message": "APIレート制限に達しました。しばらく待ってから再試行してください。",
             }
         )
+        await speak_error("LLM_RATE_LIMIT")
     except AuthenticationError:
         logger.error("llm_auth_error", client=client_info)
         await websocket.send_json(
@@ -501,6 +1308,7 @@ async def handle_llm_completion(
                 "message": "LLM APIの認証に失敗しました。APIキーを確認してください。",
             }
         )
+        await speak_error("LLM_AUTH_ERROR")
     except APIError as e:
         logger.error("llm_api_error", client=client_info, error=str(e))
         await websocket.send_json(
@@ -510,6 +1318,7 @@ async def handle_llm_completion(
                 "message": f"LLM APIエラー: {str(e)}",
             }
         )
+        await speak_error("LLM_API_ERROR")
     except Exception as e:
         logger.error("llm_unexpected_error", client=client_info, error=str(e))
         await websocket.send_json(
@@ -519,6 +1328,15 @@ async def handle_llm_completion(
                 "message": "LLM処理中にエラーが発生しました",
             }
         )
+        await speak_error("LLM_ERROR")
+    finally:
+        delta_coalescer.close()
+        # Stop the TTS worker if the LLM stream ended abnormally, and wait
+        # for it so no audio is sent once the turn is over
+        if tts_task is not None and not tts_task.done():
+            tts_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await tts_task
 
 
 async def handle_vad_end(
@@ -527,6 +1345,8 @@ async def handle_vad_end(
     context: ConversationContext,
     conversation_session: ConversationSession,
     client_info: str,
+    turn: TurnState | None = None,
+    options: ConnectionOptions | None = None,
 ) -> None:
     """Handle vad.end event by running STT and then LLM.
 
@@ -536,6 +1356,8 @@ async def handle_vad_end(
         context: The conversation context for maintaining history.
         conversation_session: Session for persisting messages to DB.
         client_info: Client identification string for logging.
+        turn: Turn state to record progress in (for cancellation reports).
+        options: Negotiated connection options for the TTS audio transport.
     """
     if not audio_buffer.has_audio():
         logger.debug("vad_end_no_audio", client=client_info)
@@ -554,11 +1376,40 @@ async def handle_vad_end(
         sample_rate=sample_rate,
     )
 
+    if audio_buffer.overflowed:
+        dropped_ms = round(audio_buffer.dropped_samples / sample_rate * 1000, 2)
+        if audio_buffer.overflow_policy == "error":
+            logger.warning(
+                "utterance_rejected_too_long",
+                client=client_info,
+                max_duration_sec=audio_buffer.max_duration_sec,
+                dropped_ms=dropped_ms,
+            )
+            await websocket.send_json(
+                {
+                    "type": "error",
+                    "code": "AUDIO_TOO_LONG",
+                    "message": "発話が長すぎます",
+                }
+            )
+            audio_buffer.clear()
+            return
+        logger.warning(
+            "utterance_truncated",
+            client=client_info,
+            max_duration_sec=audio_buffer.max_duration_sec,
+            dropped_ms=dropped_ms,
+        )
+
     try:
-        stt_service = get_stt_service()
-        result = await stt_service.transcribe(audio_data, sample_rate)
+        if audio_buffer.stt_stream is not None:
+            # Partials already covered most of the audio; decode the tail
+            result = await audio_buffer.stt_stream.finish()
+        else:
+            stt_service = get_stt_service()
+            result = await stt_service.transcribe(audio_data, sample_rate)
 
-        # Send stt.final event (stt.partial is not supported by ReazonSpeech)
+        # Send stt.final event
         await websocket.send_json(
             {
                 "type": "stt.final",
@@ -578,7 +1429,11 @@ async def handle_vad_end(
         if result.text.strip():
             # Save user message to database
             is_first_message = conversation_session.conversation_id is None
-            conversation_session.save_user_message(result.text, int(result.latency_ms))
+            user_message_id = conversation_session.save_user_message(
+                result.text, int(result.latency_ms)
+            )
+            if turn is not None:
+                turn.user_message_id = user_message_id
 
             # Set conversation title from first message
             if is_first_message:
@@ -591,6 +1446,8 @@ async def handle_vad_end(
                 client_info,
                 conversation_session,
                 e2e_start_time,
+                turn,
+                options,
             )
 
     except Exception as e:
@@ -612,6 +1469,71 @@ async def handle_vad_end(
         audio_buffer.clear()
 
 
+def start_stt_stream(websocket: WebSocket, client_info: str) -> WindowedSTTStream:
+    """Start a streaming STT session that sends stt.partial events.
+
+    Args:
+        websocket: The WebSocket connection.
+        client_info: Client identification string for logging.
+
+    Returns:
+        The stream to feed the utterance's audio into.
+    """
+
+    async def send_partial(text: str) -> None:
+        await websocket.send_json({"type": "stt.partial", "text": text})
+        logger.debug("stt_partial_sent", client=client_info, text_length=len(text))
+
+    return get_stt_service().create_stream(
+        on_partial=send_partial,
+        partial_interval_ms=settings.stt_partial_interval_ms,
+        window_sec=settings.stt_window_sec,
+        overlap_sec=settings.stt_overlap_sec,
+    )
+
+
+async def cancel_turn(
+    websocket: WebSocket,
+    turn_runner: TurnRunner,
+    conversation_session: ConversationSession,
+    client_info: str,
+    reason: str,
+) -> None:
+    """Cancel the running turn and report what it already persisted.
+
+    Args:
+        websocket: The WebSocket connection.
+        turn_runner: The connection's turn runner.
+        conversation_session: Session holding the conversation ID.
+        client_info: Client identification string for logging.
+        reason: Why the turn was cancelled ("cancel" or "barge_in").
+    """
+    if not turn_runner.is_running:
+        return
+
+    state = await turn_runner.cancel() or TurnState()
+
+    await websocket.send_json(
+        {
+            "type": "turn.cancelled",
+            "reason": reason,
+            "conversation_id": conversation_session.conversation_id,
+            "user_message_id": state.user_message_id,
+            "assistant_message_id": state.assistant_message_id,
+            "assistant_text": state.assistant_text,
+        }
+    )
+
+    logger.info(
+        "turn_cancelled",
+        client=client_info,
+        reason=reason,
+        user_message_id=state.user_message_id,
+        assistant_message_id=state.assistant_message_id,
+        response_length=len(state.assistant_text),
+    )
+
+
 async def handle_text_message(
     websocket: WebSocket,
     data: str,
@@ -619,8 +1541,14 @@ async def handle_text_message(
     context: ConversationContext,
     conversation_session: ConversationSession,
     client_info: str,
+    turn_runner: TurnRunner,
+    options: ConnectionOptions | None = None,
 ) -> None:
-    """Handle text (JSON) messages from client."""
+    """Handle text (JSON) messages from client.
+
+    ``vad.end`` starts a turn in the background via ``turn_runner`` so this
+    handler returns immediately and the receive loop keeps reading.
+    """
     try:
         event = json.loads(data)
         event_type = event.get("type", "unknown")
@@ -632,22 +1560,41 @@ async def handle_text_message(
                 timestamp=event.get("timestamp"),
             )
             audio_buffer.clear()
+            # User started speaking again: interrupt the running turn
+            await cancel_turn(
+                websocket, turn_runner, conversation_session, client_info, "barge_in"
+            )
+            if settings.stt_streaming:
+                audio_buffer.stt_stream = start_stt_stream(websocket, client_info)
 
         elif event_type == "vad.end":
             logger.info(
                 "vad_end_received",
                 client=client_info,
                 timestamp=event.get("timestamp"),
-                audio_chunks=len(audio_buffer.chunks),
+                audio_chunks=audio_buffer.chunk_count,
             )
-            # Process audio with STT, then LLM
-            await handle_vad_end(
-                websocket, audio_buffer, context, conversation_session, client_info
+            # Process audio with STT, then LLM, without blocking the receive loop
+            turn = TurnState()
+            turn_runner.start(
+                handle_vad_end(
+                    websocket,
+                    audio_buffer.detach(),
+                    context,
+                    conversation_session,
+                    client_info,
+                    turn,
+                    options,
+                ),
+                turn,
             )
 
         elif event_type == "cancel":
             logger.info("cancel_received", client=client_info)
             audio_buffer.clear()
+            await cancel_turn(
+                websocket, turn_runner, conversation_session, client_info, "cancel"
+            )
 
         else:
             logger.debug("unknown_event", client=client_info, event_type=event_type)
@@ -664,6 +1611,9 @@ async def handle_binary_message(
     """Handle binary (audio) messages from client.
 
     Protocol: first 4 bytes = header length, then JSON header, then audio data.
+    The ``vad.audio`` header may set ``format`` to "f32" (default, Float32
+    PCM), "s16" (Int16 PCM) or "opus" (one Opus packet per frame); audio is
+    decoded to float32 before buffering.
     """
     if len(data) < 4:
         logger.warning("binary_too_short", client=client_info, length=len(data))
@@ -690,15 +1640,42 @@ async def handle_binary_message(
         return
 
     event_type = header.get("type", "unknown")
-    sample_rate = header.get("sampleRate", 16000)
+    source_rate = header.get("sampleRate", STT_SAMPLE_RATE)
 
     if event_type == "vad.audio":
-        audio_data = data[4 + header_length :]
-        audio_buffer.add_chunk(audio_data, sample_rate)
+        audio_format = header.get("format", "f32")
+        # Slice without copying; samples are copied once into the buffer
+        audio_data = memoryview(data)[4 + header_length :]
+        try:
+            # Decoded and resampled to the STT rate with per-connection state
+            samples, sample_rate = audio_buffer.uplink.decode(
+                audio_data, audio_format, source_rate
+            )
+        except UnsupportedAudioFormatError as e:
+            logger.warning(
+                "unsupported_audio_format",
+                client=client_info,
+                format=audio_format,
+                error=str(e),
+            )
+            return
+        except Exception as e:
+            logger.warning(
+                "audio_decode_error",
+                client=client_info,
+                format=audio_format,
+                error=str(e),
+            )
+            return
+
+        audio_buffer.add_chunk(samples, sample_rate)
         logger.debug(
             "vad_audio_received",
             client=client_info,
             chunk_size=len(audio_data),
+            format=audio_format,
+            samples=len(samples),
+            source_rate=source_rate,
             sample_rate=sample_rate,
         )
     else:
@@ -715,19 +1692,31 @@ async def websocket_chat(websocket: WebSocket) -> None:
 
     Handles real-time bidirectional communication between frontend and backend.
     Supports both text (JSON events) and binary (audio data) messages.
+    Clients opt into binary tts.chunk frames with ``?tts_transport=binary``
+    and choose the audio with ``tts_format`` (pcm16/opus) and
+    ``tts_sample_rate``.
 
     Args:
         websocket: The WebSocket connection.
     """
     await websocket.accept()
     client_info = str(websocket.client) if websocket.client else "unknown"
-    logger.info("websocket_connected", client=client_info)
+    options = ConnectionOptions.from_query_params(websocket.query_params)
+    logger.info(
+        "websocket_connected",
+        client=client_info,
+        binary_tts=options.binary_tts,
+        tts_format=options.tts_format,
+        tts_sample_rate=options.tts_sample_rate,
+    )
 
     audio_buffer = AudioBuffer()
     # Each WebSocket connection has its own conversation context (in-memory)
     conversation_context = ConversationContext()
     # Each WebSocket connection has its own conversation session (DB persistence)
     conversation_session = ConversationSession()
+    # Each WebSocket connection owns the background task running its turns
+    turn_runner = TurnRunner(client_info)
 
     try:
         while True:
@@ -743,6 +1732,8 @@ async def websocket_chat(websocket: WebSocket) -> None:
                         conversation_context,
                         conversation_session,
                         client_info,
+                        turn_runner,
+                        options,
                     )
                 elif "bytes" in message:
                     await handle_binary_message(
@@ -756,3 +1747,7 @@ async def websocket_chat(websocket: WebSocket) -> None:
 
     except WebSocketDisconnect:
         logger.info("websocket_disconnected", client=client_info)
+
+    finally:
+        audio_buffer.clear()
+        await turn_runner.close()
@@ -0,0 +1,36 @@
+"""Audio processing utilities for voice assistant."""
+
+from voice_assistant.audio.downlink import (
+    DOWNLINK_FORMATS,
+    DownlinkEncoder,
+    DownlinkUsage,
+    OpusStreamEncoder,
+    opus_encoder_available,
+    pack_opus_packets,
+    unpack_opus_packets,
+)
+from voice_assistant.audio.resample import StreamingResampler, polyphase_filter_bank
+from voice_assistant.audio.uplink import (
+    UPLINK_FORMATS,
+    OpusStreamDecoder,
+    UnsupportedAudioFormatError,
+    UplinkDecoder,
+    decode_pcm,
+)
+
+__all__ = [
+    "DOWNLINK_FORMATS",
+    "UPLINK_FORMATS",
+    "DownlinkEncoder",
+    "DownlinkUsage",
+    "OpusStreamDecoder",
+    "OpusStreamEncoder",
+    "StreamingResampler",
+    "UnsupportedAudioFormatError",
+    "UplinkDecoder",
+    "decode_pcm",
+    "opus_encoder_available",
+    "pack_opus_packets",
+    "polyphase_filter_bank",
+    "unpack_opus_packets",
+]
@@ -0,0 +1,271 @@
+"""Encoding of downlink (server → client) TTS audio."""
+
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from voice_assistant.audio.resample import StreamingResampler
+from voice_assistant.audio.uplink import (
+    OPUS_SAMPLE_RATES,
+    UnsupportedAudioFormatError,
+    decode_pcm,
+)
+
+# Values accepted in the tts_format query parameter (and sent as "format")
+DOWNLINK_FORMATS = ("pcm16", "opus")
+
+# Output rates a client may request for PCM16 audio
+PCM_SAMPLE_RATES = (16000, 24000, 44100, 48000)
+
+# Opus output rate when the client does not request a supported one
+OPUS_DEFAULT_SAMPLE_RATE = 24000
+
+# Duration of each Opus packet
+OPUS_FRAME_MS = 20
+
+# Default audio per tts.chunk message (Opus packets are grouped up to this)
+DOWNLINK_CHUNK_MS = 200.0
+
+
+def opus_encoder_available() -> bool:
+    """Check whether Opus encoding is installed (opuslib and libopus)."""
+    try:
+        import opuslib  # noqa: F401
+    except Exception:
+        return False
+    return True
+
+
+class OpusStreamEncoder:
+    """Encodes a float32 stream into fixed-length Opus packets.
+
+    Requires the optional ``opuslib`` package (``pip install
+    voice-assistant[opus]``) and the system libopus.
+    """
+
+    def __init__(self, sample_rate: int, bitrate: int) -> None:
+        """Initialize the encoder.
+
+        Args:
+            sample_rate: Input and coded rate; must be one libopus supports.
+            bitrate: Target bitrate in bits per second.
+
+        Raises:
+            UnsupportedAudioFormatError: If opuslib/libopus is not installed.
+            ValueError: If the sample rate is not supported by libopus.
+        """
+        if sample_rate not in OPUS_SAMPLE_RATES:
+            raise ValueError(f"unsupported Opus sample rate: {sample_rate}")
+        try:
+            import opuslib
+        except Exception as e:
+            raise UnsupportedAudioFormatError(
+                "opus (opuslib/libopus not installed)"
+            ) from e
+
+        self.sample_rate = sample_rate
+        self.frame_size = sample_rate * OPUS_FRAME_MS // 1000
+        self._encoder = opuslib.Encoder(sample_rate, 1, opuslib.APPLICATION_VOIP)
+        self._encoder.bitrate = bitrate
+        self._pending = np.zeros(0, dtype=np.float32)
+
+    def encode(self, samples: np.ndarray) -> list[bytes]:
+        """Encode every complete packet; the remainder waits for more audio.
+
+        Args:
+            samples: Float32 samples at ``self.sample_rate``.
+
+        Returns:
+            Opus packets, one per ``OPUS_FRAME_MS`` of audio.
+        """
+        pending = np.concatenate([self._pending, samples.astype(np.float32)])
+        complete = len(pending) - len(pending) % self.frame_size
+        self._pending = pending[complete:]
+        return [
+            self._encoder.encode_float(
+                pending[start : start + self.frame_size].tobytes(), self.frame_size
+            )
+            for start in range(0, complete, self.frame_size)
+        ]
+
+    def flush(self) -> list[bytes]:
+        """Encode the remainder, padded with silence to a full packet."""
+        if not len(self._pending):
+            return []
+        padding = np.zeros(self.frame_size - len(self._pending), dtype=np.float32)
+        return self.encode(padding)
+
+
+def pack_opus_packets(packets: list[bytes]) -> bytes:
+    """Pack Opus packets into one tts.chunk payload.
+
+    Each packet is prefixed with its length as a 2-byte little-endian
+    integer (Opus packets are at most 1275 bytes).
+
+    Args:
+        packets: Opus packets in playback order.
+
+    Returns:
+        The packed payload.
+    """
+    return b"".join(len(p).to_bytes(2, byteorder="little") + p for p in packets)
+
+
+def unpack_opus_packets(payload: bytes) -> list[bytes]:
+    """Split a tts.chunk payload packed by ``pack_opus_packets``.
+
+    Args:
+        payload: Packed payload.
+
+    Returns:
+        The Opus packets in playback order.
+
+    Raises:
+        ValueError: If the payload is truncated.
+    """
+    packets = []
+    offset = 0
+    while offset < len(payload):
+        size = int.from_bytes(payload[offset : offset + 2], byteorder="little")
+        offset += 2
+        if offset + size > len(payload):
+            raise ValueError("truncated Opus payload")
+        packets.append(payload[offset : offset + size])
+        offset += size
+    return packets
+
+
+@dataclass
+class DownlinkUsage:
+    """Bytes sent for TTS audio compared to native-rate PCM16."""
+
+    # PCM16 bytes produced by the TTS engine
+    bytes_in: int = 0
+    # Encoded audio bytes (tts.chunk payloads)
+    payload_bytes: int = 0
+    # Bytes sent to the client: payloads plus tts.chunk headers, after
+    # base64 for the JSON transport (recorded by the sender)
+    bytes_out: int = 0
+    # Seconds of audio sent
+    audio_sec: float = 0.0
+
+    def add(self, other: "DownlinkUsage") -> None:
+        """Accumulate another usage's totals (e.g. a finished sentence)."""
+        self.bytes_in += other.bytes_in
+        self.payload_bytes += other.payload_bytes
+        self.bytes_out += other.bytes_out
+        self.audio_sec += other.audio_sec
+
+    def stats(self) -> dict[str, Any]:
+        """Get byte counts and bytes saved on the wire per second of audio."""
+        saved = (
+            (self.bytes_in - self.bytes_out) / self.audio_sec if self.audio_sec else 0
+        )
+        return {
+            "bytes_in": self.bytes_in,
+            "payload_bytes": self.payload_bytes,
+            "bytes_out": self.bytes_out,
+            "audio_sec": round(self.audio_sec, 3),
+            "saved_bytes_per_sec": round(saved),
+        }
+
+
+class DownlinkEncoder:
+    """Converts the PCM16 audio of one utterance to the negotiated format.
+
+    Create one per sentence (or audio bank clip): ``flush()`` completes the
+    utterance, so its last Opus packet is not held back until the next one.
+    PCM16 at the engine's own rate is passed through untouched.
+
+    Opus packets are grouped into payloads of up to ``chunk_ms`` of audio
+    (see ``pack_opus_packets``), so a 20 ms packet does not cost a whole
+    tts.chunk message. Complete packets are never held back for grouping.
+    """
+
+    def __init__(
+        self,
+        audio_format: str = "pcm16",
+        sample_rate: int | None = None,
+        opus_bitrate: int = 24000,
+        chunk_ms: float = DOWNLINK_CHUNK_MS,
+    ) -> None:
+        """Initialize the encoder.
+
+        Args:
+            audio_format: One of DOWNLINK_FORMATS.
+            sample_rate: Output rate (None keeps the engine's rate for PCM16
+                and uses OPUS_DEFAULT_SAMPLE_RATE for Opus).
+            opus_bitrate: Opus target bitrate in bits per second.
+            chunk_ms: Max audio per Opus payload.
+
+        Raises:
+            UnsupportedAudioFormatError: If the format is unknown or its
+                codec is not installed.
+        """
+        if audio_format not in DOWNLINK_FORMATS:
+            raise UnsupportedAudioFormatError(audio_format)
+        self.format = audio_format
+        self.sample_rate = sample_rate
+        self.usage = DownlinkUsage()
+        self.packets_per_chunk = max(1, int(chunk_ms // OPUS_FRAME_MS))
+        self._opus: OpusStreamEncoder | None = None
+        self._resampler: StreamingResampler | None = None
+        if audio_format == "opus":
+            self.sample_rate = sample_rate or OPUS_DEFAULT_SAMPLE_RATE
+            self._opus = OpusStreamEncoder(self.sample_rate, opus_bitrate)
+
+    def encode(self, audio: bytes, sample_rate: int) -> tuple[list[bytes], int]:
+        """Encode a PCM16 frame from the TTS engine.
+
+        Args:
+            audio: Little-endian PCM16 mono audio.
+            sample_rate: Sample rate of ``audio``.
+
+        Returns:
+            Tuple of (payloads to send, their sample rate). May be empty for
+            Opus until a full packet has been buffered; Opus payloads hold
+            packed packets.
+        """
+        self.usage.bytes_in += len(audio)
+        self.usage.audio_sec += len(audio) / 2 / sample_rate
+        target_rate = self.sample_rate or sample_rate
+
+        if self._opus is None and target_rate == sample_rate:
+            payloads = [audio]
+        else:
+            samples = decode_pcm(audio, "s16")
+            if target_rate != sample_rate:
+                samples = self._get_resampler(sample_rate, target_rate).process(samples)
+            if self._opus is not None:
+                payloads = self._pack(self._opus.encode(samples))
+            else:
+                payloads = [to_pcm16(samples)]
+
+        self.usage.payload_bytes += sum(len(p) for p in payloads)
+        return payloads, target_rate
+
+    def flush(self) -> list[bytes]:
+        """Get the payloads still buffered at the end of the utterance."""
+        if self._opus is None:
+            return []
+        payloads = self._pack(self._opus.flush())
+        self.usage.payload_bytes += sum(len(p) for p in payloads)
+        return payloads
+
+    def _pack(self, packets: list[bytes]) -> list[bytes]:
+        size = self.packets_per_chunk
+        return [
+            pack_opus_packets(packets[start : start + size])
+            for start in range(0, len(packets), size)
+        ]
+
+    def _get_resampler(self, source_rate: int, target_rate: int) -> StreamingResampler:
+        if self._resampler is None or self._resampler.source_rate != source_rate:
+            self._resampler = StreamingResampler(source_rate, target_rate)
+        return self._resampler
+
+
+def to_pcm16(samples: np.ndarray) -> bytes:
+    """Convert float32 samples in [-1, 1] to little-endian PCM16 bytes."""
+    return (np.clip(samples, -1.0, 1.0) * 32767).astype("<i2").tobytes()
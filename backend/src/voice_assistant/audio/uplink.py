@@ -0,0 +1,205 @@
+"""Decoding of uplink (client → server) audio frames to float32 PCM."""
+
+from typing import Any
+
+import numpy as np
+
+from voice_assistant.audio.resample import StreamingResampler
+from voice_assistant.core.logging import get_logger
+from voice_assistant.stt.base import STT_SAMPLE_RATE
+
+logger = get_logger(__name__)
+
+# Values accepted in the vad.audio header "format" field
+UPLINK_FORMATS = ("f32", "s16", "opus")
+
+# Sample rates libopus can decode to
+OPUS_SAMPLE_RATES = (8000, 12000, 16000, 24000, 48000)
+
+# Largest Opus packet duration (120 ms)
+OPUS_MAX_FRAME_SEC = 0.12
+
+# Client sample rates accepted in the vad.audio header. Arbitrary rates are
+# rejected: one sharing few factors with the STT rate needs a huge filter
+# bank (tens of MB and seconds of design time on the event loop)
+UPLINK_SAMPLE_RATES = (
+    8000,
+    11025,
+    12000,
+    16000,
+    22050,
+    24000,
+    32000,
+    44100,
+    48000,
+    88200,
+    96000,
+)
+
+_S16_SCALE = np.float32(1 / 32768)
+
+
+class UnsupportedAudioFormatError(ValueError):
+    """Raised when an uplink audio format cannot be decoded."""
+
+
+def decode_pcm(data: bytes | memoryview, audio_format: str) -> np.ndarray:
+    """Decode raw PCM to float32 samples.
+
+    Args:
+        data: PCM payload (little-endian).
+        audio_format: "f32" (returned as a view, no copy) or "s16".
+
+    Returns:
+        Float32 samples in [-1, 1].
+
+    Raises:
+        UnsupportedAudioFormatError: If the format is not raw PCM.
+    """
+    if audio_format == "f32":
+        usable = len(data) - len(data) % 4
+        return np.frombuffer(data, dtype=np.float32, count=usable // 4)
+    if audio_format == "s16":
+        usable = len(data) - len(data) % 2
+        samples = np.frombuffer(data, dtype="<i2", count=usable // 2)
+        return samples.astype(np.float32) * _S16_SCALE
+    raise UnsupportedAudioFormatError(audio_format)
+
+
+class OpusStreamDecoder:
+    """Stateful Opus decoder for one client stream (one packet per frame).
+
+    Requires the optional ``opuslib`` package (``pip install
+    voice-assistant[opus]``) and the system libopus.
+    """
+
+    def __init__(self, sample_rate: int = 16000) -> None:
+        """Initialize the decoder.
+
+        Args:
+            sample_rate: Requested output rate; rates libopus cannot decode
+                to fall back to 48 kHz.
+        """
+        try:
+            import opuslib
+        except Exception as e:
+            raise UnsupportedAudioFormatError(
+                "opus (opuslib/libopus not installed)"
+            ) from e
+
+        self.sample_rate = sample_rate if sample_rate in OPUS_SAMPLE_RATES else 48000
+        self._max_frame_size = int(self.sample_rate * OPUS_MAX_FRAME_SEC)
+        self._decoder = opuslib.Decoder(self.sample_rate, 1)
+
+    def decode(self, packet: bytes | memoryview) -> np.ndarray:
+        """Decode one Opus packet.
+
+        Args:
+            packet: A single Opus packet.
+
+        Returns:
+            Float32 samples at ``self.sample_rate``.
+        """
+        pcm = self._decoder.decode_float(bytes(packet), self._max_frame_size)
+        return np.frombuffer(pcm, dtype=np.float32)
+
+
+class UplinkDecoder:
+    """Per-connection decoder for ``vad.audio`` payloads.
+
+    Keeps codec state (the Opus decoder) and resampler state across frames
+    of a connection, and always returns audio at ``target_rate``. If the
+    client's rate changes mid-stream the resampler is rebuilt for it.
+    """
+
+    def __init__(self, target_rate: int = STT_SAMPLE_RATE) -> None:
+        """Initialize the decoder.
+
+        Args:
+            target_rate: Sample rate all decoded audio is converted to.
+        """
+        self.target_rate = target_rate
+        self._opus: OpusStreamDecoder | None = None
+        self._opus_unavailable = False
+        self._resampler: StreamingResampler | None = None
+        self.bytes_in = 0
+        self.samples_out = 0
+        self.resampled_chunks = 0
+
+    @property
+    def source_rate(self) -> int | None:
+        """Client sample rate currently being resampled (None if native)."""
+        return self._resampler.source_rate if self._resampler else None
+
+    def decode(
+        self, data: bytes | memoryview, audio_format: str, sample_rate: int
+    ) -> tuple[np.ndarray, int]:
+        """Decode a payload to float32 samples at ``target_rate``.
+
+        Args:
+            data: Audio payload of one vad.audio frame.
+            audio_format: One of UPLINK_FORMATS.
+            sample_rate: Sample rate from the frame header.
+
+        Returns:
+            Tuple of (float32 samples, their sample rate).
+
+        Raises:
+            UnsupportedAudioFormatError: If the format is unknown or its
+                codec is not installed.
+            ValueError: If the sample rate is not one of UPLINK_SAMPLE_RATES.
+        """
+        if (
+            not isinstance(sample_rate, int)
+            or isinstance(sample_rate, bool)
+            or sample_rate not in UPLINK_SAMPLE_RATES
+        ):
+            raise ValueError(f"invalid sample rate: {sample_rate!r}")
+
+        if audio_format == "opus":
+            # libopus decodes any packet at the target rate directly
+            decoder = self._get_opus_decoder(self.target_rate)
+            samples = decoder.decode(data)
+            sample_rate = decoder.sample_rate
+        else:
+            samples = decode_pcm(data, audio_format)
+
+        if sample_rate != self.target_rate:
+            samples = self._get_resampler(sample_rate).process(samples)
+            self.resampled_chunks += 1
+
+        self.bytes_in += len(data)
+        self.samples_out += len(samples)
+        return samples, self.target_rate
+
+    def stats(self) -> dict[str, Any]:
+        """Get ingress byte and decoded sample counts."""
+        return {
+            "bytes_in": self.bytes_in,
+            "samples_out": self.samples_out,
+            "resampled_chunks": self.resampled_chunks,
+            "source_rate": self.source_rate,
+        }
+
+    def _get_resampler(self, source_rate: int) -> StreamingResampler:
+        if self._resampler is None or self._resampler.source_rate != source_rate:
+            if self._resampler is not None:
+                logger.info(
+                    "uplink_sample_rate_changed",
+                    previous=self._resampler.source_rate,
+                    current=source_rate,
+                )
+            self._resampler = StreamingResampler(source_rate, self.target_rate)
+        return self._resampler
+
+    def _get_opus_decoder(self, sample_rate: int) -> OpusStreamDecoder:
+        if self._opus_unavailable:
+            raise UnsupportedAudioFormatError("opus")
+        if self._opus is None:
+            try:
+                self._opus = OpusStreamDecoder(sample_rate)
+            except UnsupportedAudioFormatError:
+                self._opus_unavailable = True
+                logger.error("opus_decoder_unavailable")
+                raise
+        return self._opus
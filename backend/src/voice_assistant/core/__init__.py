@@ -1,6 +1,17 @@
 """Core utilities for Voice Assistant"""
 
+from voice_assistant.core.batching import BatchScheduler
 from voice_assistant.core.config import settings
+from voice_assistant.core.executor import InferenceExecutor, set_torch_threads
 from voice_assistant.core.logging import configure_logging
+from voice_assistant.core.readiness import Readiness, readiness
 
-__all__ = ["settings", "configure_logging"]
+__all__ = [
+    "settings",
+    "configure_logging",
+    "BatchScheduler",
+    "InferenceExecutor",
+    "set_torch_threads",
+    "Readiness",
+    "readiness",
+]
@@ -0,0 +1,268 @@
+"""Micro-batching of inference requests across sessions."""
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from voice_assistant.core.executor import InferenceExecutor
+from voice_assistant.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class _Request:
+    """A queued item and the future its caller awaits."""
+
+    item: Any
+    future: "asyncio.Future[Any]"
+    enqueued_at: float
+
+
+class BatchScheduler:
+    """Collects concurrent requests and runs them as one batch in a thread.
+
+    The first request of a batch waits up to ``max_wait_ms`` for others to
+    join (or until ``max_batch_size`` requests are pending). Up to
+    ``max_concurrent_batches`` batches run at once (by default one per
+    executor worker); requests that arrive while every slot is busy form
+    the next batch. Results are returned to each awaiting caller in order.
+
+    With ``item_length``, a batch only groups items of similar length (at
+    most ``max_length_ratio`` apart) with the oldest pending item, so padded
+    batches waste little compute; other items wait for a later batch.
+    """
+
+    def __init__(
+        self,
+        run_batch: Callable[[list[Any]], list[Any]],
+        max_batch_size: int = 4,
+        max_wait_ms: float = 20.0,
+        name: str = "batch",
+        executor: InferenceExecutor | None = None,
+        item_length: Callable[[Any], int] | None = None,
+        max_length_ratio: float = 2.0,
+        max_concurrent_batches: int | None = None,
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            run_batch: Blocking function mapping a batch of items to results.
+            max_batch_size: Max items per batch (1 disables batching).
+            max_wait_ms: Max time the first item waits for others to join.
+            name: Name used in log events.
+            executor: Worker pool batches run on (default: asyncio.to_thread).
+            item_length: Length of an item, to group similar lengths
+                (None batches in arrival order).
+            max_length_ratio: Max ratio between the longest and shortest
+                item of a batch when grouping by length.
+            max_concurrent_batches: Max batches running at once (default:
+                the executor's worker count, or 1 without an executor).
+        """
+        self._run_batch = run_batch
+        self._executor = executor
+        self.max_batch_size = max(1, max_batch_size)
+        self._max_wait = max_wait_ms / 1000
+        self._name = name
+        self._item_length = item_length
+        self._max_length_ratio = max(1.0, max_length_ratio)
+        if max_concurrent_batches is None:
+            max_concurrent_batches = executor.max_workers if executor else 1
+        self.max_concurrent_batches = max(1, max_concurrent_batches)
+        self._slots: asyncio.Semaphore | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._running = 0
+        self._max_running_seen = 0
+        self._pending: deque[_Request] = deque()
+        self._wakeup: asyncio.Event | None = None
+        self._worker: asyncio.Task[None] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._batches = 0
+        self._items = 0
+        self._max_batch_seen = 0
+        self._batch_size_counts: dict[int, int] = {}
+        self._last_batch_ms = 0.0
+        self._total_batch_ms = 0.0
+        self._max_batch_ms = 0.0
+        self._total_wait_ms = 0.0
+
+    @property
+    def depth(self) -> int:
+        """Number of requests waiting for a batch."""
+        return len(self._pending)
+
+    async def submit(self, item: Any) -> Any:
+        """Queue an item and wait for its result.
+
+        Args:
+            item: Input for ``run_batch``.
+
+        Returns:
+            The result for this item.
+        """
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Bind to the current event loop (state from another loop is dead)
+            self._loop = loop
+            self._pending = deque()
+            self._wakeup = asyncio.Event()
+            self._slots = asyncio.Semaphore(self.max_concurrent_batches)
+            self._tasks = set()
+            self._running = 0
+            self._worker = None
+
+        future: asyncio.Future[Any] = loop.create_future()
+        self._pending.append(_Request(item, future, time.perf_counter()))
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+        elif self._wakeup is not None:
+            self._wakeup.set()
+        return await future
+
+    def stats(self) -> dict[str, Any]:
+        """Get batch size and per-batch timing statistics."""
+        return {
+            "depth": self.depth,
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": round(self._max_wait * 1000, 2),
+            "max_concurrent_batches": self.max_concurrent_batches,
+            "running_batches": self._running,
+            "max_running_batches_seen": self._max_running_seen,
+            "batches": self._batches,
+            "items": self._items,
+            "avg_batch_size": (
+                round(self._items / self._batches, 2) if self._batches else 0.0
+            ),
+            # Mean fraction of batch slots filled
+            "occupancy": (
+                round(self._items / (self._batches * self.max_batch_size), 4)
+                if self._batches
+                else 0.0
+            ),
+            "max_batch_size_seen": self._max_batch_seen,
+            "batch_size_counts": dict(sorted(self._batch_size_counts.items())),
+            "last_batch_ms": round(self._last_batch_ms, 2),
+            "avg_batch_ms": (
+                round(self._total_batch_ms / self._batches, 2) if self._batches else 0.0
+            ),
+            "max_batch_ms": round(self._max_batch_ms, 2),
+            "avg_queue_wait_ms": (
+                round(self._total_wait_ms / self._items, 2) if self._items else 0.0
+            ),
+        }
+
+    async def _run(self) -> None:
+        """Form batches and start them until no requests are pending."""
+        assert self._slots is not None
+        while self._pending:
+            # Wait for a free slot first, so requests arriving meanwhile
+            # join the batch instead of queueing behind it
+            await self._slots.acquire()
+            await self._wait_for_batch()
+            batch = self._take_batch()
+            if not batch:
+                self._slots.release()
+                continue
+            task = asyncio.create_task(self._execute_in_slot(batch, self._slots))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _execute_in_slot(
+        self, batch: list[_Request], slots: asyncio.Semaphore
+    ) -> None:
+        """Run a batch, then free its slot for the next one."""
+        self._running += 1
+        self._max_running_seen = max(self._max_running_seen, self._running)
+        try:
+            await self._execute(batch)
+        finally:
+            self._running -= 1
+            slots.release()
+
+    def _take_batch(self) -> list[_Request]:
+        """Pop the next batch: the oldest request plus compatible ones."""
+        batch: list[_Request] = []
+        skipped: deque[_Request] = deque()
+        reference = None
+        while self._pending and len(batch) < self.max_batch_size:
+            request = self._pending.popleft()
+            # Skip callers that were cancelled while waiting
+            if request.future.done():
+                continue
+            if self._item_length is not None:
+                length = max(1, self._item_length(request.item))
+                if reference is None:
+                    reference = length
+                elif max(length, reference) > self._max_length_ratio * min(
+                    length, reference
+                ):
+                    skipped.append(request)
+                    continue
+            batch.append(request)
+        # Items left for later batches keep their arrival order
+        skipped.extend(self._pending)
+        self._pending = skipped
+        return batch
+
+    async def _wait_for_batch(self) -> None:
+        """Wait until the batch is full or the first request's window ends."""
+        deadline = self._pending[0].enqueued_at + self._max_wait
+        while len(self._pending) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0 or self._wakeup is None:
+                return
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), remaining)
+            except TimeoutError:
+                return
+
+    async def _execute(self, batch: list[_Request]) -> None:
+        """Run one batch on a worker thread and resolve its futures."""
+        start_time = time.perf_counter()
+        wait_ms = sum((start_time - r.enqueued_at) * 1000 for r in batch)
+
+        try:
+            items = [r.item for r in batch]
+            if self._executor is not None:
+                results = await self._executor.run(self._run_batch, items)
+            else:
+                results = await asyncio.to_thread(self._run_batch, items)
+            if len(results) != len(batch):
+                raise RuntimeError(
+                    f"{self._name} batch returned {len(results)} results "
+                    f"for {len(batch)} items"
+                )
+        except Exception as e:
+            logger.error(
+                "batch_error", scheduler=self._name, batch_size=len(batch), error=str(e)
+            )
+            for request in batch:
+                if not request.future.done():
+                    request.future.set_exception(e)
+        else:
+            for request, result in zip(batch, results, strict=True):
+                if not request.future.done():
+                    request.future.set_result(result)
+
+        batch_ms = (time.perf_counter() - start_time) * 1000
+        size = len(batch)
+        self._batches += 1
+        self._items += size
+        self._max_batch_seen = max(self._max_batch_seen, size)
+        self._batch_size_counts[size] = self._batch_size_counts.get(size, 0) + 1
+        self._last_batch_ms = batch_ms
+        self._total_batch_ms += batch_ms
+        self._max_batch_ms = max(self._max_batch_ms, batch_ms)
+        self._total_wait_ms += wait_ms
+
+        logger.debug(
+            "batch_completed",
+            scheduler=self._name,
+            batch_size=size,
+            batch_ms=round(batch_ms, 2),
+            avg_queue_wait_ms=round(wait_ms / size, 2),
+        )
@@ -29,6 +29,122 @@ class Settings(BaseSettings):
     log_level: str = "INFO"
     eval_log_path: Path = Path("logs/eval.jsonl")
 
+    # Load and warm up STT/TTS in the background at startup;
+    # /api/v1/ready reports 503 until both are warm
+    preload_models: bool = False
+
+    # Voice pipeline
+    # Utterance audio buffer: grows up to audio_buffer_max_sec; past that
+    # "truncate" keeps the first max_sec of audio and "error" rejects the
+    # utterance with an AUDIO_TOO_LONG error
+    audio_buffer_max_sec: float = 60.0
+    audio_buffer_overflow: Literal["truncate", "error"] = "truncate"
+    # Max sentences waiting for TTS while the LLM keeps streaming
+    tts_queue_size: int = 8
+    # tts.chunk frame duration; long sentences are synthesized clause by
+    # clause (clauses shorter than tts_clause_min_chars are merged)
+    tts_frame_ms: float = 200.0
+    tts_clause_min_chars: int = 12
+    # Bitrate of tts.chunk audio for clients that negotiate tts_format=opus
+    tts_opus_bitrate: int = 24000
+    # TTS micro-batching: sentences from concurrent sessions arriving within
+    # tts_batch_wait_ms whose lengths differ by at most
+    # tts_batch_max_length_ratio share one padded forward pass (1 = off)
+    tts_max_batch_size: int = 1
+    tts_batch_wait_ms: float = 30.0
+    tts_batch_max_length_ratio: float = 2.0
+    # Sentences of a turn synthesized ahead of the one being sent (1 = one
+    # at a time); raise together with tts_workers or tts_max_batch_size
+    tts_lookahead: int = 1
+    # Style-BERT-VITS2 voice
+    tts_speaker_id: int = 0
+    tts_style: str = "Neutral"
+    # Phrase cache of synthesized audio (phrases up to tts_cache_max_chars):
+    # in-memory LRU of tts_cache_max_mb, plus an optional disk tier of raw
+    # PCM files in tts_cache_dir
+    tts_cache: bool = False
+    tts_cache_max_mb: float = 64.0
+    tts_cache_max_chars: int = 40
+    tts_cache_dir: Path | None = None
+    # Text front-end cache: G2P and BERT features of texts (sentences, or
+    # clauses when streaming) seen before, in an LRU of
+    # tts_frontend_cache_max_mb; only the acoustic model reruns on a hit
+    tts_frontend_cache: bool = False
+    tts_frontend_cache_max_mb: float = 128.0
+    # Audio bank: fixed utterances rendered once at startup (re-rendered
+    # only when the model files, speaker, style or the text change) and
+    # played with no inference; utterances are named after the lowercased
+    # error code they are spoken for
+    tts_audio_bank: bool = False
+    tts_audio_bank_dir: Path = Path("data/tts_bank")
+    tts_audio_bank_phrases: dict[str, str] = {
+        "llm_rate_limit": "ただいま混み合っています。少し待ってから話しかけてください。",
+        "llm_auth_error": "言語モデルに接続できませんでした。設定を確認してください。",
+        "llm_api_error": "すみません、言語モデルでエラーが発生しました。",
+        "llm_error": "すみません、うまく応答できませんでした。",
+        "tts_error": "すみません、音声の生成に失敗しました。",
+    }
+    # llm.delta coalescing window (first token is always sent immediately;
+    # llm_delta_flush_ms = 0 sends one frame per token)
+    llm_delta_flush_ms: float = 50.0
+    llm_delta_flush_chars: int = 32
+    # STT micro-batching across sessions: off by default (1), since a lone
+    # session only gains stt_batch_wait_ms of latency. Set e.g. 4 when
+    # several sessions share the server
+    stt_max_batch_size: int = 1
+    stt_batch_wait_ms: float = 20.0
+    # Speech gate before STT: trim edge silence, skip utterances with less
+    # than stt_gate_min_speech_ms of speech (frame RMS above threshold dBFS).
+    # Opt-in: quiet microphones can fall below the threshold and lose speech,
+    # so tune stt_gate_threshold_db for the input before enabling it
+    stt_speech_gate: bool = False
+    stt_gate_threshold_db: float = -45.0
+    stt_gate_min_speech_ms: float = 200.0
+    stt_gate_pad_ms: float = 150.0
+    # Long-form STT: utterances longer than stt_segment_sec are split at
+    # pauses into overlapping segments decoded in parallel. Opt-in: it only
+    # cuts latency when segments can run at once (stt_workers > 1 or
+    # stt_max_batch_size > 1), and stitching can garble words at the seams
+    stt_long_form: bool = False
+    stt_segment_sec: float = 15.0
+    stt_segment_overlap_sec: float = 0.5
+    # CPU only: int8 dynamic quantization of the STT encoder (faster, may
+    # cost accuracy; compare with scripts/compare_stt_quantization.py).
+    # Quantized encoders are cached in stt_quantized_cache_dir
+    stt_quantize: bool = False
+    stt_quantized_cache_dir: Path = Path("data/stt_cache")
+    # Transcript cache keyed by a hash of the audio: in-memory LRU of
+    # stt_cache_max_mb, plus an optional disk tier in stt_cache_dir
+    stt_cache: bool = False
+    stt_cache_max_mb: float = 16.0
+    stt_cache_dir: Path | None = None
+    # Streaming STT: send stt.partial while the user is still speaking
+    # (overlapping windows are decoded as audio arrives)
+    stt_streaming: bool = False
+    stt_partial_interval_ms: float = 1000.0
+    stt_window_sec: float = 8.0
+    stt_overlap_sec: float = 1.0
+
+    # Inference executors: dedicated worker threads per engine, bounding
+    # concurrent inference to *_workers; *_cpu_affinity pins workers to
+    # CPUs (JSON list, e.g. "[0,1,2,3]"; Linux only)
+    stt_workers: int = 1
+    stt_cpu_affinity: list[int] = []
+    tts_workers: int = 1
+    tts_cpu_affinity: list[int] = []
+    # torch intra-op threads (0 = torch default). Process-wide, shared by
+    # STT and TTS: applied once at startup and in each STT worker process
+    torch_threads: int = 0
+    # Out-of-process STT: N > 0 runs the STT model in N worker processes
+    # (each loads its own copy) that are restarted if they crash or exceed
+    # stt_worker_timeout_sec on a request; 0 keeps it in the server process
+    stt_worker_processes: int = 0
+    stt_worker_timeout_sec: float = 60.0
+
+    # Database write-behind queue (batched commits off the event loop)
+    db_flush_interval_ms: float = 50.0
+    db_max_batch_size: int = 100
+
     @field_validator("log_level")
     @classmethod
     def validate_log_level(cls, v: str) -> LogLevel:
@@ -0,0 +1,180 @@
+"""Dedicated thread pools for blocking model inference."""
+
+import asyncio
+import contextvars
+import os
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from voice_assistant.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+def set_torch_threads(threads: int | None) -> None:
+    """Limit torch's intra-op threads for the whole process.
+
+    ``torch.set_num_threads`` is process-global: it applies to every thread,
+    including ones started later, and the last call wins. Call it once at
+    process startup, before any inference, rather than per executor.
+
+    Args:
+        threads: Intra-op thread count (None or 0 keeps torch's default).
+    """
+    if not threads:
+        return
+    try:
+        import torch
+
+        torch.set_num_threads(threads)
+    except Exception as e:
+        logger.warning("torch_threads_error", threads=threads, error=str(e))
+        return
+    logger.info("torch_threads_set", threads=threads)
+
+
+class InferenceExecutor:
+    """Sized worker pool for one engine's blocking inference calls.
+
+    Replaces ``asyncio.to_thread`` (the shared default executor) so that
+    engines do not compete for the same threads, and at most
+    ``max_workers`` inferences of an engine run at once; further calls
+    queue. Workers can be pinned to a CPU set, so concurrent STT and TTS
+    do not oversubscribe cores. torch's intra-op thread count is
+    process-wide, not per worker; see ``set_torch_threads``.
+
+    Time spent waiting for a worker is tracked separately from the time
+    spent running.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_workers: int = 1,
+        cpu_affinity: set[int] | list[int] | None = None,
+    ) -> None:
+        """Initialize the executor (threads start on first use).
+
+        Args:
+            name: Engine name, used for thread names and log events.
+            max_workers: Max concurrent calls.
+            cpu_affinity: CPUs the workers are pinned to (Linux only;
+                None or empty disables pinning).
+        """
+        self.name = name
+        self.max_workers = max(1, max_workers)
+        self.cpu_affinity = set(cpu_affinity) if cpu_affinity else None
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix=f"{name}-inference",
+            initializer=self._init_worker,
+        )
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._in_flight = 0
+        self._tasks = 0
+        self._errors = 0
+        self._total_wait_ms = 0.0
+        self._max_wait_ms = 0.0
+        self._total_run_ms = 0.0
+        self._max_run_ms = 0.0
+
+    async def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a blocking function on a worker and await its result.
+
+        Args:
+            func: Blocking callable.
+            *args: Positional arguments for ``func``.
+            **kwargs: Keyword arguments for ``func``.
+
+        Returns:
+            The return value of ``func``.
+        """
+        submitted = time.perf_counter()
+        context = contextvars.copy_context()
+
+        def call() -> Any:
+            started = time.perf_counter()
+            with self._lock:
+                self._queued -= 1
+                self._in_flight += 1
+            ok = False
+            try:
+                result = context.run(func, *args, **kwargs)
+                ok = True
+                return result
+            finally:
+                self._record(submitted, started, ok)
+
+        with self._lock:
+            self._queued += 1
+        future = self._pool.submit(call)
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            if future.cancelled():
+                # Never reached a worker
+                with self._lock:
+                    self._queued -= 1
+            raise
+
+    def stats(self) -> dict[str, Any]:
+        """Get queue depth and queue-wait vs inference timing."""
+        affinity = sorted(self.cpu_affinity) if self.cpu_affinity else None
+        with self._lock:
+            tasks = self._tasks
+            return {
+                "workers": self.max_workers,
+                "cpu_affinity": affinity,
+                "queued": self._queued,
+                "in_flight": self._in_flight,
+                "tasks": tasks,
+                "errors": self._errors,
+                "avg_queue_wait_ms": (
+                    round(self._total_wait_ms / tasks, 2) if tasks else 0.0
+                ),
+                "max_queue_wait_ms": round(self._max_wait_ms, 2),
+                "avg_inference_ms": (
+                    round(self._total_run_ms / tasks, 2) if tasks else 0.0
+                ),
+                "max_inference_ms": round(self._max_run_ms, 2),
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the workers (queued calls are cancelled)."""
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+
+    def _record(self, submitted: float, started: float, ok: bool) -> None:
+        finished = time.perf_counter()
+        wait_ms = (started - submitted) * 1000
+        run_ms = (finished - started) * 1000
+        with self._lock:
+            self._in_flight -= 1
+            self._tasks += 1
+            if not ok:
+                self._errors += 1
+            self._total_wait_ms += wait_ms
+            self._max_wait_ms = max(self._max_wait_ms, wait_ms)
+            self._total_run_ms += run_ms
+            self._max_run_ms = max(self._max_run_ms, run_ms)
+
+    def _init_worker(self) -> None:
+        """Apply CPU affinity to a new worker."""
+        if self.cpu_affinity:
+            try:
+                # pid 0 is the calling thread on Linux
+                os.sched_setaffinity(0, self.cpu_affinity)
+            except (AttributeError, OSError, ValueError) as e:
+                logger.warning(
+                    "inference_affinity_error", executor=self.name, error=str(e)
+                )
+
+        logger.debug(
+            "inference_worker_started",
+            executor=self.name,
+            thread=threading.current_thread().name,
+            cpu_affinity=sorted(self.cpu_affinity) if self.cpu_affinity else None,
+        )
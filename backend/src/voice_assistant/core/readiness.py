@@ -0,0 +1,67 @@
+"""Readiness tracking for model loading and warm-up."""
+
+import threading
+from typing import Any, Literal
+
+ComponentState = Literal["pending", "loading", "ready", "failed"]
+
+
+class Readiness:
+    """Tracks whether the components needed to serve traffic are warm.
+
+    Separate from liveness (``/api/v1/health``): the process can be alive
+    while models are still loading. With no registered components the
+    service is ready as soon as it starts (models load lazily).
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._components: dict[str, dict[str, Any]] = {}
+
+    def register(self, name: str) -> None:
+        """Register a component that must become ready (state "pending")."""
+        self.set_state(name, "pending")
+
+    def set_state(self, name: str, state: ComponentState, **info: Any) -> None:
+        """Update a component's state.
+
+        Args:
+            name: Component name (e.g. "stt").
+            state: New state.
+            **info: Extra details reported with the state (timings, errors).
+        """
+        with self._lock:
+            self._components[name] = {"state": state, **info}
+
+    def reset(self) -> None:
+        """Forget all components."""
+        with self._lock:
+            self._components = {}
+
+    @property
+    def is_ready(self) -> bool:
+        """Whether every registered component is ready."""
+        with self._lock:
+            return all(c["state"] == "ready" for c in self._components.values())
+
+    def snapshot(self) -> dict[str, Any]:
+        """Get the overall status and per-component states.
+
+        Returns:
+            dict with "status" ("ready", "starting" or "failed") and
+            "components".
+        """
+        with self._lock:
+            components = {name: dict(c) for name, c in self._components.items()}
+
+        states = {c["state"] for c in components.values()}
+        if "failed" in states:
+            status = "failed"
+        elif states <= {"ready"}:
+            status = "ready"
+        else:
+            status = "starting"
+        return {"status": status, "components": components}
+
+
+readiness = Readiness()
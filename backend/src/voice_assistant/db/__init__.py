@@ -8,6 +8,7 @@ from voice_assistant.db.repository import (
     get_session,
     init_db,
 )
+from voice_assistant.db.write_behind import WriteBehindQueue, get_write_behind_queue
 
 __all__ = [
     "Conversation",
@@ -17,4 +18,6 @@ __all__ = [
     "get_engine",
     "get_session",
     "init_db",
+    "WriteBehindQueue",
+    "get_write_behind_queue",
 ]
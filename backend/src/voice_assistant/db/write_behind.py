@@ -0,0 +1,319 @@
+"""Write-behind persistence queue.
+
+Conversation and message writes from the voice pipeline are queued and
+applied by a dedicated writer thread, batched into a single transaction per
+flush. The event loop never waits on SQLite commits or fsync.
+"""
+
+import asyncio
+import queue
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+from sqlmodel import Session
+
+from voice_assistant.core.config import settings
+from voice_assistant.core.logging import get_logger
+from voice_assistant.db.models import Conversation, Message, MessageRole, utc_now
+from voice_assistant.db.repository import get_engine
+
+logger = get_logger(__name__)
+
+# A queued write: applied to a session, committed by the writer thread
+WriteOp = Callable[[Session], None]
+
+
+class _Barrier:
+    """Queue marker that ends the current batch and signals when written."""
+
+    def __init__(self, stop: bool = False) -> None:
+        self.stop = stop
+        self.done = threading.Event()
+
+
+class WriteBehindQueue:
+    """Queue of database writes applied asynchronously by a writer thread.
+
+    Writes are collected for up to ``flush_interval_ms`` (or until
+    ``max_batch_size`` writes are pending) and committed together. IDs and
+    timestamps are assigned at enqueue time, so callers can use them
+    immediately and ordering matches the order of calls.
+    """
+
+    def __init__(
+        self,
+        flush_interval_ms: float = 50.0,
+        max_batch_size: int = 100,
+    ) -> None:
+        """Initialize the queue (the writer thread starts on first use).
+
+        Args:
+            flush_interval_ms: Max time a write waits for others to batch with.
+            max_batch_size: Max writes committed in one transaction.
+        """
+        self.flush_interval_ms = flush_interval_ms
+        self.max_batch_size = max_batch_size
+        self._queue: queue.Queue[WriteOp | _Barrier] = queue.Queue()
+        self._thread: threading.Thread | None = None
+        self._thread_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._written = 0
+        self._failed = 0
+        self._batches = 0
+        self._last_flush_latency_ms = 0.0
+        self._max_flush_latency_ms = 0.0
+
+    @property
+    def depth(self) -> int:
+        """Number of writes waiting to be committed."""
+        return self._queue.qsize()
+
+    def start(self) -> None:
+        """Start the writer thread if it is not running."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        with self._thread_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="db-write-behind", daemon=True
+                )
+                self._thread.start()
+                logger.info(
+                    "write_behind_started",
+                    flush_interval_ms=self.flush_interval_ms,
+                    max_batch_size=self.max_batch_size,
+                )
+
+    def flush(self, timeout: float | None = 5.0) -> bool:
+        """Block until every write queued so far is committed.
+
+        Args:
+            timeout: Max seconds to wait (None waits forever).
+
+        Returns:
+            True if all writes were committed within the timeout.
+        """
+        if self._thread is None or not self._thread.is_alive():
+            return self._queue.empty()
+
+        barrier = _Barrier()
+        self._queue.put(barrier)
+        return barrier.done.wait(timeout)
+
+    async def flush_async(self, timeout: float | None = 5.0) -> bool:
+        """Wait like ``flush()`` without blocking the event loop.
+
+        Args:
+            timeout: Max seconds to wait (None waits forever).
+
+        Returns:
+            True if all writes were committed within the timeout.
+        """
+        return await asyncio.to_thread(self.flush, timeout)
+
+    def stop(self, timeout: float | None = 5.0) -> None:
+        """Commit pending writes and stop the writer thread.
+
+        Args:
+            timeout: Max seconds to wait for pending writes.
+        """
+        thread = self._thread
+        if thread is None or not thread.is_alive():
+            return
+
+        barrier = _Barrier(stop=True)
+        self._queue.put(barrier)
+        if not barrier.done.wait(timeout):
+            logger.warning("write_behind_stop_timeout", depth=self.depth)
+        thread.join(timeout)
+        logger.info("write_behind_stopped", **self.stats())
+
+    def stats(self) -> dict[str, Any]:
+        """Get queue depth, throughput and flush latency statistics."""
+        with self._stats_lock:
+            return {
+                "depth": self.depth,
+                "written": self._written,
+                "failed": self._failed,
+                "batches": self._batches,
+                "last_flush_latency_ms": round(self._last_flush_latency_ms, 2),
+                "max_flush_latency_ms": round(self._max_flush_latency_ms, 2),
+            }
+
+    def create_conversation(
+        self, conversation_id: str, title: str | None = None
+    ) -> None:
+        """Queue creation of a conversation.
+
+        Args:
+            conversation_id: ID of the new conversation.
+            title: Optional conversation title.
+        """
+        now = utc_now()
+
+        def op(session: Session) -> None:
+            session.add(
+                Conversation(
+                    id=conversation_id, title=title, created_at=now, updated_at=now
+                )
+            )
+
+        self._put(op)
+
+    def create_message(
+        self,
+        message_id: str,
+        conversation_id: str,
+        role: MessageRole,
+        content: str,
+        stt_latency_ms: int | None = None,
+        llm_latency_ms: int | None = None,
+        tts_latency_ms: int | None = None,
+    ) -> None:
+        """Queue creation of a message (and touch its conversation).
+
+        Args:
+            message_id: ID of the new message.
+            conversation_id: Parent conversation ID.
+            role: Message role (user or assistant).
+            content: Message text content.
+            stt_latency_ms: STT latency for user messages.
+            llm_latency_ms: LLM latency for assistant messages.
+            tts_latency_ms: TTS latency for assistant messages.
+        """
+        now = utc_now()
+
+        def op(session: Session) -> None:
+            session.add(
+                Message(
+                    id=message_id,
+                    conversation_id=conversation_id,
+                    role=role,
+                    content=content,
+                    stt_latency_ms=stt_latency_ms,
+                    llm_latency_ms=llm_latency_ms,
+                    tts_latency_ms=tts_latency_ms,
+                    created_at=now,
+                )
+            )
+            conversation = session.get(Conversation, conversation_id)
+            if conversation is not None:
+                conversation.updated_at = now
+                session.add(conversation)
+
+        self._put(op)
+
+    def update_conversation_title(self, conversation_id: str, title: str) -> None:
+        """Queue a conversation title update.
+
+        Args:
+            conversation_id: The conversation ID.
+            title: The new title.
+        """
+        now = utc_now()
+
+        def op(session: Session) -> None:
+            conversation = session.get(Conversation, conversation_id)
+            if conversation is not None:
+                conversation.title = title
+                conversation.updated_at = now
+                session.add(conversation)
+
+        self._put(op)
+
+    def _put(self, op: WriteOp) -> None:
+        self.start()
+        self._queue.put(op)
+
+    def _run(self) -> None:
+        """Writer thread: collect batches and commit them until stopped."""
+        while True:
+            batch: list[WriteOp] = []
+            barriers: list[_Barrier] = []
+
+            item = self._queue.get()
+            deadline = time.monotonic() + self.flush_interval_ms / 1000
+            while True:
+                if isinstance(item, _Barrier):
+                    barriers.append(item)
+                    break
+                batch.append(item)
+                if len(batch) >= self.max_batch_size:
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+
+            if batch:
+                self._write_batch(batch)
+
+            for barrier in barriers:
+                barrier.done.set()
+            if any(barrier.stop for barrier in barriers):
+                return
+
+    def _write_batch(self, batch: list[WriteOp]) -> None:
+        """Commit a batch in one transaction, falling back to one-by-one."""
+        start_time = time.perf_counter()
+        written = 0
+        try:
+            with Session(get_engine()) as session:
+                for op in batch:
+                    op(session)
+                session.commit()
+            written = len(batch)
+        except Exception as e:
+            logger.error(
+                "write_behind_batch_error", batch_size=len(batch), error=str(e)
+            )
+            # Retry individually so one bad write does not drop the others
+            for op in batch:
+                try:
+                    with Session(get_engine()) as session:
+                        op(session)
+                        session.commit()
+                    written += 1
+                except Exception as op_error:
+                    logger.error("write_behind_write_error", error=str(op_error))
+
+        latency_ms = (time.perf_counter() - start_time) * 1000
+        with self._stats_lock:
+            self._written += written
+            self._failed += len(batch) - written
+            self._batches += 1
+            self._last_flush_latency_ms = latency_ms
+            self._max_flush_latency_ms = max(self._max_flush_latency_ms, latency_ms)
+
+        logger.debug(
+            "write_behind_flushed",
+            batch_size=len(batch),
+            written=written,
+            latency_ms=round(latency_ms, 2),
+            depth=self.depth,
+        )
+
+
+# Process-wide queue (created on first use, thread-safe)
+_write_behind_queue: WriteBehindQueue | None = None
+_write_behind_queue_lock = threading.Lock()
+
+
+def get_write_behind_queue() -> WriteBehindQueue:
+    """Get or create the process-wide write-behind queue."""
+    global _write_behind_queue
+    if _write_behind_queue is None:
+        with _write_behind_queue_lock:
+            # Double-check locking pattern
+            if _write_behind_queue is None:
+                _write_behind_queue = WriteBehindQueue(
+                    flush_interval_ms=settings.db_flush_interval_ms,
+                    max_batch_size=settings.db_max_batch_size,
+                )
+    return _write_behind_queue
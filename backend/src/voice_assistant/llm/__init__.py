@@ -1,6 +1,7 @@
 """LLM service layer for voice assistant."""
 
 from voice_assistant.llm.base import BaseLLM, ConversationContext
+from voice_assistant.llm.delta_coalescer import DeltaCoalescer
 from voice_assistant.llm.openai_compat import OpenAICompatLLM
 
-__all__ = ["BaseLLM", "ConversationContext", "OpenAICompatLLM"]
+__all__ = ["BaseLLM", "ConversationContext", "DeltaCoalescer", "OpenAICompatLLM"]
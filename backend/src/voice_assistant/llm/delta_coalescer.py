@@ -0,0 +1,89 @@
+"""Coalescing of streamed LLM tokens into fewer llm.delta frames."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+
+
+class DeltaCoalescer:
+    """Batches streamed LLM tokens into fewer outgoing delta frames.
+
+    The first token is sent immediately so time-to-first-token is preserved.
+    Later tokens are buffered and sent as one frame once ``flush_ms`` has
+    elapsed since the buffer started filling, or once it holds at least
+    ``flush_chars`` characters, whichever comes first.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[str], Awaitable[None]],
+        flush_ms: float = 50.0,
+        flush_chars: int = 32,
+    ) -> None:
+        """Initialize the coalescer.
+
+        Args:
+            send: Coroutine function that sends one delta frame.
+            flush_ms: Max time a token waits in the buffer (0 disables batching).
+            flush_chars: Buffered characters that trigger an immediate flush.
+        """
+        self._send = send
+        self._flush_interval = flush_ms / 1000
+        self._flush_chars = flush_chars
+        self._buffer: list[str] = []
+        self._buffered_chars = 0
+        self._timer: asyncio.Task[None] | None = None
+        self._send_lock = asyncio.Lock()
+        self.token_count = 0
+        self.frame_count = 0
+
+    async def add(self, token: str) -> None:
+        """Add a token, sending a frame if a flush condition is met.
+
+        Args:
+            token: Token text from the LLM stream.
+        """
+        self.token_count += 1
+        self._buffer.append(token)
+        self._buffered_chars += len(token)
+
+        if (
+            self.frame_count == 0
+            or self._flush_interval <= 0
+            or self._buffered_chars >= self._flush_chars
+        ):
+            await self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.create_task(self._flush_after_interval())
+
+    async def flush(self) -> None:
+        """Send any buffered tokens now (e.g. at the end of the stream)."""
+        self._cancel_timer()
+        await self._send_buffer()
+
+    def close(self) -> None:
+        """Stop the pending timed flush without sending buffered tokens."""
+        self._cancel_timer()
+
+    def _cancel_timer(self) -> None:
+        # Only cancelled while still sleeping; a timer that started sending
+        # has already cleared self._timer, so a send is never interrupted.
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    async def _flush_after_interval(self) -> None:
+        await asyncio.sleep(self._flush_interval)
+        self._timer = None
+        await self._send_buffer()
+
+    async def _send_buffer(self) -> None:
+        # The lock keeps frames in order when a timed flush and an explicit
+        # flush overlap on a slow socket.
+        async with self._send_lock:
+            if not self._buffer:
+                return
+            text = "".join(self._buffer)
+            self._buffer = []
+            self._buffered_chars = 0
+            self.frame_count += 1
+            await self._send(text)
@@ -95,6 +95,13 @@ class OpenAICompatLLM(BaseLLM):
             stream=True,
         )
 
-        async for chunk in stream:
-            if chunk.choices and chunk.choices[0].delta.content:
-                yield chunk.choices[0].delta.content
+        try:
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        finally:
+            # Release the HTTP connection (also on cancellation / early exit)
+            # so the server stops generating tokens nobody will read.
+            close = getattr(stream, "close", None)
+            if close is not None:
+                await close()
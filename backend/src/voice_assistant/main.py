@@ -1,21 +1,38 @@
 """FastAPI application entry point for Voice Assistant"""
 
-from collections.abc import AsyncGenerator
+import asyncio
+import time
+from collections.abc import AsyncGenerator, Callable
 from contextlib import asynccontextmanager
 from datetime import datetime
+from typing import Any
 
 from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 from sqlmodel import Session
 
+from voice_assistant.api.websocket import (
+    close_stt_service,
+    get_audio_bank,
+    get_stt_service,
+    get_tts_pipeline_stats,
+    get_tts_service,
+    peek_audio_bank,
+    peek_stt_service,
+    peek_tts_service,
+)
 from voice_assistant.api.websocket import router as ws_router
 from voice_assistant.core.config import settings
+from voice_assistant.core.executor import set_torch_threads
 from voice_assistant.core.logging import configure_logging, get_logger
+from voice_assistant.core.readiness import readiness
 from voice_assistant.db import (
     ConversationRepository,
     MessageRepository,
     get_engine,
+    get_write_behind_queue,
     init_db,
 )
 
@@ -68,16 +85,95 @@ class ConversationListResponse(BaseModel):
     meta: ConversationListMeta
 
 
+async def _warm_up(name: str, get_service: Callable[[], Any]) -> None:
+    """Load and warm up one engine, recording the outcome in readiness."""
+    readiness.set_state(name, "loading")
+    start_time = time.perf_counter()
+    try:
+        service = await asyncio.to_thread(get_service)
+        await service.warmup()
+    except Exception as e:
+        readiness.set_state(name, "failed", error=str(e))
+        logger.error("model_warmup_failed", component=name, error=str(e))
+        return
+
+    warmup_ms = round((time.perf_counter() - start_time) * 1000, 2)
+    readiness.set_state(name, "ready", warmup_ms=warmup_ms)
+    logger.info("model_warmed_up", component=name, warmup_ms=warmup_ms)
+
+
+async def preload_models() -> None:
+    """Load and warm up the STT and TTS engines concurrently."""
+    await asyncio.gather(
+        _warm_up("stt", get_stt_service),
+        _warm_up("tts", get_tts_service),
+    )
+
+
+async def build_audio_bank() -> None:
+    """Render (or load from disk) the fixed utterances of the audio bank."""
+    readiness.set_state("audio_bank", "loading")
+    try:
+        tts = await asyncio.to_thread(get_tts_service)
+        identity = await asyncio.to_thread(tts.model_identity)
+        if identity is None:
+            raise RuntimeError("TTS model files not found")
+        if not settings.preload_models:
+            # Load the model on the TTS executor; synthesize() would load it
+            # on the event loop and block startup for the whole load
+            await tts.warmup()
+        model_hash, sample_rate = identity
+        # Clips are stale when the voice changes, not only the model files
+        model_version = (
+            f"{model_hash}:speaker={tts.speaker_id}:style={tts.style}"
+            f":rate={sample_rate}"
+        )
+        bank = get_audio_bank()
+        await bank.build(tts, model_version=model_version)
+    except Exception as e:
+        readiness.set_state("audio_bank", "failed", error=str(e))
+        logger.error("audio_bank_build_failed", error=str(e))
+        return
+    readiness.set_state("audio_bank", "ready", entries=bank.stats()["entries"])
+
+
+async def run_startup_tasks() -> None:
+    """Preload models, then build the audio bank (each if enabled)."""
+    if settings.preload_models:
+        await preload_models()
+    if settings.tts_audio_bank:
+        await build_audio_bank()
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan context manager for startup/shutdown."""
     # Startup
     configure_logging()
+    # torch's intra-op thread count is process-wide: set it before any model
+    set_torch_threads(settings.torch_threads)
     # Initialize database
     init_db()
     logger.info("database_initialized")
+    # Start the write-behind writer thread for conversation persistence
+    get_write_behind_queue().start()
+    # Warm up models in the background; the server accepts requests (and
+    # reports not-ready on /api/v1/ready) while they load
+    readiness.reset()
+    startup_task = None
+    if settings.preload_models:
+        readiness.register("stt")
+        readiness.register("tts")
+    if settings.tts_audio_bank:
+        readiness.register("audio_bank")
+    if settings.preload_models or settings.tts_audio_bank:
+        startup_task = asyncio.create_task(run_startup_tasks())
     yield
-    # Shutdown (nothing to clean up for now)
+    if startup_task is not None and not startup_task.done():
+        startup_task.cancel()
+    # Shutdown: stop STT worker processes, commit queued conversation writes
+    close_stt_service()
+    get_write_behind_queue().stop()
 
 
 app = FastAPI(
@@ -113,6 +209,41 @@ async def health_check() -> dict[str, str]:
     return {"status": "ok"}
 
 
+@app.get("/api/v1/ready")
+async def readiness_check() -> JSONResponse:
+    """Readiness endpoint for load balancers.
+
+    Unlike the health check, this reports 503 until preloaded models are
+    loaded and warmed up (see settings.preload_models).
+
+    Returns:
+        Overall status and per-component states; 200 when ready, else 503.
+    """
+    return JSONResponse(
+        readiness.snapshot(), status_code=200 if readiness.is_ready else 503
+    )
+
+
+@app.get("/api/v1/metrics")
+async def get_metrics() -> dict[str, Any]:
+    """Runtime metrics for tuning the voice pipeline.
+
+    Engines and the audio bank are reported only once they exist; reading
+    metrics never loads a model.
+
+    Returns:
+        dict of per-component statistics (None for components not created).
+    """
+    stt, tts, bank = peek_stt_service(), peek_tts_service(), peek_audio_bank()
+    return {
+        "persistence": get_write_behind_queue().stats(),
+        "stt": stt.stats() if stt is not None else None,
+        "tts": tts.stats() if tts is not None else None,
+        "tts_pipeline": get_tts_pipeline_stats(),
+        "audio_bank": bank.stats() if bank is not None else None,
+    }
+
+
 @app.get("/api/v1/conversations")
 async def list_conversations(
     limit: int = Query(default=20, ge=1, le=100),
@@ -127,6 +258,8 @@ async def list_conversations(
     Returns:
         List of conversations with pagination metadata.
     """
+    # Include messages still in the write-behind queue
+    await get_write_behind_queue().flush_async()
     with Session(get_engine()) as session:
         conv_repo = ConversationRepository(session)
         conversations = conv_repo.list_all(limit=limit, offset=offset)
@@ -160,6 +293,8 @@ async def get_latest_conversation() -> ConversationResponse | None:
     Raises:
         HTTPException: If no conversations exist (404).
     """
+    # Include messages still in the write-behind queue
+    await get_write_behind_queue().flush_async()
     with Session(get_engine()) as session:
         conv_repo = ConversationRepository(session)
         msg_repo = MessageRepository(session)
@@ -203,6 +338,8 @@ async def get_conversation(conversation_id: str) -> ConversationResponse:
     Raises:
         HTTPException: If conversation not found (404).
     """
+    # Include messages still in the write-behind queue
+    await get_write_behind_queue().flush_async()
     with Session(get_engine()) as session:
         conv_repo = ConversationRepository(session)
         msg_repo = MessageRepository(session)
@@ -252,6 +389,8 @@ async def delete_conversation(conversation_id: str) -> DeleteResponse:
     Raises:
         HTTPException: 404 if conversation not found
     """
+    # Include messages still in the write-behind queue
+    await get_write_behind_queue().flush_async()
     engine = get_engine()
     with Session(engine) as session:
         repo = ConversationRepository(session)
@@ -1,11 +1,29 @@
 """STT (Speech-to-Text) module for voice assistant."""
 
-from voice_assistant.stt.base import BaseSTT, TranscriptionResult
+from voice_assistant.core.batching import BatchScheduler
+from voice_assistant.stt.base import STT_SAMPLE_RATE, BaseSTT, TranscriptionResult
+from voice_assistant.stt.cache import TranscriptCache
+from voice_assistant.stt.process_pool import ProcessPoolSTT, WorkerCrashedError
+from voice_assistant.stt.quantization import quantize_encoder
 from voice_assistant.stt.reazon_speech import ReazonSpeechSTT, get_stt_device
+from voice_assistant.stt.segmentation import split_segments
+from voice_assistant.stt.speech_gate import GateResult, SpeechGate
+from voice_assistant.stt.streaming import WindowedSTTStream, stitch_transcripts
 
 __all__ = [
+    "STT_SAMPLE_RATE",
+    "BatchScheduler",
     "BaseSTT",
     "TranscriptionResult",
+    "TranscriptCache",
     "ReazonSpeechSTT",
+    "ProcessPoolSTT",
+    "WorkerCrashedError",
     "get_stt_device",
+    "quantize_encoder",
+    "GateResult",
+    "SpeechGate",
+    "WindowedSTTStream",
+    "split_segments",
+    "stitch_transcripts",
 ]
@@ -2,6 +2,13 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from voice_assistant.stt.streaming import PartialCallback, WindowedSTTStream
+
+# Sample rate STT engines are fed (uplink audio is resampled to it)
+STT_SAMPLE_RATE = 16000
 
 
 @dataclass
@@ -17,15 +24,69 @@ class BaseSTT(ABC):
 
     @abstractmethod
     async def transcribe(
-        self, audio_data: bytes, sample_rate: int
+        self,
+        audio_data: bytes | memoryview,
+        sample_rate: int,
+        use_cache: bool = True,
     ) -> TranscriptionResult:
         """Transcribe audio data to text.
 
         Args:
-            audio_data: Raw audio bytes (Float32Array from frontend).
+            audio_data: Raw float32 audio (Float32Array from frontend), as
+                bytes or a memoryview (read without copying).
             sample_rate: Sample rate of the audio in Hz.
+            use_cache: Look up and store the result in the engine's
+                transcript cache, if it has one (False for one-off audio
+                such as streaming windows).
 
         Returns:
             TranscriptionResult with text and latency information.
         """
         pass
+
+    async def warmup(self) -> None:
+        """Prepare the engine so the first real request is fast.
+
+        Engines that load models lazily should load them here and run a
+        short inference. The default does nothing.
+        """
+        return None
+
+    def stats(self) -> dict[str, Any]:
+        """Get engine statistics for the metrics endpoint (none by default)."""
+        return {}
+
+    def close(self) -> None:
+        """Release resources such as worker processes (none by default)."""
+        return None
+
+    def create_stream(
+        self,
+        on_partial: "PartialCallback | None" = None,
+        partial_interval_ms: float = 1000.0,
+        window_sec: float = 8.0,
+        overlap_sec: float = 1.0,
+    ) -> "WindowedSTTStream":
+        """Start an incremental transcription session for one utterance.
+
+        The default implementation decodes overlapping windows with
+        ``transcribe``; engines with native streaming can override it.
+
+        Args:
+            on_partial: Coroutine function called with updated partial text.
+            partial_interval_ms: New audio needed before the next partial decode.
+            window_sec: Window length at which a transcript is committed.
+            overlap_sec: Audio re-decoded at the start of the next window.
+
+        Returns:
+            A stream to feed audio chunks into and finish at end of speech.
+        """
+        from voice_assistant.stt.streaming import WindowedSTTStream
+
+        return WindowedSTTStream(
+            self,
+            on_partial=on_partial,
+            partial_interval_ms=partial_interval_ms,
+            window_sec=window_sec,
+            overlap_sec=overlap_sec,
+        )
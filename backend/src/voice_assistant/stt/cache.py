@@ -0,0 +1,204 @@
+"""Content-addressed cache of STT transcripts."""
+
+import asyncio
+import hashlib
+import os
+import sys
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from voice_assistant.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class TranscriptCache:
+    """LRU cache of transcripts keyed by a hash of the audio samples.
+
+    Identical audio (retries after transient errors, client resends,
+    replayed benchmark traffic) is transcribed once. The in-memory tier is
+    bounded by ``max_bytes``; the optional disk tier under ``disk_dir``
+    survives restarts and refills the memory tier on a hit.
+    """
+
+    def __init__(
+        self, max_bytes: int = 16 * 1024 * 1024, disk_dir: Path | None = None
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_bytes: Memory budget for keys and transcripts.
+            disk_dir: Directory for the disk tier (None keeps memory only).
+        """
+        self.max_bytes = max_bytes
+        self.disk_dir = Path(disk_dir) if disk_dir is not None else None
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @staticmethod
+    def key(audio: np.ndarray, sample_rate: int, model_version: str) -> str:
+        """Build the cache key for an utterance.
+
+        Args:
+            audio: Float32 samples (hashed without copying).
+            sample_rate: Sample rate of the audio in Hz.
+            model_version: Identifies the model and decoding settings.
+
+        Returns:
+            Hex key (BLAKE2b over the raw samples, rate and model version).
+        """
+        digest = hashlib.blake2b(digest_size=20)
+        digest.update(f"{model_version}|{sample_rate}|".encode())
+        digest.update(
+            memoryview(np.ascontiguousarray(audio, dtype=np.float32)).cast("B")
+        )
+        return digest.hexdigest()
+
+    def get(self, key: str) -> str | None:
+        """Look up a transcript (memory first, then disk).
+
+        Args:
+            key: Key from ``key()``.
+
+        Returns:
+            The cached transcript, or None on a miss.
+        """
+        text = self._get_memory(key)
+        if text is None:
+            text = self._get_disk(key)
+        return text
+
+    async def get_async(self, key: str) -> str | None:
+        """Look up a transcript like ``get()``, without blocking the loop.
+
+        Memory hits return inline; the disk tier is read in a thread.
+
+        Args:
+            key: Key from ``key()``.
+
+        Returns:
+            The cached transcript, or None on a miss.
+        """
+        text = self._get_memory(key)
+        if text is None:
+            if self.disk_dir is None:
+                return self._get_disk(key)
+            text = await asyncio.to_thread(self._get_disk, key)
+        return text
+
+    def put(self, key: str, text: str) -> None:
+        """Store a transcript in memory and, if enabled, on disk.
+
+        Args:
+            key: Key from ``key()``.
+            text: Transcript to cache.
+        """
+        with self._lock:
+            self._insert(key, text)
+        self._write_disk(key, text)
+
+    async def put_async(self, key: str, text: str) -> None:
+        """Store a transcript like ``put()``, writing the disk tier in a thread.
+
+        Args:
+            key: Key from ``key()``.
+            text: Transcript to cache.
+        """
+        with self._lock:
+            self._insert(key, text)
+        if self.disk_dir is not None:
+            await asyncio.to_thread(self._write_disk, key, text)
+
+    def stats(self) -> dict[str, Any]:
+        """Get hit rate and memory usage."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self._hits,
+                "disk_hits": self._disk_hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+                "disk": str(self.disk_dir) if self.disk_dir is not None else None,
+            }
+
+    @staticmethod
+    def _entry_size(key: str, text: str) -> int:
+        return sys.getsizeof(key) + sys.getsizeof(text)
+
+    def _insert(self, key: str, text: str) -> None:
+        """Add or refresh an entry and evict LRU entries over budget (locked)."""
+        size = self._entry_size(key, text)
+        if size > self.max_bytes:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes -= self._entry_size(key, previous)
+        self._entries[key] = text
+        self._bytes += size
+        while self._bytes > self.max_bytes:
+            old_key, old_text = self._entries.popitem(last=False)
+            self._bytes -= self._entry_size(old_key, old_text)
+            self._evictions += 1
+
+    def _get_memory(self, key: str) -> str | None:
+        """Look up the memory tier (a miss is counted by ``_get_disk``)."""
+        with self._lock:
+            text = self._entries.get(key)
+            if text is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+            return text
+
+    def _get_disk(self, key: str) -> str | None:
+        """Look up the disk tier and refill the memory tier on a hit."""
+        text = self._read_disk(key)
+        with self._lock:
+            if text is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._disk_hits += 1
+            self._insert(key, text)
+        return text
+
+    def _disk_path(self, key: str) -> Path | None:
+        if self.disk_dir is None:
+            return None
+        return self.disk_dir / key[:2] / f"{key}.txt"
+
+    def _read_disk(self, key: str) -> str | None:
+        path = self._disk_path(key)
+        if path is None:
+            return None
+        try:
+            return path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning("stt_cache_read_error", path=str(path), error=str(e))
+            return None
+
+    def _write_disk(self, key: str, text: str) -> None:
+        path = self._disk_path(key)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(text, encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("stt_cache_write_error", path=str(path), error=str(e))
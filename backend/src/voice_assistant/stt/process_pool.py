@@ -0,0 +1,387 @@
+"""STT backend running the model in worker processes."""
+
+import asyncio
+import multiprocessing
+import os
+import signal
+import time
+from collections.abc import Callable
+from multiprocessing.connection import Connection
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any
+
+import numpy as np
+
+from voice_assistant.core.logging import get_logger
+from voice_assistant.stt.base import BaseSTT, TranscriptionResult
+
+logger = get_logger(__name__)
+
+# Picklable, module-level callable that builds the in-process engine
+EngineFactory = Callable[[], BaseSTT]
+
+
+def _worker_main(conn: Connection, engine_factory: EngineFactory) -> None:
+    """Worker process: build and warm up an engine, then serve requests.
+
+    Requests are ``(request_id, shm_name, n_samples, sample_rate,
+    use_cache)``; the audio is read from the shared memory block. Replies are
+    ``(request_id, "ok", text)`` or ``(request_id, "error", message)``.
+    ``None`` or a closed pipe ends the worker.
+    """
+    # The parent owns shutdown; don't die on the terminal's Ctrl-C
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    loop = asyncio.new_event_loop()
+    try:
+        start_time = time.perf_counter()
+        engine = engine_factory()
+        loop.run_until_complete(engine.warmup())
+        warmup_ms = (time.perf_counter() - start_time) * 1000
+    except Exception as e:
+        conn.send((None, "error", f"{type(e).__name__}: {e}"))
+        return
+    conn.send((None, "ready", os.getpid(), warmup_ms))
+
+    while True:
+        try:
+            request = conn.recv()
+        except (EOFError, OSError):
+            break
+        if request is None:
+            break
+
+        request_id, shm_name, n_samples, sample_rate, use_cache = request
+        try:
+            shm = SharedMemory(name=shm_name)
+            try:
+                view = np.ndarray((n_samples,), dtype=np.float32, buffer=shm.buf)
+                # Private copy so no view of the block outlives the request
+                audio = view.copy()
+                del view
+            finally:
+                shm.close()
+            result = loop.run_until_complete(
+                engine.transcribe(audio, sample_rate, use_cache=use_cache)
+            )
+            conn.send((request_id, "ok", result.text))
+        except Exception as e:
+            conn.send((request_id, "error", f"{type(e).__name__}: {e}"))
+    loop.close()
+
+
+class WorkerCrashedError(RuntimeError):
+    """Raised when a worker process dies or hangs during a request."""
+
+
+class _Worker:
+    """One worker process and the parent's end of its pipe."""
+
+    def __init__(self, index: int) -> None:
+        self.index = index
+        self.process: multiprocessing.process.BaseProcess | None = None
+        self.conn: Connection | None = None
+        self.pid: int | None = None
+
+    @property
+    def alive(self) -> bool:
+        return self.process is not None and self.process.is_alive()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Ask the worker to exit, killing it if it does not."""
+        if self.conn is not None:
+            try:
+                self.conn.send(None)
+            except (OSError, ValueError):
+                pass
+            self.conn.close()
+            self.conn = None
+        if self.process is not None:
+            self.process.join(timeout)
+            if self.process.is_alive():
+                self.process.kill()
+                self.process.join()
+            self.process = None
+
+
+class ProcessPoolSTT(BaseSTT):
+    """STT service that runs N model-holding worker processes.
+
+    Keeps model pre/post-processing off the server's GIL and isolates
+    crashes: a worker that dies (or exceeds ``request_timeout_sec``) fails
+    only its current request at once and is restarted in the background
+    (loading and warming up its model again) while the other workers keep
+    serving; it takes requests again once it is warm.
+
+    Audio is copied once into a ``multiprocessing.shared_memory`` block and
+    read in place by the worker; only the block name and the result text
+    cross the pipe.
+    """
+
+    def __init__(
+        self,
+        engine_factory: EngineFactory,
+        workers: int = 2,
+        request_timeout_sec: float | None = 60.0,
+        start_timeout_sec: float = 600.0,
+    ) -> None:
+        """Initialize the pool (processes start on first use or warmup()).
+
+        Args:
+            engine_factory: Module-level function building the engine in
+                each worker (must be importable by spawned processes).
+            workers: Number of worker processes.
+            request_timeout_sec: Max time per request before the worker is
+                killed and restarted (None waits indefinitely).
+            start_timeout_sec: Max time for a worker to load its model.
+        """
+        self._engine_factory = engine_factory
+        self._workers = [_Worker(i) for i in range(max(1, workers))]
+        self._request_timeout = request_timeout_sec
+        self._start_timeout = start_timeout_sec
+        self._context = multiprocessing.get_context("spawn")
+        self._idle: asyncio.Queue[_Worker] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._start_lock: asyncio.Lock | None = None
+        self._started = False
+        self._restart_tasks: set[asyncio.Task[None]] = set()
+        self._next_request_id = 0
+        self._requests = 0
+        self._errors = 0
+        self._restarts = 0
+        self._total_ms = 0.0
+        self._max_ms = 0.0
+
+    async def warmup(self) -> None:
+        """Start all workers and wait until their models are warm."""
+        await self._ensure_started()
+
+    async def transcribe(
+        self,
+        audio_data: bytes | memoryview,
+        sample_rate: int,
+        use_cache: bool = True,
+    ) -> TranscriptionResult:
+        """Transcribe audio on the next idle worker.
+
+        Args:
+            audio_data: Raw float32 audio, as bytes or a memoryview.
+            sample_rate: Sample rate of the audio in Hz.
+            use_cache: Use the worker engine's transcript cache.
+
+        Returns:
+            TranscriptionResult; latency_ms includes queueing for a worker.
+
+        Raises:
+            WorkerCrashedError: If the worker died or timed out.
+            RuntimeError: If the engine raised in the worker.
+        """
+        audio = np.frombuffer(audio_data, dtype=np.float32)
+        if len(audio) == 0:
+            return TranscriptionResult(text="", latency_ms=0.0)
+
+        start_time = time.perf_counter()
+        await self._ensure_started()
+        worker = await self._acquire()
+        try:
+            reply = await self._request(worker, audio, sample_rate, use_cache)
+        except WorkerCrashedError:
+            # Fail now; the slot rejoins the pool once its model is warm
+            self._errors += 1
+            self._schedule_restart(worker)
+            raise
+        except BaseException:
+            self._release(worker)
+            raise
+        self._release(worker)
+
+        latency_ms = (time.perf_counter() - start_time) * 1000
+        self._requests += 1
+        self._total_ms += latency_ms
+        self._max_ms = max(self._max_ms, latency_ms)
+        _, status, payload = reply
+        if status == "error":
+            self._errors += 1
+            raise RuntimeError(f"STT worker {worker.index} failed: {payload}")
+        return TranscriptionResult(text=payload, latency_ms=latency_ms)
+
+    def stats(self) -> dict[str, Any]:
+        """Get worker liveness, restart and request statistics."""
+        return {
+            "workers": len(self._workers),
+            "alive": sum(w.alive for w in self._workers),
+            "idle": self._idle.qsize() if self._idle is not None else 0,
+            "restarts": self._restarts,
+            "requests": self._requests,
+            "errors": self._errors,
+            "avg_latency_ms": (
+                round(self._total_ms / self._requests, 2) if self._requests else 0.0
+            ),
+            "max_latency_ms": round(self._max_ms, 2),
+        }
+
+    def close(self) -> None:
+        """Stop all worker processes (and restarts still in progress)."""
+        for task in list(self._restart_tasks):
+            task.cancel()
+        for worker in self._workers:
+            worker.stop()
+        self._started = False
+
+    async def _ensure_started(self) -> None:
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Queues and locks belong to one event loop
+            self._loop = loop
+            self._idle = asyncio.Queue()
+            self._start_lock = asyncio.Lock()
+            for worker in self._workers:
+                if worker.alive:
+                    self._idle.put_nowait(worker)
+        if self._started:
+            return
+
+        assert self._start_lock is not None and self._idle is not None
+        async with self._start_lock:
+            if self._started:
+                return
+            pending = [w for w in self._workers if not w.alive]
+            await asyncio.gather(*(self._spawn(w) for w in pending))
+            for worker in pending:
+                self._idle.put_nowait(worker)
+            self._started = True
+
+    async def _spawn(self, worker: _Worker) -> None:
+        """Start a worker process and wait for its model to be warm."""
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(
+            target=_worker_main,
+            args=(child_conn, self._engine_factory),
+            name=f"stt-worker-{worker.index}",
+            daemon=True,
+        )
+        process.start()
+        # Only the child holds its end, so a crash shows up as EOF here
+        child_conn.close()
+        worker.process = process
+        worker.conn = parent_conn
+
+        try:
+            reply = await self._receive(parent_conn, self._start_timeout, None)
+        except WorkerCrashedError:
+            worker.stop(timeout=0)
+            raise
+        if reply[1] != "ready":
+            worker.stop()
+            raise RuntimeError(f"STT worker {worker.index} failed to start: {reply[2]}")
+
+        worker.pid = reply[2]
+        logger.info(
+            "stt_worker_started",
+            worker=worker.index,
+            pid=worker.pid,
+            warmup_ms=round(reply[3], 2),
+        )
+
+    async def _acquire(self) -> _Worker:
+        """Wait for an idle live worker, restarting dead ones found idle."""
+        assert self._idle is not None
+        while True:
+            worker = await self._idle.get()
+            if worker.alive:
+                return worker
+            self._schedule_restart(worker)
+            # Wait for another worker only if one is running or restarting
+            others = [w for w in self._workers if w is not worker]
+            if not any(w.alive for w in others) and len(self._restart_tasks) == 1:
+                raise WorkerCrashedError("no STT worker is running")
+
+    def _release(self, worker: _Worker) -> None:
+        assert self._idle is not None
+        self._idle.put_nowait(worker)
+
+    def _schedule_restart(self, worker: _Worker) -> None:
+        """Restart a worker in the background; it is idle again once ready."""
+        task = asyncio.create_task(self._restart(worker))
+        self._restart_tasks.add(task)
+        task.add_done_callback(self._restart_tasks.discard)
+
+    async def _restart(self, worker: _Worker) -> None:
+        """Replace a crashed or hung worker with a fresh process."""
+        exitcode = worker.process.exitcode if worker.process is not None else None
+        logger.error(
+            "stt_worker_crashed", worker=worker.index, pid=worker.pid, exitcode=exitcode
+        )
+        worker.stop(timeout=0)
+        self._restarts += 1
+        try:
+            await self._spawn(worker)
+        except asyncio.CancelledError:
+            worker.stop(timeout=0)
+            raise
+        except Exception as e:
+            # Returned dead; the next request that picks it retries the start
+            logger.error("stt_worker_restart_failed", worker=worker.index, error=str(e))
+        self._release(worker)
+
+    async def _request(
+        self, worker: _Worker, audio: np.ndarray, sample_rate: int, use_cache: bool
+    ) -> tuple[Any, ...]:
+        """Send one utterance to a worker through shared memory."""
+        if worker.conn is None:
+            raise WorkerCrashedError(f"STT worker {worker.index} is not running")
+
+        self._next_request_id += 1
+        request_id = self._next_request_id
+        shm = SharedMemory(create=True, size=audio.nbytes)
+        try:
+            view = np.ndarray(audio.shape, dtype=np.float32, buffer=shm.buf)
+            view[:] = audio
+            del view
+            try:
+                worker.conn.send(
+                    (request_id, shm.name, len(audio), sample_rate, use_cache)
+                )
+            except (OSError, ValueError) as e:
+                raise WorkerCrashedError(str(e)) from e
+            return await self._receive(worker.conn, self._request_timeout, request_id)
+        finally:
+            # Unlinking while a worker still has it mapped is safe
+            shm.close()
+            shm.unlink()
+
+    async def _receive(
+        self, conn: Connection, timeout: float | None, request_id: int | None
+    ) -> tuple[Any, ...]:
+        """Wait for the reply to ``request_id`` without blocking the loop.
+
+        Replies to earlier requests whose callers were cancelled (e.g. on
+        barge-in) are discarded.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while True:
+            remaining = None if deadline is None else deadline - loop.time()
+            await self._wait_readable(conn, remaining)
+            try:
+                reply = conn.recv()
+            except (EOFError, OSError) as e:
+                raise WorkerCrashedError("worker process exited") from e
+            if reply[0] == request_id:
+                return reply
+
+    async def _wait_readable(self, conn: Connection, timeout: float | None) -> None:
+        loop = asyncio.get_running_loop()
+        readable = loop.create_future()
+
+        def on_readable() -> None:
+            if not readable.done():
+                readable.set_result(None)
+
+        fd = conn.fileno()
+        loop.add_reader(fd, on_readable)
+        try:
+            await asyncio.wait_for(readable, timeout)
+        except TimeoutError as e:
+            raise WorkerCrashedError(f"no reply within {timeout}s") from e
+        finally:
+            loop.remove_reader(fd)
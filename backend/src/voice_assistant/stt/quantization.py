@@ -0,0 +1,112 @@
+"""Int8 dynamic quantization of the STT encoder for CPU inference."""
+
+import hashlib
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+import torch
+
+from voice_assistant.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Values sampled per tensor when fingerprinting weights
+_FINGERPRINT_SAMPLES = 64
+
+
+def module_fingerprint(module: torch.nn.Module) -> str:
+    """Cheap fingerprint of a module's weights.
+
+    Hashes parameter names, shapes and a strided sample of each tensor
+    (plus the torch version, since pickled quantized modules are not
+    portable across releases) instead of every weight.
+
+    Args:
+        module: Module to fingerprint.
+
+    Returns:
+        Hex digest identifying the weights.
+    """
+    digest = hashlib.sha256(torch.__version__.encode())
+    digest.update(type(module).__qualname__.encode())
+    with torch.no_grad():
+        for name, tensor in module.state_dict().items():
+            digest.update(name.encode())
+            digest.update(str(tuple(tensor.shape)).encode())
+            flat = tensor.detach().reshape(-1)
+            if flat.numel() == 0 or not flat.dtype.is_floating_point:
+                continue
+            step = max(1, flat.numel() // _FINGERPRINT_SAMPLES)
+            sample = flat[::step][:_FINGERPRINT_SAMPLES].to("cpu", torch.float32)
+            digest.update(sample.numpy().tobytes())
+    return digest.hexdigest()
+
+
+def quantize_encoder(model: Any, cache_dir: Path | None = None) -> bool:
+    """Replace ``model.encoder`` with an int8 dynamically quantized copy.
+
+    All ``nn.Linear`` layers are quantized, which covers the feed-forward
+    modules and the attention q/k/v/output projections of the Conformer
+    encoder. Weights are int8; activations are quantized on the fly, so no
+    calibration data is needed. The decoder and joint network (small,
+    latency-insensitive) stay in float32.
+
+    The quantized encoder is pickled to ``cache_dir`` keyed by the float
+    weights' fingerprint, so later starts load it instead of quantizing.
+
+    Args:
+        model: Loaded float32 NeMo ASR model on CPU (with an ``encoder``).
+        cache_dir: Directory for quantized encoders (None disables caching).
+
+    Returns:
+        True if the quantized encoder was loaded from the cache.
+    """
+    start_time = time.perf_counter()
+    encoder = model.encoder.eval()
+    cache_path = None
+    if cache_dir is not None:
+        cache_path = (
+            Path(cache_dir) / f"encoder-int8-{module_fingerprint(encoder)[:16]}.pt"
+        )
+
+    if cache_path is not None and cache_path.exists():
+        try:
+            model.encoder = torch.load(cache_path, weights_only=False)
+            model.encoder.eval()
+            logger.info(
+                "stt_quantized_encoder_loaded",
+                path=str(cache_path),
+                load_ms=round((time.perf_counter() - start_time) * 1000, 2),
+            )
+            return True
+        except Exception as e:
+            logger.warning(
+                "stt_quantized_cache_invalid", path=str(cache_path), error=str(e)
+            )
+
+    # In place: avoids holding a second float32 copy of the encoder
+    quantized = torch.ao.quantization.quantize_dynamic(
+        encoder, {torch.nn.Linear}, dtype=torch.qint8, inplace=True
+    )
+    model.encoder = quantized
+    quantize_ms = (time.perf_counter() - start_time) * 1000
+
+    if cache_path is not None:
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            torch.save(quantized, tmp_path)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            logger.warning(
+                "stt_quantized_cache_write_error", path=str(cache_path), error=str(e)
+            )
+
+    logger.info(
+        "stt_encoder_quantized",
+        quantize_ms=round(quantize_ms, 2),
+        cache_path=str(cache_path) if cache_path else None,
+    )
+    return False
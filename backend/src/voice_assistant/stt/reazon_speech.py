@@ -1,7 +1,11 @@
 """ReazonSpeech NeMo v2 STT implementation."""
 
 import asyncio
+import tempfile
 import time
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Any
 
 # Workaround for ml_dtypes compatibility issue (see Issue #16)
 # nemo-toolkit expects float4/float8 types which are only in ml_dtypes >= 0.5.0
@@ -25,11 +29,21 @@ for _dtype in _missing_types:
 import numpy as np
 import torch
 
+from voice_assistant.core.batching import BatchScheduler
+from voice_assistant.core.executor import InferenceExecutor
 from voice_assistant.core.logging import get_logger
-from voice_assistant.stt.base import BaseSTT, TranscriptionResult
+from voice_assistant.stt.base import STT_SAMPLE_RATE, BaseSTT, TranscriptionResult
+from voice_assistant.stt.cache import TranscriptCache
+from voice_assistant.stt.quantization import quantize_encoder
+from voice_assistant.stt.segmentation import split_segments
+from voice_assistant.stt.speech_gate import SpeechGate
+from voice_assistant.stt.streaming import stitch_transcripts
 
 logger = get_logger(__name__)
 
+# Model loaded by reazonspeech.nemo.asr.load_model (part of cache keys)
+MODEL_NAME = "reazon-research/reazonspeech-nemo-v2"
+
 
 def get_stt_device() -> str:
     """Determine the best device for STT processing.
@@ -47,18 +61,92 @@ class ReazonSpeechSTT(BaseSTT):
 
     This service uses ReazonSpeech NeMo v2 model for Japanese speech recognition.
     The model is lazily loaded on first transcription request.
+
+    Utterances from concurrent sessions are micro-batched: requests arriving
+    within ``batch_wait_ms`` of each other share one padded forward pass.
+
+    If a ``speech_gate`` is given, edge silence is trimmed before inference
+    and utterances without speech return empty text without touching the
+    model.
+
+    Utterances longer than ``segment_sec`` are split at pauses into
+    overlapping segments that are decoded concurrently (as batches through
+    the same scheduler) and stitched, instead of one long forward pass.
+    Segments only overlap in time with more than one executor worker or
+    with batching enabled.
+
+    With ``quantize`` (CPU only) the encoder is converted to int8 dynamic
+    quantization after loading; see ``quantize_encoder``.
+
+    With a ``cache``, audio identical to an earlier utterance returns the
+    cached transcript without gating, loading or inference.
     """
 
-    def __init__(self, device: str | None = None):
+    def __init__(
+        self,
+        device: str | None = None,
+        max_batch_size: int = 1,
+        batch_wait_ms: float = 20.0,
+        speech_gate: SpeechGate | None = None,
+        segment_sec: float | None = 15.0,
+        segment_overlap_sec: float = 0.5,
+        executor: InferenceExecutor | None = None,
+        quantize: bool = False,
+        quantized_cache_dir: Path | None = None,
+        cache: TranscriptCache | None = None,
+    ):
         """Initialize the STT service.
 
         Args:
             device: Device to use for inference ("cuda" or "cpu").
                    If None, automatically detects the best device.
+            max_batch_size: Max utterances decoded in one forward pass
+                   (1 disables batching).
+            batch_wait_ms: Max time an utterance waits for others to batch with.
+            speech_gate: Optional gate for silence trimming and skipping.
+            segment_sec: Max audio per forward pass; longer utterances are
+                segmented (None disables long-form mode).
+            segment_overlap_sec: Audio shared by neighbouring segments.
+            executor: Worker pool for model loading and inference
+                (default: a dedicated single-worker pool).
+            quantize: Quantize the encoder to int8 after loading (CPU only).
+            quantized_cache_dir: Where quantized encoders are cached
+                (None disables the disk cache).
+            cache: Optional transcript cache keyed by the audio samples.
         """
         self.device = device or get_stt_device()
+        self.quantize = quantize
+        self.quantized_cache_dir = quantized_cache_dir
+        self.speech_gate = speech_gate
+        self.segment_sec = segment_sec
+        self.segment_overlap_sec = segment_overlap_sec
+        self.cache = cache
+        self._long_form_utterances = 0
+        self._long_form_segments = 0
         self._model = None
         self._model_lock = asyncio.Lock()
+        self._executor = executor or InferenceExecutor("stt")
+        self._scheduler = BatchScheduler(
+            self._transcribe_arrays,
+            max_batch_size=max_batch_size,
+            max_wait_ms=batch_wait_ms,
+            name="stt",
+            executor=self._executor,
+        )
+
+    @property
+    def model_version(self) -> str:
+        """Model and decoding settings that affect the transcript."""
+        precision = "int8" if self.quantize and self.device == "cpu" else "fp32"
+        version = f"{MODEL_NAME}:{precision}:segment={self.segment_sec}"
+        if self.speech_gate is not None:
+            # The gate trims the audio the model sees, so its settings count
+            gate = self.speech_gate
+            version += (
+                f":gate={gate.threshold_db}/{gate.min_speech_ms}"
+                f"/{gate.pad_ms}/{gate.frame_ms}"
+            )
+        return version
 
     @property
     def is_model_loaded(self) -> bool:
@@ -79,23 +167,57 @@ class ReazonSpeechSTT(BaseSTT):
 
             from reazonspeech.nemo.asr import load_model
 
-            self._model = await asyncio.to_thread(load_model, device=self.device)
+            model = await self._executor.run(load_model, device=self.device)
+            quantized = False
+            if self.quantize:
+                if self.device == "cpu":
+                    await self._executor.run(
+                        quantize_encoder, model, self.quantized_cache_dir
+                    )
+                    quantized = True
+                else:
+                    # Dynamic int8 kernels only exist for CPU
+                    logger.warning("stt_quantize_skipped", device=self.device)
+            self._model = model
 
             load_time_ms = (time.perf_counter() - start_time) * 1000
             logger.info(
                 "reazon_speech_model_loaded",
                 device=self.device,
+                quantized=quantized,
                 load_time_ms=round(load_time_ms, 2),
             )
 
+    async def warmup(self) -> None:
+        """Load the model and decode a short synthetic clip.
+
+        Runs the single-utterance path and, when batching is enabled, the
+        batched path, bypassing the scheduler so its stats stay clean.
+        """
+        await self._ensure_model_loaded()
+
+        from reazonspeech.nemo.asr import audio_from_numpy
+
+        rng = np.random.default_rng(0)
+        clip = 0.01 * rng.standard_normal(STT_SAMPLE_RATE).astype(np.float32)
+        audio = audio_from_numpy(clip, STT_SAMPLE_RATE)
+        await self._executor.run(self._transcribe_batch, [audio])
+        if self._scheduler.max_batch_size > 1:
+            await self._executor.run(self._transcribe_batch, [audio, audio])
+
     async def transcribe(
-        self, audio_data: bytes, sample_rate: int
+        self,
+        audio_data: bytes | memoryview,
+        sample_rate: int,
+        use_cache: bool = True,
     ) -> TranscriptionResult:
         """Transcribe audio data to text using ReazonSpeech.
 
         Args:
-            audio_data: Raw audio bytes (Float32Array from frontend).
+            audio_data: Raw float32 audio (Float32Array from frontend), as
+                bytes or a memoryview (read without copying).
             sample_rate: Sample rate of the audio in Hz.
+            use_cache: Use the transcript cache (if configured).
 
         Returns:
             TranscriptionResult with transcribed text and latency.
@@ -105,25 +227,156 @@ class ReazonSpeechSTT(BaseSTT):
         if len(audio_array) == 0:
             return TranscriptionResult(text="", latency_ms=0.0)
 
-        await self._ensure_model_loaded()
-
         start_time = time.perf_counter()
 
-        from reazonspeech.nemo.asr import audio_from_numpy, transcribe
+        cache_key = None
+        if use_cache and self.cache is not None:
+            cache_key = self.cache.key(audio_array, sample_rate, self.model_version)
+            cached = await self.cache.get_async(cache_key)
+            if cached is not None:
+                latency_ms = (time.perf_counter() - start_time) * 1000
+                logger.info(
+                    "stt_cache_hit",
+                    text_length=len(cached),
+                    latency_ms=round(latency_ms, 3),
+                )
+                return TranscriptionResult(text=cached, latency_ms=latency_ms)
+
+        if self.speech_gate is not None:
+            gate = self.speech_gate.process(audio_array, sample_rate)
+            audio_ms = len(audio_array) / sample_rate * 1000
+            if not gate.has_speech:
+                # No speech: skip model loading and inference entirely
+                logger.info(
+                    "stt_skipped_no_speech",
+                    audio_ms=round(audio_ms, 2),
+                    speech_ms=gate.speech_ms,
+                )
+                latency_ms = (time.perf_counter() - start_time) * 1000
+                return TranscriptionResult(text="", latency_ms=latency_ms)
+
+            trimmed_ms = audio_ms - (gate.end - gate.start) / sample_rate * 1000
+            if trimmed_ms > 0:
+                logger.debug(
+                    "stt_silence_trimmed",
+                    leading_ms=round(gate.start / sample_rate * 1000, 2),
+                    trailing_ms=round(
+                        (len(audio_array) - gate.end) / sample_rate * 1000, 2
+                    ),
+                    trimmed_ms=round(trimmed_ms, 2),
+                )
+            audio_array = audio_array[gate.start : gate.end]
+
+        await self._ensure_model_loaded()
+
+        segments = [(0, len(audio_array))]
+        if self.segment_sec is not None:
+            segments = split_segments(
+                audio_array,
+                sample_rate,
+                segment_sec=self.segment_sec,
+                overlap_sec=self.segment_overlap_sec,
+            )
 
-        audio = audio_from_numpy(audio_array, sample_rate)
+        if len(segments) == 1:
+            text = await self._scheduler.submit((audio_array, sample_rate))
+        else:
+            # Segments join the scheduler's batches like concurrent utterances
+            texts = await asyncio.gather(
+                *(
+                    self._scheduler.submit((audio_array[start:end], sample_rate))
+                    for start, end in segments
+                )
+            )
+            text = ""
+            for segment_text in texts:
+                text = stitch_transcripts(text, segment_text)
+            self._long_form_utterances += 1
+            self._long_form_segments += len(segments)
 
-        result = await asyncio.to_thread(transcribe, self._model, audio)
+        if cache_key is not None:
+            await self.cache.put_async(cache_key, text)
 
         latency_ms = (time.perf_counter() - start_time) * 1000
-        text = result.text if result.text else ""
 
         logger.info(
             "stt_completed",
             text=text[:50] if text else "",
             text_length=len(text),
             audio_duration_sec=round(len(audio_array) / sample_rate, 2),
+            segments=len(segments),
             latency_ms=round(latency_ms, 2),
         )
 
         return TranscriptionResult(text=text, latency_ms=latency_ms)
+
+    def stats(self) -> dict[str, Any]:
+        """Get batching, executor, long-form, gate and cache statistics."""
+        stats: dict[str, Any] = {
+            "batching": self._scheduler.stats(),
+            "executor": self._executor.stats(),
+            "long_form": {
+                "utterances": self._long_form_utterances,
+                "segments": self._long_form_segments,
+            },
+        }
+        if self.speech_gate is not None:
+            stats["speech_gate"] = self.speech_gate.stats()
+        if self.cache is not None:
+            stats["cache"] = self.cache.stats()
+        return stats
+
+    def _transcribe_arrays(self, items: list[tuple[np.ndarray, int]]) -> list[str]:
+        """Transcribe a batch of float32 utterances (blocking).
+
+        Args:
+            items: (samples, sample_rate) pairs.
+
+        Returns:
+            Transcribed text for each utterance, in order.
+        """
+        from reazonspeech.nemo.asr import audio_from_numpy
+
+        audios = [audio_from_numpy(audio, rate) for audio, rate in items]
+        return self._transcribe_batch(audios)
+
+    def _transcribe_batch(self, audios: list[Any]) -> list[str]:
+        """Transcribe a batch of utterances in one forward pass (blocking).
+
+        Mirrors ``reazonspeech.nemo.asr.transcribe`` (normalize, pad, write a
+        temporary WAV, decode hypotheses) but hands all files to the model at
+        once so NeMo pads them into a single batch.
+
+        Args:
+            audios: ReazonSpeech AudioData objects.
+
+        Returns:
+            Transcribed text for each utterance, in order.
+        """
+        from reazonspeech.nemo.asr import transcribe
+
+        if len(audios) == 1:
+            result = transcribe(self._model, audios[0])
+            return [result.text or ""]
+
+        from reazonspeech.nemo.asr.audio import audio_to_file, norm_audio, pad_audio
+        from reazonspeech.nemo.asr.decode import PAD_SECONDS, decode_hypothesis
+
+        with ExitStack() as stack:
+            paths = []
+            for audio in audios:
+                f = stack.enter_context(tempfile.NamedTemporaryFile(suffix=".wav"))
+                audio_to_file(f, pad_audio(norm_audio(audio), PAD_SECONDS))
+                paths.append(f.name)
+
+            hyps = self._model.transcribe(
+                paths,
+                batch_size=len(paths),
+                return_hypotheses=True,
+                verbose=False,
+            )
+
+        # RNNT models return (best_hypotheses, all_hypotheses)
+        if isinstance(hyps, tuple):
+            hyps = hyps[0]
+        return [decode_hypothesis(self._model, hyp).text or "" for hyp in hyps]
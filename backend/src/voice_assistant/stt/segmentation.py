@@ -0,0 +1,62 @@
+"""Splitting of long utterances into overlapping segments for STT."""
+
+import numpy as np
+
+
+def split_segments(
+    audio: np.ndarray,
+    sample_rate: int,
+    segment_sec: float = 15.0,
+    overlap_sec: float = 0.5,
+    search_sec: float = 2.0,
+    frame_ms: float = 20.0,
+) -> list[tuple[int, int]]:
+    """Split audio into overlapping segments cut at low-energy points.
+
+    Each cut is placed at the quietest frame within ``search_sec`` before the
+    nominal segment end, so words are rarely split. Neighbouring segments
+    share ``overlap_sec`` around the cut; their transcripts are joined with
+    ``stitch_transcripts``.
+
+    Args:
+        audio: Float32 samples.
+        sample_rate: Sample rate of the audio in Hz.
+        segment_sec: Max segment length.
+        overlap_sec: Audio shared by neighbouring segments.
+        search_sec: How far before the nominal end to look for a pause.
+        frame_ms: Energy analysis frame length.
+
+    Returns:
+        List of (start, end) sample ranges covering the audio in order
+        (a single range if the audio fits in one segment).
+    """
+    total = len(audio)
+    segment_len = int(segment_sec * sample_rate)
+    if segment_len <= 0 or total <= segment_len:
+        return [(0, total)]
+
+    half_overlap = int(overlap_sec * sample_rate) // 2
+    # Keep the search window well inside the segment so every cut progresses
+    search_len = min(int(search_sec * sample_rate), segment_len // 2)
+    frame_len = max(1, int(sample_rate * frame_ms / 1000))
+    n_frames = total // frame_len
+    energy = np.mean(
+        np.square(audio[: n_frames * frame_len].reshape(n_frames, frame_len)),
+        axis=1,
+        dtype=np.float64,
+    )
+
+    segments: list[tuple[int, int]] = []
+    start = 0
+    while total - start > segment_len:
+        # Latest cut that keeps the segment within segment_len
+        nominal_end = start + segment_len - half_overlap - frame_len
+        first = (nominal_end - search_len) // frame_len
+        last = max(first + 1, nominal_end // frame_len)
+        quietest = first + int(np.argmin(energy[first:last]))
+        cut = quietest * frame_len + frame_len // 2
+
+        segments.append((start, min(total, cut + half_overlap)))
+        start = max(start + 1, cut - half_overlap)
+    segments.append((start, total))
+    return segments
@@ -0,0 +1,119 @@
+"""Energy / zero-crossing speech gate applied before STT inference."""
+
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+
+@dataclass
+class GateResult:
+    """Speech region found in an utterance."""
+
+    start: int  # First sample to keep
+    end: int  # End sample (exclusive)
+    speech_ms: float  # Duration of frames classified as voiced speech
+
+    @property
+    def has_speech(self) -> bool:
+        """Whether any audio is left to transcribe."""
+        return self.end > self.start
+
+
+class SpeechGate:
+    """Trims edge silence and rejects utterances without speech.
+
+    Audio is split into short frames and classified with vectorized RMS
+    energy and zero-crossing rate:
+
+    - voiced: energy above ``threshold_db`` (dBFS)
+    - unvoiced: up to 10 dB quieter but with a high zero-crossing rate
+      (fricatives such as "s"/"sh" at word edges)
+
+    Everything before the first and after the last speech frame (plus
+    ``pad_ms``) is trimmed. Utterances with less than ``min_speech_ms`` of
+    voiced frames (clicks, coughs, breath) are rejected.
+    """
+
+    UNVOICED_MARGIN_DB = 10.0
+    UNVOICED_MIN_ZCR = 0.3
+
+    def __init__(
+        self,
+        threshold_db: float = -45.0,
+        min_speech_ms: float = 200.0,
+        pad_ms: float = 150.0,
+        frame_ms: float = 20.0,
+    ) -> None:
+        """Initialize the gate.
+
+        Args:
+            threshold_db: Frame RMS (dBFS) above which a frame is voiced.
+            min_speech_ms: Voiced audio required to run STT at all.
+            pad_ms: Audio kept around the detected speech.
+            frame_ms: Analysis frame length.
+        """
+        self.threshold_db = threshold_db
+        self.min_speech_ms = min_speech_ms
+        self.pad_ms = pad_ms
+        self.frame_ms = frame_ms
+        self._utterances = 0
+        self._skipped = 0
+        self._trimmed_ms = 0.0
+        self._skipped_ms = 0.0
+
+    def process(self, audio: np.ndarray, sample_rate: int) -> GateResult:
+        """Find the speech region of an utterance.
+
+        Args:
+            audio: Float32 samples in [-1, 1].
+            sample_rate: Sample rate of the audio in Hz.
+
+        Returns:
+            GateResult with the region to keep (empty if no speech).
+        """
+        self._utterances += 1
+        total_ms = len(audio) / sample_rate * 1000
+        frame_len = max(1, int(sample_rate * self.frame_ms / 1000))
+        n_frames = len(audio) // frame_len
+
+        result = GateResult(start=0, end=0, speech_ms=0.0)
+        if n_frames > 0:
+            frames = audio[: n_frames * frame_len].reshape(n_frames, frame_len)
+            rms = np.sqrt(np.mean(np.square(frames, dtype=np.float64), axis=1))
+            db = 20 * np.log10(np.maximum(rms, 1e-10))
+            signs = np.signbit(frames)
+            zcr = np.mean(signs[:, 1:] != signs[:, :-1], axis=1)
+
+            voiced = db >= self.threshold_db
+            unvoiced = (db >= self.threshold_db - self.UNVOICED_MARGIN_DB) & (
+                zcr >= self.UNVOICED_MIN_ZCR
+            )
+            speech_ms = float(np.count_nonzero(voiced)) * self.frame_ms
+
+            if speech_ms >= self.min_speech_ms:
+                speech = np.flatnonzero(voiced | unvoiced)
+                pad = int(sample_rate * self.pad_ms / 1000)
+                result = GateResult(
+                    start=max(0, int(speech[0]) * frame_len - pad),
+                    end=min(len(audio), (int(speech[-1]) + 1) * frame_len + pad),
+                    speech_ms=speech_ms,
+                )
+            else:
+                result.speech_ms = speech_ms
+
+        if result.has_speech:
+            self._trimmed_ms += total_ms - (result.end - result.start) / sample_rate * 1000
+        else:
+            self._skipped += 1
+            self._skipped_ms += total_ms
+        return result
+
+    def stats(self) -> dict[str, Any]:
+        """Get counts of skipped utterances and trimmed audio."""
+        return {
+            "utterances": self._utterances,
+            "skipped": self._skipped,
+            "trimmed_ms": round(self._trimmed_ms, 2),
+            "skipped_ms": round(self._skipped_ms, 2),
+        }
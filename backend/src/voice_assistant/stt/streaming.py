@@ -0,0 +1,206 @@
+"""Incremental (streaming) transcription over a batch STT model."""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from voice_assistant.core.logging import get_logger
+from voice_assistant.stt.base import STT_SAMPLE_RATE, TranscriptionResult
+
+if TYPE_CHECKING:
+    from voice_assistant.stt.base import BaseSTT
+
+logger = get_logger(__name__)
+
+# Called with the current best transcript of the utterance so far
+PartialCallback = Callable[[str], Awaitable[None]]
+
+
+def stitch_transcripts(prefix: str, text: str, max_overlap: int = 32) -> str:
+    """Join two transcripts of overlapping audio, dropping the repeated part.
+
+    The longest suffix of ``prefix`` that is also a prefix of ``text`` is
+    treated as the overlap and kept only once.
+
+    Args:
+        prefix: Transcript of the earlier audio.
+        text: Transcript of the later audio (starting inside the overlap).
+        max_overlap: Max characters considered as overlap.
+
+    Returns:
+        The combined transcript.
+    """
+    if not prefix:
+        return text
+    if not text:
+        return prefix
+
+    for size in range(min(len(prefix), len(text), max_overlap), 0, -1):
+        if prefix.endswith(text[:size]):
+            return prefix + text[size:]
+    return prefix + text
+
+
+class WindowedSTTStream:
+    """Streaming transcription session for one utterance.
+
+    Audio is fed chunk by chunk while the user is speaking. Every
+    ``partial_interval_ms`` of new audio the current window (audio since the
+    last committed point) is re-decoded in the background and reported via
+    ``on_partial``. Once a window reaches ``window_sec`` its transcript is
+    committed and the next window starts ``overlap_sec`` before its end, so
+    words cut at the boundary are decoded again and stitched.
+
+    ``finish()`` only has to decode the tail after the last committed window
+    (nothing at all if the latest partial already covered all audio).
+    """
+
+    def __init__(
+        self,
+        stt: "BaseSTT",
+        on_partial: PartialCallback | None = None,
+        partial_interval_ms: float = 1000.0,
+        window_sec: float = 8.0,
+        overlap_sec: float = 1.0,
+    ) -> None:
+        """Initialize the stream.
+
+        Args:
+            stt: Batch STT service used to decode each window.
+            on_partial: Coroutine function called with updated partial text.
+            partial_interval_ms: New audio needed before the next partial decode.
+            window_sec: Window length at which a transcript is committed.
+            overlap_sec: Audio re-decoded at the start of the next window.
+        """
+        self._stt = stt
+        self._on_partial = on_partial
+        self._partial_interval_sec = partial_interval_ms / 1000
+        self._window_sec = window_sec
+        self._overlap_sec = min(overlap_sec, window_sec / 2)
+        self._chunks: list[np.ndarray] = []
+        self._total_samples = 0
+        self.sample_rate = STT_SAMPLE_RATE
+        # Start of the current window and the text committed before it
+        self._window_start = 0
+        self._committed_text = ""
+        # Latest decode of the current window and the audio it covered
+        self._window_text = ""
+        self._window_end = 0
+        self._last_partial = ""
+        self._decode_task: asyncio.Task[None] | None = None
+        self._closed = False
+        self.partial_count = 0
+
+    @property
+    def duration_sec(self) -> float:
+        """Duration of the audio fed so far in seconds."""
+        return self._total_samples / self.sample_rate
+
+    def feed(self, audio_data: bytes | memoryview, sample_rate: int) -> None:
+        """Add an audio chunk, starting a partial decode if one is due.
+
+        Args:
+            audio_data: Raw float32 audio (bytes or a memoryview).
+            sample_rate: Sample rate of the audio in Hz.
+        """
+        if self._closed:
+            return
+
+        chunk = np.frombuffer(audio_data, dtype=np.float32)
+        if len(chunk) == 0:
+            return
+        self._chunks.append(chunk)
+        self._total_samples += len(chunk)
+        self.sample_rate = sample_rate
+
+        new_audio_sec = (self._total_samples - self._window_end) / sample_rate
+        decoding = self._decode_task is not None and not self._decode_task.done()
+        if self._on_partial is not None and not decoding:
+            if new_audio_sec >= self._partial_interval_sec:
+                self._decode_task = asyncio.create_task(self._decode_partial())
+
+    async def finish(self) -> TranscriptionResult:
+        """Transcribe the remaining tail and return the full utterance.
+
+        Returns:
+            TranscriptionResult with the stitched text and the time spent
+            after the end of speech.
+        """
+        start_time = time.perf_counter()
+        if self._decode_task is not None:
+            try:
+                await self._decode_task
+            except Exception:
+                # Already logged; the tail decode below covers that audio
+                pass
+        self._closed = True
+
+        tail_sec = 0.0
+        if self._window_end < self._total_samples:
+            tail_sec = (self._total_samples - self._window_start) / self.sample_rate
+            await self._decode_window(self._total_samples)
+
+        text = stitch_transcripts(self._committed_text, self._window_text)
+        latency_ms = (time.perf_counter() - start_time) * 1000
+
+        logger.info(
+            "stt_stream_completed",
+            text_length=len(text),
+            audio_duration_sec=round(self.duration_sec, 2),
+            tail_sec=round(tail_sec, 2),
+            partial_count=self.partial_count,
+            latency_ms=round(latency_ms, 2),
+        )
+
+        return TranscriptionResult(text=text, latency_ms=latency_ms)
+
+    def close(self) -> None:
+        """Discard the stream (e.g. the utterance was cancelled)."""
+        self._closed = True
+        if self._decode_task is not None and not self._decode_task.done():
+            self._decode_task.cancel()
+
+    def _audio(self) -> np.ndarray:
+        """Get all audio fed so far as one array."""
+        if len(self._chunks) > 1:
+            self._chunks = [np.concatenate(self._chunks)]
+        return self._chunks[0]
+
+    async def _decode_window(self, end: int) -> None:
+        """Decode the current window up to ``end`` and commit it if full."""
+        window = self._audio()[self._window_start : end]
+        # Windows are never decoded twice: caching them would only evict
+        # real transcripts (and write to the disk tier on every partial)
+        result = await self._stt.transcribe(
+            memoryview(window).cast("B"), self.sample_rate, use_cache=False
+        )
+        self._window_text = result.text
+        self._window_end = end
+
+        window_samples = int(self._window_sec * self.sample_rate)
+        if end - self._window_start >= window_samples:
+            self._committed_text = stitch_transcripts(
+                self._committed_text, self._window_text
+            )
+            self._window_start = end - int(self._overlap_sec * self.sample_rate)
+            self._window_text = ""
+            self._window_end = self._window_start
+
+    async def _decode_partial(self) -> None:
+        """Decode the audio received so far and report the partial text."""
+        try:
+            await self._decode_window(self._total_samples)
+        except Exception as e:
+            logger.warning("stt_partial_error", error=str(e))
+            return
+
+        text = stitch_transcripts(self._committed_text, self._window_text)
+        if self._closed or self._on_partial is None:
+            return
+        if text and text != self._last_partial:
+            self._last_partial = text
+            self.partial_count += 1
+            await self._on_partial(text)
@@ -1,14 +1,33 @@
 """TTS (Text-to-Speech) module for voice assistant."""
 
-from voice_assistant.tts.base import TTS_SAMPLE_RATE, BaseTTS, TTSResult
-from voice_assistant.tts.sentence_buffer import SentenceBuffer
+from voice_assistant.tts.audio_bank import AudioBank
+from voice_assistant.tts.base import (
+    TTS_FRAME_MS,
+    TTS_SAMPLE_RATE,
+    BaseTTS,
+    TTSResult,
+    iter_pcm16_frames,
+)
+from voice_assistant.tts.cache import PhraseCache, normalize_phrase
+from voice_assistant.tts.frontend_cache import TextFrontendCache
+from voice_assistant.tts.lookahead import ChunkGaps, LookaheadSynthesizer
+from voice_assistant.tts.sentence_buffer import SentenceBuffer, split_clauses
 from voice_assistant.tts.style_bert_vits2 import StyleBertVits2TTS, get_tts_device
 
 __all__ = [
+    "AudioBank",
+    "TTS_FRAME_MS",
     "TTS_SAMPLE_RATE",
     "BaseTTS",
     "TTSResult",
+    "iter_pcm16_frames",
+    "PhraseCache",
+    "normalize_phrase",
+    "TextFrontendCache",
+    "ChunkGaps",
+    "LookaheadSynthesizer",
     "SentenceBuffer",
+    "split_clauses",
     "StyleBertVits2TTS",
     "get_tts_device",
 ]
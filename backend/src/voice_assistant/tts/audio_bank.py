@@ -0,0 +1,177 @@
+"""Pre-rendered audio for fixed system utterances."""
+
+import json
+import os
+import time
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any
+
+from voice_assistant.core.logging import get_logger
+from voice_assistant.tts.base import BaseTTS, TTSResult
+
+logger = get_logger(__name__)
+
+MANIFEST_NAME = "manifest.json"
+
+
+class AudioBank:
+    """Fixed utterances (such as spoken error messages) rendered once.
+
+    ``build()`` synthesizes every utterance at startup and keeps the PCM16
+    audio in memory, so it can be played with no inference (even when live
+    synthesis is failing). With a ``disk_dir`` the audio is stored next to
+    a manifest recording the model version; later starts load it from
+    disk, and an utterance is only re-rendered when the model version
+    (model files and voice) or its text change.
+    """
+
+    def __init__(
+        self, utterances: Mapping[str, str], disk_dir: Path | None = None
+    ) -> None:
+        """Initialize an empty bank.
+
+        Args:
+            utterances: Utterance name -> text to render.
+            disk_dir: Directory for rendered audio (None keeps memory only).
+        """
+        self.utterances = dict(utterances)
+        self.disk_dir = Path(disk_dir) if disk_dir is not None else None
+        self.model_version: str | None = None
+        self._clips: dict[str, TTSResult] = {}
+        self._rendered = 0
+        self._loaded = 0
+        self._build_ms = 0.0
+        self._plays = 0
+
+    def get(self, name: str) -> TTSResult | None:
+        """Get a rendered utterance.
+
+        Args:
+            name: Utterance name.
+
+        Returns:
+            The clip (latency_ms is 0), or None if it is not in the bank.
+        """
+        clip = self._clips.get(name)
+        if clip is not None:
+            self._plays += 1
+        return clip
+
+    async def build(self, tts: BaseTTS, model_version: str) -> None:
+        """Render the utterances, reusing audio stored for the same model.
+
+        Args:
+            tts: Engine to render missing utterances with.
+            model_version: Identifies the model files and the voice the
+                clips are rendered in (speaker, style, sample rate).
+        """
+        start_time = time.perf_counter()
+        stored = self._read_manifest(model_version)
+        clips: dict[str, TTSResult] = {}
+        entries: dict[str, dict[str, Any]] = {}
+        rendered = loaded = 0
+
+        for name, text in self.utterances.items():
+            clip = None
+            entry = stored.get(name)
+            if entry is not None and entry.get("text") == text:
+                clip = self._read_clip(name, entry)
+            if clip is not None:
+                loaded += 1
+            else:
+                result = await tts.synthesize(text)
+                if not result.audio:
+                    logger.warning("audio_bank_render_empty", name=name)
+                    continue
+                clip = TTSResult(
+                    audio=result.audio, sample_rate=result.sample_rate, latency_ms=0.0
+                )
+                self._write_clip(name, clip)
+                rendered += 1
+            clips[name] = clip
+            entries[name] = {"text": text, "sample_rate": clip.sample_rate}
+
+        if rendered or set(entries) != set(stored):
+            self._write_manifest(model_version, entries)
+
+        self._clips = clips
+        self.model_version = model_version
+        self._rendered = rendered
+        self._loaded = loaded
+        self._build_ms = (time.perf_counter() - start_time) * 1000
+        logger.info(
+            "audio_bank_built",
+            entries=len(clips),
+            rendered=rendered,
+            loaded=loaded,
+            build_ms=round(self._build_ms, 2),
+        )
+
+    def stats(self) -> dict[str, Any]:
+        """Get bank size and build statistics."""
+        return {
+            "entries": len(self._clips),
+            "bytes": sum(len(clip.audio) for clip in self._clips.values()),
+            "model_version": self.model_version,
+            "rendered": self._rendered,
+            "loaded": self._loaded,
+            "build_ms": round(self._build_ms, 2),
+            "plays": self._plays,
+        }
+
+    def _read_manifest(self, model_version: str) -> dict[str, dict[str, Any]]:
+        """Get stored entries if they were rendered by this model version."""
+        if self.disk_dir is None:
+            return {}
+        path = self.disk_dir / MANIFEST_NAME
+        try:
+            manifest = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning("audio_bank_manifest_invalid", path=str(path), error=str(e))
+            return {}
+        if manifest.get("model_version") != model_version:
+            logger.info("audio_bank_model_changed", path=str(path))
+            return {}
+        return manifest.get("entries", {})
+
+    def _write_manifest(
+        self, model_version: str, entries: dict[str, dict[str, Any]]
+    ) -> None:
+        if self.disk_dir is None:
+            return
+        path = self.disk_dir / MANIFEST_NAME
+        manifest = {"model_version": model_version, "entries": entries}
+        try:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(
+                json.dumps(manifest, ensure_ascii=False, indent=2), encoding="utf-8"
+            )
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("audio_bank_write_error", path=str(path), error=str(e))
+
+    def _read_clip(self, name: str, entry: dict[str, Any]) -> TTSResult | None:
+        if self.disk_dir is None:
+            return None
+        try:
+            audio = (self.disk_dir / f"{name}.pcm").read_bytes()
+            sample_rate = int(entry["sample_rate"])
+        except (OSError, KeyError, TypeError, ValueError):
+            return None
+        return TTSResult(audio=audio, sample_rate=sample_rate, latency_ms=0.0)
+
+    def _write_clip(self, name: str, clip: TTSResult) -> None:
+        if self.disk_dir is None:
+            return
+        path = self.disk_dir / f"{name}.pcm"
+        try:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_bytes(clip.audio)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("audio_bank_write_error", path=str(path), error=str(e))
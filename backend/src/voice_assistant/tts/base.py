@@ -1,11 +1,15 @@
 """Base class for TTS (Text-to-Speech) services."""
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Iterator
 from dataclasses import dataclass
 
 # Default sample rate for TTS audio output
 TTS_SAMPLE_RATE = 44100
 
+# Default duration of streamed PCM frames
+TTS_FRAME_MS = 200.0
+
 
 @dataclass
 class TTSResult:
@@ -16,6 +20,30 @@ class TTSResult:
     latency_ms: float  # Processing time in milliseconds
 
 
+def iter_pcm16_frames(
+    audio: bytes, sample_rate: int, frame_ms: float = TTS_FRAME_MS
+) -> Iterator[bytes]:
+    """Split PCM16 audio into fixed-duration frames.
+
+    Args:
+        audio: PCM16 audio data.
+        sample_rate: Sample rate in Hz.
+        frame_ms: Frame duration (0 or less yields the audio as one frame).
+
+    Yields:
+        Frames of ``frame_ms`` audio (the last one may be shorter).
+    """
+    frame_bytes = int(sample_rate * frame_ms / 1000) * 2
+    if frame_bytes <= 0:
+        if audio:
+            yield audio
+        return
+
+    view = memoryview(audio)
+    for offset in range(0, len(audio), frame_bytes):
+        yield bytes(view[offset : offset + frame_bytes])
+
+
 class BaseTTS(ABC):
     """Abstract base class for TTS services."""
 
@@ -30,3 +58,35 @@ class BaseTTS(ABC):
             TTSResult with audio data and latency information.
         """
         pass
+
+    async def warmup(self) -> None:
+        """Prepare the engine so the first real request is fast.
+
+        Engines that load models lazily should load them here and run a
+        short inference. The default does nothing.
+        """
+        return None
+
+    async def synthesize_stream(
+        self, text: str, frame_ms: float = TTS_FRAME_MS
+    ) -> AsyncIterator[TTSResult]:
+        """Synthesize text to speech, yielding audio frames as they are ready.
+
+        The default implementation synthesizes the whole text and then splits
+        it; engines that can synthesize incrementally should override this.
+
+        Args:
+            text: Text to synthesize.
+            frame_ms: Duration of each yielded frame in milliseconds.
+
+        Yields:
+            TTSResult per PCM16 frame; latency_ms is the time until that
+            frame was ready.
+        """
+        result = await self.synthesize(text)
+        for frame in iter_pcm16_frames(result.audio, result.sample_rate, frame_ms):
+            yield TTSResult(
+                audio=frame,
+                sample_rate=result.sample_rate,
+                latency_ms=result.latency_ms,
+            )
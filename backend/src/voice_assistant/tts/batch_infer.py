@@ -0,0 +1,195 @@
+"""Batched Style-BERT-VITS2 inference (several texts per forward pass)."""
+
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import torch
+
+if TYPE_CHECKING:
+    from voice_assistant.tts.frontend_cache import TextFrontendCache
+
+
+@dataclass
+class TextFeatures:
+    """Model inputs for one text (phoneme-level sequences of length T)."""
+
+    phones: torch.Tensor  # (T,)
+    tones: torch.Tensor  # (T,)
+    lang_ids: torch.Tensor  # (T,)
+    bert: torch.Tensor  # (hidden, T)
+    ja_bert: torch.Tensor  # (hidden, T)
+    en_bert: torch.Tensor  # (hidden, T)
+
+
+@dataclass
+class BatchOutput:
+    """Audio per text plus how much of the padded batch was real input."""
+
+    audios: list[np.ndarray]
+    tokens: int
+    padded_tokens: int
+
+
+def get_net_g(model: Any) -> Any:
+    """Get the synthesizer network of a loaded ``TTSModel``."""
+    # Public in newer releases, name-mangled (__net_g) in older ones
+    net_g = getattr(model, "net_g", None) or getattr(model, "_TTSModel__net_g", None)
+    if net_g is None:
+        raise RuntimeError("TTS model is not loaded")
+    return net_g
+
+
+def text_features(
+    model: Any, text: str, frontend: "TextFrontendCache | None" = None
+) -> TextFeatures:
+    """Run the text front-end (G2P and BERT features) for one text.
+
+    Args:
+        model: Loaded ``TTSModel``.
+        text: Text to synthesize.
+        frontend: Optional cache of earlier front-end outputs.
+
+    Returns:
+        The model inputs for the text.
+    """
+    if frontend is not None:
+        cached = frontend.get(text)
+        if cached is not None:
+            return cached
+
+    from style_bert_vits2.constants import Languages
+    from style_bert_vits2.models.infer import get_text
+
+    start_time = time.perf_counter()
+    bert, ja_bert, en_bert, phones, tones, lang_ids = get_text(
+        text, Languages.JP, model.hyper_parameters, model.device
+    )
+    features = TextFeatures(phones, tones, lang_ids, bert, ja_bert, en_bert)
+    if frontend is not None:
+        frontend.put(text, features, (time.perf_counter() - start_time) * 1000)
+    return features
+
+
+def pad_features(
+    features: list[TextFeatures], device: str | torch.device = "cpu"
+) -> dict[str, torch.Tensor]:
+    """Zero-pad per-text inputs into batch tensors.
+
+    Args:
+        features: Inputs of each text.
+        device: Device for the batch tensors.
+
+    Returns:
+        Tensors ``x`` / ``tones`` / ``lang_ids`` of shape (B, T_max),
+        ``bert`` / ``ja_bert`` / ``en_bert`` of shape (B, hidden, T_max) and
+        ``x_lengths`` of shape (B,).
+    """
+    lengths = [f.phones.size(0) for f in features]
+    max_len = max(lengths)
+    batch: dict[str, torch.Tensor] = {
+        "x_lengths": torch.tensor(lengths, dtype=torch.long, device=device)
+    }
+    for name, key in (("x", "phones"), ("tones", "tones"), ("lang_ids", "lang_ids")):
+        padded = torch.zeros(len(features), max_len, dtype=torch.long, device=device)
+        for i, f in enumerate(features):
+            padded[i, : lengths[i]] = getattr(f, key)
+        batch[name] = padded
+    for key in ("bert", "ja_bert", "en_bert"):
+        first = getattr(features[0], key)
+        padded = torch.zeros(
+            len(features), first.size(0), max_len, dtype=first.dtype, device=device
+        )
+        for i, f in enumerate(features):
+            padded[i, :, : lengths[i]] = getattr(f, key)
+        batch[key] = padded
+    return batch
+
+
+def split_audio(
+    audio: torch.Tensor, y_mask: torch.Tensor, hop_length: int
+) -> list[np.ndarray]:
+    """Cut a padded batch of waveforms back into per-text audio.
+
+    Args:
+        audio: Decoder output of shape (B, 1, samples).
+        y_mask: Spectrogram frame mask of shape (B, 1, frames).
+        hop_length: Waveform samples per spectrogram frame.
+
+    Returns:
+        Float32 audio per text, trimmed to its own frame count.
+    """
+    frames = y_mask.reshape(y_mask.size(0), -1).sum(dim=1).long().tolist()
+    return [
+        audio[i, 0, : n * hop_length].detach().float().cpu().numpy()
+        for i, n in enumerate(frames)
+    ]
+
+
+def infer_batch(
+    model: Any,
+    texts: list[str],
+    speaker_id: int,
+    style_vector: np.ndarray,
+    frontend: "TextFrontendCache | None" = None,
+) -> BatchOutput:
+    """Synthesize several texts in one padded forward pass (blocking).
+
+    Mirrors ``TTSModel.infer`` with default parameters: each output is
+    peak-normalized like the single-text path.
+
+    Args:
+        model: Loaded ``TTSModel``.
+        texts: Texts to synthesize.
+        speaker_id: Speaker for every text.
+        style_vector: Style embedding for every text.
+        frontend: Optional cache of text front-end outputs.
+
+    Returns:
+        Float32 audio in [-1, 1] per text and padding statistics.
+    """
+    from style_bert_vits2.constants import (
+        DEFAULT_LENGTH,
+        DEFAULT_NOISE,
+        DEFAULT_NOISEW,
+        DEFAULT_SDP_RATIO,
+    )
+
+    hps = model.hyper_parameters
+    net_g = get_net_g(model)
+    device = model.device
+    features = [text_features(model, text, frontend) for text in texts]
+
+    with torch.no_grad():
+        batch = pad_features(features, device)
+        size = len(texts)
+        sid = torch.full((size,), speaker_id, dtype=torch.long, device=device)
+        style = torch.from_numpy(np.asarray(style_vector, dtype=np.float32))
+        style = style.to(device).unsqueeze(0).expand(size, -1)
+        params = {
+            "style_vec": style,
+            "sdp_ratio": DEFAULT_SDP_RATIO,
+            "noise_scale": DEFAULT_NOISE,
+            "noise_scale_w": DEFAULT_NOISEW,
+            "length_scale": DEFAULT_LENGTH,
+        }
+        args = [batch["x"], batch["x_lengths"], sid, batch["tones"], batch["lang_ids"]]
+        if hps.version.endswith("JP-Extra"):
+            output = net_g.infer(*args, batch["ja_bert"], **params)
+        else:
+            output = net_g.infer(
+                *args, batch["bert"], batch["ja_bert"], batch["en_bert"], **params
+            )
+        # (audio, attention, y_mask, latents)
+        audio, y_mask = output[0], output[2]
+        audios = split_audio(audio, y_mask, hps.data.hop_length)
+
+    normalized = []
+    for wav in audios:
+        peak = float(np.abs(wav).max()) if wav.size else 0.0
+        normalized.append(wav / peak if peak > 0 else wav)
+    lengths = [f.phones.size(0) for f in features]
+    return BatchOutput(
+        audios=normalized, tokens=sum(lengths), padded_tokens=size * max(lengths)
+    )
@@ -0,0 +1,238 @@
+"""Cache of synthesized audio for repeated phrases."""
+
+import asyncio
+import hashlib
+import os
+import re
+import sys
+import threading
+import unicodedata
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+from voice_assistant.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_phrase(text: str) -> str:
+    """Normalize text for cache lookups without changing its reading.
+
+    NFKC folds full-width/half-width variants (the synthesizer's own
+    front-end applies the same folding) and whitespace is collapsed.
+
+    Args:
+        text: Text to be synthesized.
+
+    Returns:
+        The normalized text.
+    """
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFKC", text)).strip()
+
+
+class PhraseCache:
+    """LRU cache of PCM16 audio keyed by phrase and voice.
+
+    Assistant replies repeat greetings, confirmations and stock phrases;
+    a hit returns the earlier audio without inference. The in-memory tier
+    is bounded by ``max_bytes``; the optional disk tier under ``disk_dir``
+    stores raw PCM files that survive restarts and refill the memory tier
+    on a hit. Only phrases up to ``max_chars`` characters are cached, since
+    long sentences rarely repeat.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 64 * 1024 * 1024,
+        disk_dir: Path | None = None,
+        max_chars: int = 40,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_bytes: Memory budget for keys and audio.
+            disk_dir: Directory for the disk tier (None keeps memory only).
+            max_chars: Longest normalized phrase that is cached.
+        """
+        self.max_bytes = max_bytes
+        self.disk_dir = Path(disk_dir) if disk_dir is not None else None
+        self.max_chars = max_chars
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def key(
+        self,
+        text: str,
+        model_version: str,
+        speaker_id: int,
+        style: str,
+        sample_rate: int,
+    ) -> str | None:
+        """Build the cache key for a phrase.
+
+        Args:
+            text: Text to be synthesized.
+            model_version: Hash of the model files.
+            speaker_id: Speaker the audio is synthesized with.
+            style: Style the audio is synthesized with.
+            sample_rate: Sample rate of the audio in Hz.
+
+        Returns:
+            Hex key, or None if the phrase is too long to cache.
+        """
+        phrase = normalize_phrase(text)
+        if not phrase or len(phrase) > self.max_chars:
+            return None
+        digest = hashlib.blake2b(digest_size=20)
+        digest.update(
+            f"{model_version}|{speaker_id}|{style}|{sample_rate}|{phrase}".encode()
+        )
+        return digest.hexdigest()
+
+    def get(self, key: str) -> bytes | None:
+        """Look up audio (memory first, then disk).
+
+        Args:
+            key: Key from ``key()``.
+
+        Returns:
+            The cached PCM16 audio, or None on a miss.
+        """
+        audio = self._get_memory(key)
+        if audio is None:
+            audio = self._get_disk(key)
+        return audio
+
+    async def get_async(self, key: str) -> bytes | None:
+        """Look up audio like ``get()``, without blocking the event loop.
+
+        Memory hits return inline; the disk tier is read in a thread.
+
+        Args:
+            key: Key from ``key()``.
+
+        Returns:
+            The cached PCM16 audio, or None on a miss.
+        """
+        audio = self._get_memory(key)
+        if audio is None:
+            if self.disk_dir is None:
+                return self._get_disk(key)
+            audio = await asyncio.to_thread(self._get_disk, key)
+        return audio
+
+    def put(self, key: str, audio: bytes) -> None:
+        """Store audio in memory and, if enabled, on disk.
+
+        Args:
+            key: Key from ``key()``.
+            audio: PCM16 audio to cache.
+        """
+        with self._lock:
+            self._insert(key, audio)
+        self._write_disk(key, audio)
+
+    async def put_async(self, key: str, audio: bytes) -> None:
+        """Store audio like ``put()``, writing the disk tier in a thread.
+
+        Args:
+            key: Key from ``key()``.
+            audio: PCM16 audio to cache.
+        """
+        with self._lock:
+            self._insert(key, audio)
+        if self.disk_dir is not None:
+            await asyncio.to_thread(self._write_disk, key, audio)
+
+    def stats(self) -> dict[str, Any]:
+        """Get hit rate and memory usage."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self._hits,
+                "disk_hits": self._disk_hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+                "disk": str(self.disk_dir) if self.disk_dir is not None else None,
+            }
+
+    @staticmethod
+    def _entry_size(key: str, audio: bytes) -> int:
+        return sys.getsizeof(key) + sys.getsizeof(audio)
+
+    def _insert(self, key: str, audio: bytes) -> None:
+        """Add or refresh an entry and evict LRU entries over budget (locked)."""
+        size = self._entry_size(key, audio)
+        if size > self.max_bytes:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes -= self._entry_size(key, previous)
+        self._entries[key] = audio
+        self._bytes += size
+        while self._bytes > self.max_bytes:
+            old_key, old_audio = self._entries.popitem(last=False)
+            self._bytes -= self._entry_size(old_key, old_audio)
+            self._evictions += 1
+
+    def _get_memory(self, key: str) -> bytes | None:
+        """Look up the memory tier (a miss is counted by ``_get_disk``)."""
+        with self._lock:
+            audio = self._entries.get(key)
+            if audio is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+            return audio
+
+    def _get_disk(self, key: str) -> bytes | None:
+        """Look up the disk tier and refill the memory tier on a hit."""
+        audio = self._read_disk(key)
+        with self._lock:
+            if audio is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._disk_hits += 1
+            self._insert(key, audio)
+        return audio
+
+    def _disk_path(self, key: str) -> Path | None:
+        if self.disk_dir is None:
+            return None
+        return self.disk_dir / key[:2] / f"{key}.pcm"
+
+    def _read_disk(self, key: str) -> bytes | None:
+        path = self._disk_path(key)
+        if path is None:
+            return None
+        try:
+            return path.read_bytes()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning("tts_cache_read_error", path=str(path), error=str(e))
+            return None
+
+    def _write_disk(self, key: str, audio: bytes) -> None:
+        path = self._disk_path(key)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_bytes(audio)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("tts_cache_write_error", path=str(path), error=str(e))
@@ -0,0 +1,104 @@
+"""Cache of text front-end outputs (G2P and BERT features) per text."""
+
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import fields
+from typing import Any
+
+from voice_assistant.tts.batch_infer import TextFeatures
+from voice_assistant.tts.cache import normalize_phrase
+
+
+class TextFrontendCache:
+    """LRU cache of phonemes, tones and BERT features keyed by text.
+
+    Before the acoustic model runs, every text goes through normalization,
+    pyopenjtalk G2P and a forward pass of the large DeBERTa BERT model. For
+    a text seen before, a hit returns those inputs so only the acoustic
+    model runs. Streaming synthesizes long sentences clause by clause, so
+    clauses repeated inside otherwise new sentences hit as well.
+
+    Bounded by ``max_bytes`` of tensor memory (on the model's device).
+    Entries belong to one loaded model; use one cache per model.
+    """
+
+    def __init__(self, max_bytes: int = 128 * 1024 * 1024) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_bytes: Memory budget for keys and feature tensors.
+        """
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, tuple[TextFeatures, float]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._saved_ms = 0.0
+
+    def get(self, text: str) -> TextFeatures | None:
+        """Look up the front-end output for a text.
+
+        Args:
+            text: Text to be synthesized.
+
+        Returns:
+            The cached features, or None on a miss.
+        """
+        key = normalize_phrase(text)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            self._saved_ms += entry[1]
+            return entry[0]
+
+    def put(self, text: str, features: TextFeatures, compute_ms: float) -> None:
+        """Store the front-end output for a text.
+
+        Args:
+            text: Text the features were computed for.
+            features: Model inputs for the text (not modified afterwards).
+            compute_ms: Time the front-end took, credited on later hits.
+        """
+        key = normalize_phrase(text)
+        size = self._entry_size(key, features)
+        if not key or size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= self._entry_size(key, previous[0])
+            self._entries[key] = (features, compute_ms)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                old_key, (old_features, _) = self._entries.popitem(last=False)
+                self._bytes -= self._entry_size(old_key, old_features)
+                self._evictions += 1
+
+    def stats(self) -> dict[str, Any]:
+        """Get hit rate, memory usage and front-end time saved."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+                "saved_ms": round(self._saved_ms, 2),
+            }
+
+    @staticmethod
+    def _entry_size(key: str, features: TextFeatures) -> int:
+        tensors = (getattr(features, f.name) for f in fields(features))
+        return sys.getsizeof(key) + sum(
+            t.element_size() * t.nelement() for t in tensors
+        )
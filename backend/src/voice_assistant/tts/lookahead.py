@@ -0,0 +1,177 @@
+"""Synthesis of upcoming sentences while earlier ones are being sent."""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Callable
+from contextlib import aclosing
+from dataclasses import dataclass
+from typing import Any
+
+from voice_assistant.tts.base import TTSResult
+
+# Produces the audio frames of one sentence (e.g. BaseTTS.synthesize_stream)
+SynthesizeStream = Callable[[str], AsyncIterator[TTSResult]]
+
+
+@dataclass
+class _Pending:
+    """A sentence being synthesized and the frames produced so far."""
+
+    text: str
+    frames: "asyncio.Queue[TTSResult | BaseException | None]"
+    task: "asyncio.Task[None]"
+
+
+class LookaheadSynthesizer:
+    """Keeps up to ``lookahead`` sentences of a turn in flight.
+
+    ``submit()`` starts synthesizing a sentence at once (waiting only while
+    ``lookahead`` sentences are already in flight); ``sentences()`` yields
+    them strictly in submission order, each with an iterator over its
+    frames. Frames of later sentences are buffered until every earlier
+    sentence has been consumed, so a sentence can be ready the moment the
+    previous one finishes sending. A sentence stays in flight until the
+    consumer moves past it.
+    """
+
+    def __init__(self, synthesize_stream: SynthesizeStream, lookahead: int = 1) -> None:
+        """Initialize the synthesizer.
+
+        Args:
+            synthesize_stream: Produces the frames of one sentence.
+            lookahead: Max sentences synthesizing or waiting to be sent
+                (1 synthesizes one sentence at a time).
+        """
+        self.lookahead = max(1, lookahead)
+        self._synthesize_stream = synthesize_stream
+        self._slots = asyncio.Semaphore(self.lookahead)
+        self._order: asyncio.Queue[_Pending | None] = asyncio.Queue()
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def submit(self, text: str) -> None:
+        """Start synthesizing a sentence.
+
+        Args:
+            text: The sentence (waits while ``lookahead`` are in flight).
+        """
+        await self._slots.acquire()
+        frames: asyncio.Queue[TTSResult | BaseException | None] = asyncio.Queue()
+        task = asyncio.create_task(self._produce(text, frames))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        self._order.put_nowait(_Pending(text, frames, task))
+
+    def end(self) -> None:
+        """Mark that no more sentences will be submitted."""
+        self._order.put_nowait(None)
+
+    async def sentences(self) -> AsyncIterator[tuple[str, AsyncIterator[TTSResult]]]:
+        """Yield (sentence, frames) in submission order until ``end()``.
+
+        Iterating a sentence's frames raises the error its synthesis failed
+        with, after any frames produced before the failure.
+        """
+        while True:
+            pending = await self._order.get()
+            if pending is None:
+                return
+            try:
+                yield pending.text, self._frames(pending)
+            finally:
+                # Stop synthesis the consumer no longer waits for
+                pending.task.cancel()
+                self._slots.release()
+
+    def cancel(self) -> None:
+        """Stop all synthesis in flight."""
+        for task in list(self._tasks):
+            task.cancel()
+
+    async def _produce(
+        self, text: str, frames: "asyncio.Queue[TTSResult | BaseException | None]"
+    ) -> None:
+        try:
+            async with aclosing(self._synthesize_stream(text)) as stream:
+                async for frame in stream:
+                    frames.put_nowait(frame)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            frames.put_nowait(e)
+            return
+        frames.put_nowait(None)
+
+    @staticmethod
+    async def _frames(pending: _Pending) -> AsyncIterator[TTSResult]:
+        while True:
+            frame = await pending.frames.get()
+            if frame is None:
+                return
+            if isinstance(frame, BaseException):
+                raise frame
+            yield frame
+
+
+class ChunkGaps:
+    """Time between consecutive audio chunks sent to a client.
+
+    Gaps at sentence boundaries (last chunk of one sentence to the first
+    of the next) are tracked separately: they are where playback stalls
+    if the next sentence is not synthesized in time.
+    """
+
+    def __init__(self) -> None:
+        self._last_sent: float | None = None
+        self.chunks = 0
+        self.gaps = 0
+        self.total_gap_ms = 0.0
+        self.max_gap_ms = 0.0
+        self.boundaries = 0
+        self.total_boundary_ms = 0.0
+        self.max_boundary_ms = 0.0
+
+    def record(self, sentence_start: bool) -> None:
+        """Record a chunk being sent now.
+
+        Args:
+            sentence_start: Whether it is the first chunk of a sentence.
+        """
+        now = time.perf_counter()
+        self.chunks += 1
+        if self._last_sent is not None:
+            gap_ms = (now - self._last_sent) * 1000
+            self.gaps += 1
+            self.total_gap_ms += gap_ms
+            self.max_gap_ms = max(self.max_gap_ms, gap_ms)
+            if sentence_start:
+                self.boundaries += 1
+                self.total_boundary_ms += gap_ms
+                self.max_boundary_ms = max(self.max_boundary_ms, gap_ms)
+        self._last_sent = now
+
+    def add(self, other: "ChunkGaps") -> None:
+        """Accumulate another tracker's totals (e.g. a finished turn)."""
+        self.chunks += other.chunks
+        self.gaps += other.gaps
+        self.total_gap_ms += other.total_gap_ms
+        self.max_gap_ms = max(self.max_gap_ms, other.max_gap_ms)
+        self.boundaries += other.boundaries
+        self.total_boundary_ms += other.total_boundary_ms
+        self.max_boundary_ms = max(self.max_boundary_ms, other.max_boundary_ms)
+
+    def stats(self) -> dict[str, Any]:
+        """Get average and maximum gaps."""
+        return {
+            "chunks": self.chunks,
+            "avg_gap_ms": (
+                round(self.total_gap_ms / self.gaps, 2) if self.gaps else 0.0
+            ),
+            "max_gap_ms": round(self.max_gap_ms, 2),
+            "sentence_boundaries": self.boundaries,
+            "avg_boundary_gap_ms": (
+                round(self.total_boundary_ms / self.boundaries, 2)
+                if self.boundaries
+                else 0.0
+            ),
+            "max_boundary_gap_ms": round(self.max_boundary_ms, 2),
+        }
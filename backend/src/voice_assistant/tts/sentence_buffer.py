@@ -1,5 +1,39 @@
 """Sentence buffer for text splitting in TTS processing."""
 
+# Punctuation after which a long sentence may be split for synthesis
+CLAUSE_ENDINGS = "、，,；;：:"
+
+
+def split_clauses(sentence: str, min_chars: int = 12) -> list[str]:
+    """Split a sentence at clause boundaries for incremental synthesis.
+
+    Clauses shorter than ``min_chars`` are merged with the following one so
+    each synthesized segment keeps enough context for natural prosody.
+
+    Args:
+        sentence: The sentence to split.
+        min_chars: Minimum characters per segment.
+
+    Returns:
+        Segments in order (the whole sentence if it cannot be split).
+    """
+    segments: list[str] = []
+    current = ""
+    for char in sentence:
+        current += char
+        if char in CLAUSE_ENDINGS and len(current.strip()) >= min_chars:
+            segments.append(current.strip())
+            current = ""
+
+    rest = current.strip()
+    if rest:
+        if segments and len(rest) < min_chars:
+            # Too short to synthesize on its own
+            segments[-1] += rest
+        else:
+            segments.append(rest)
+    return segments
+
 
 class SentenceBuffer:
     """Buffer for splitting text into sentences.
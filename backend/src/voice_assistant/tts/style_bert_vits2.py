@@ -1,22 +1,37 @@
 """Style-BERT-VITS2 TTS implementation."""
 
-import asyncio
+import hashlib
+import json
 import os
 import threading
 import time
+from collections.abc import AsyncIterator
 from pathlib import Path
+from typing import Any
 
 import numpy as np
 import torch
 
+from voice_assistant.core.batching import BatchScheduler
+from voice_assistant.core.executor import InferenceExecutor
 from voice_assistant.core.logging import get_logger
-from voice_assistant.tts.base import TTS_SAMPLE_RATE, BaseTTS, TTSResult
+from voice_assistant.tts.base import TTS_FRAME_MS, TTS_SAMPLE_RATE, BaseTTS, TTSResult
+from voice_assistant.tts.batch_infer import infer_batch
+from voice_assistant.tts.cache import PhraseCache
+from voice_assistant.tts.frontend_cache import TextFrontendCache
+from voice_assistant.tts.sentence_buffer import split_clauses
 
 logger = get_logger(__name__)
 
 # Default model paths (can be overridden via environment variables)
 DEFAULT_MODEL_DIR = Path(__file__).parent.parent.parent.parent.parent / "models" / "tts"
 
+# Phrase synthesized by warmup() to initialize kernels and the text front-end
+WARMUP_TEXT = "こんにちは。"
+
+# Read size when hashing model files
+_HASH_CHUNK_BYTES = 1024 * 1024
+
 
 def get_tts_device() -> str:
     """Get the device for TTS inference.
@@ -39,6 +54,15 @@ class StyleBertVits2TTS(BaseTTS):
     - config.json
     - *.safetensors (model weights)
     - style_vectors.npy
+
+    Sentences from concurrent sessions can be micro-batched: texts arriving
+    within ``batch_wait_ms`` of each other (and of similar length) share one
+    padded forward pass.
+
+    With a ``cache``, short phrases synthesized before (for the same model
+    files, speaker, style and sample rate) are returned without inference.
+    With a ``frontend_cache``, texts seen before skip G2P and the BERT
+    forward pass, and only the acoustic model runs.
     """
 
     _instance_lock = threading.Lock()
@@ -47,6 +71,15 @@ class StyleBertVits2TTS(BaseTTS):
         self,
         device: str = "auto",
         model_dir: str | Path | None = None,
+        clause_min_chars: int = 12,
+        executor: InferenceExecutor | None = None,
+        speaker_id: int = 0,
+        style: str = "Neutral",
+        cache: PhraseCache | None = None,
+        max_batch_size: int = 1,
+        batch_wait_ms: float = 30.0,
+        batch_max_length_ratio: float = 2.0,
+        frontend_cache: TextFrontendCache | None = None,
     ) -> None:
         """Initialize the TTS service.
 
@@ -55,11 +88,44 @@ class StyleBertVits2TTS(BaseTTS):
                    'auto' will use CUDA if available.
             model_dir: Directory containing model files.
                       Defaults to models/tts or TTS_MODEL_DIR env var.
+            clause_min_chars: Minimum clause length when streaming splits
+                      long sentences (see synthesize_stream).
+            executor: Worker pool for inference
+                      (default: a dedicated single-worker pool).
+            speaker_id: Speaker to synthesize with.
+            style: Style to synthesize with.
+            cache: Optional cache of synthesized phrases.
+            max_batch_size: Max texts synthesized in one forward pass
+                      (1 disables batching).
+            batch_wait_ms: Max time a text waits for others to batch with.
+            batch_max_length_ratio: Max length ratio between texts that
+                      share a batch.
+            frontend_cache: Optional cache of text front-end outputs.
         """
         self.device = get_tts_device() if device == "auto" else device
+        self.clause_min_chars = clause_min_chars
+        self._executor = executor or InferenceExecutor("tts")
         self._model = None
         self._model_lock = threading.Lock()
         self._model_available = True
+        self.speaker_id = speaker_id
+        self.style = style
+        self.cache = cache
+        self.frontend_cache = frontend_cache
+        self._identity: tuple[str, int] | None = None
+        self._identity_checked = False
+        self._style_vectors: np.ndarray | None = None
+        self._scheduler = BatchScheduler(
+            self._infer_batch,
+            max_batch_size=max_batch_size,
+            max_wait_ms=batch_wait_ms,
+            name="tts",
+            executor=self._executor,
+            item_length=len,
+            max_length_ratio=batch_max_length_ratio,
+        )
+        self._batch_tokens = 0
+        self._batch_padded_tokens = 0
 
         # Resolve model directory
         if model_dir:
@@ -112,6 +178,115 @@ class StyleBertVits2TTS(BaseTTS):
 
         return model_path, config_path, style_vec_path
 
+    def model_identity(self) -> tuple[str, int] | None:
+        """Hash the model files and read the model's output sample rate.
+
+        Computed once (blocking: the weights are read in full).
+
+        Returns:
+            Tuple of (hex hash of the model files, sample rate), or None if
+            the model files are missing.
+        """
+        if not self._identity_checked:
+            with self._model_lock:
+                if not self._identity_checked:
+                    self._identity = self._compute_identity()
+                    self._identity_checked = True
+        return self._identity
+
+    def _compute_identity(self) -> tuple[str, int] | None:
+        model_files = self._find_model_files()
+        if model_files is None:
+            return None
+        model_path, config_path, style_vec_path = model_files
+        digest = hashlib.blake2b(digest_size=16)
+        for path in (model_path, config_path, style_vec_path):
+            digest.update(path.name.encode())
+            with path.open("rb") as f:
+                while chunk := f.read(_HASH_CHUNK_BYTES):
+                    digest.update(chunk)
+        try:
+            config = json.loads(config_path.read_text(encoding="utf-8"))
+            sample_rate = int(config["data"]["sampling_rate"])
+        except (OSError, ValueError, KeyError, TypeError):
+            sample_rate = TTS_SAMPLE_RATE
+        return digest.hexdigest(), sample_rate
+
+    async def _cache_key(self, text: str) -> str | None:
+        """Get the phrase cache key for text (None if not cacheable)."""
+        if self.cache is None:
+            return None
+        if self._identity_checked:
+            identity = self._identity
+        else:
+            identity = await self._executor.run(self.model_identity)
+        if identity is None:
+            return None
+        model_hash, sample_rate = identity
+        return self.cache.key(
+            text, model_hash, self.speaker_id, self.style, sample_rate
+        )
+
+    async def _infer(self, model: Any, text: str) -> tuple[int, bytes]:
+        """Synthesize one text on the executor, returning PCM16 bytes."""
+        if self._scheduler.max_batch_size > 1:
+            sample_rate, audio = await self._scheduler.submit(text)
+        elif self.frontend_cache is not None:
+            [(sample_rate, audio)] = await self._executor.run(self._infer_batch, [text])
+        else:
+            sample_rate, audio = await self._executor.run(
+                model.infer, text=text, speaker_id=self.speaker_id, style=self.style
+            )
+        return sample_rate, self._to_pcm16(audio).tobytes()
+
+    def _infer_batch(self, texts: list[str]) -> list[tuple[int, np.ndarray]]:
+        """Synthesize a batch of texts in one forward pass (blocking).
+
+        A batch of one takes the regular single-text path, unless the text
+        front-end is cached: ``model.infer`` always reruns it.
+        """
+        model = self._load_model()
+        if model is None:
+            raise RuntimeError("TTS model is unavailable")
+        if len(texts) == 1 and self.frontend_cache is None:
+            return [
+                model.infer(text=texts[0], speaker_id=self.speaker_id, style=self.style)
+            ]
+
+        output = infer_batch(
+            model,
+            texts,
+            self.speaker_id,
+            self._style_vector(model),
+            frontend=self.frontend_cache,
+        )
+        sample_rate = model.hyper_parameters.data.sampling_rate
+        if len(texts) == 1:
+            return [(sample_rate, output.audios[0])]
+
+        self._batch_tokens += output.tokens
+        self._batch_padded_tokens += output.padded_tokens
+        logger.debug(
+            "tts_batch_synthesized",
+            batch_size=len(texts),
+            padding_efficiency=round(output.tokens / output.padded_tokens, 3),
+        )
+        return [(sample_rate, audio) for audio in output.audios]
+
+    def _style_vector(self, model: Any) -> np.ndarray:
+        """Get the embedding of the configured style (weight 1.0)."""
+        if self._style_vectors is None:
+            self._style_vectors = np.load(self._model_dir / "style_vectors.npy")
+        return self._style_vectors[model.hyper_parameters.data.style2id[self.style]]
+
+    async def _cache_put(
+        self, key: str | None, sample_rate: int, audio: bytes
+    ) -> None:
+        # Only audio at the rate the key was built for is reusable
+        if key is not None and audio and self._identity is not None:
+            if sample_rate == self._identity[1]:
+                await self.cache.put_async(key, audio)
+
     def _load_model(self):
         """Load the TTS model (thread-safe, lazy loading).
 
@@ -178,6 +353,29 @@ class StyleBertVits2TTS(BaseTTS):
 
         return self._model
 
+    async def warmup(self) -> None:
+        """Load the model and synthesize a short phrase.
+
+        Raises:
+            RuntimeError: If the model files are missing (TTS is disabled).
+        """
+        model = await self._executor.run(self._load_model)
+        if model is None:
+            raise RuntimeError("TTS model files not found")
+        await self._infer(model, WARMUP_TEXT)
+        if self._scheduler.max_batch_size > 1:
+            # Also warm up the padded batch path, keeping batch stats clean
+            await self._executor.run(
+                infer_batch,
+                model,
+                [WARMUP_TEXT, WARMUP_TEXT],
+                self.speaker_id,
+                self._style_vector(model),
+            )
+        if self.cache is not None:
+            # Hash the model files now rather than on the first reply
+            await self._executor.run(self.model_identity)
+
     async def synthesize(self, text: str) -> TTSResult:
         """Synthesize text to speech.
 
@@ -193,6 +391,20 @@ class StyleBertVits2TTS(BaseTTS):
 
         start_time = time.perf_counter()
 
+        cache_key = await self._cache_key(text)
+        if cache_key is not None:
+            cached = await self.cache.get_async(cache_key)
+            if cached is not None:
+                latency_ms = (time.perf_counter() - start_time) * 1000
+                logger.debug(
+                    "tts_cache_hit",
+                    text_length=len(text),
+                    latency_ms=round(latency_ms, 3),
+                )
+                return TTSResult(
+                    audio=cached, sample_rate=self._identity[1], latency_ms=latency_ms
+                )
+
         # Load model (lazy)
         model = self._load_model()
         if model is None:
@@ -204,11 +416,122 @@ class StyleBertVits2TTS(BaseTTS):
             return TTSResult(audio=b"", sample_rate=TTS_SAMPLE_RATE, latency_ms=0.0)
 
         # Run inference in thread pool (blocking operation)
-        sample_rate, audio = await asyncio.to_thread(
-            model.infer,
-            text=text,
+        sample_rate, audio_bytes = await self._infer(model, text)
+        await self._cache_put(cache_key, sample_rate, audio_bytes)
+
+        latency_ms = (time.perf_counter() - start_time) * 1000
+
+        logger.debug(
+            "tts_synthesis_complete",
+            text_length=len(text),
+            audio_length=len(audio_bytes),
+            sample_rate=sample_rate,
+            latency_ms=round(latency_ms, 2),
+        )
+
+        return TTSResult(
+            audio=audio_bytes,
+            sample_rate=sample_rate,
+            latency_ms=latency_ms,
+        )
+
+    async def synthesize_stream(
+        self, text: str, frame_ms: float = TTS_FRAME_MS
+    ) -> AsyncIterator[TTSResult]:
+        """Synthesize text clause by clause, yielding fixed-duration frames.
+
+        Long sentences are split at clause boundaries (、 etc.) and each
+        clause is synthesized separately, so the first frames are sent while
+        the rest of the sentence is still being synthesized.
+
+        Args:
+            text: Text to synthesize.
+            frame_ms: Duration of each yielded frame in milliseconds.
+
+        Yields:
+            TTSResult per PCM16 frame; latency_ms is the time until that
+            frame was ready. Nothing is yielded if the model is unavailable.
+        """
+        if not text or not text.strip():
+            return
+
+        start_time = time.perf_counter()
+
+        segments = split_clauses(text, self.clause_min_chars)
+        model = None
+        pending = b""
+        sample_rate = TTS_SAMPLE_RATE
+        for segment in segments:
+            cache_key = await self._cache_key(segment)
+            cached = None
+            if cache_key is not None:
+                cached = await self.cache.get_async(cache_key)
+            if cached is not None:
+                sample_rate = self._identity[1]
+                pending += cached
+            else:
+                # Load lazily: fully cached sentences never need the model
+                model = model or self._load_model()
+                if model is None:
+                    logger.debug(
+                        "tts_skipped_model_unavailable",
+                        text_length=len(text),
+                    )
+                    return
+                sample_rate, audio_bytes = await self._infer(model, segment)
+                await self._cache_put(cache_key, sample_rate, audio_bytes)
+                pending += audio_bytes
+
+            frame_bytes = int(sample_rate * frame_ms / 1000) * 2
+            if frame_bytes <= 0:
+                continue
+            # Send whole frames now; carry the remainder into the next clause
+            view = memoryview(pending)
+            offset = 0
+            while len(pending) - offset >= frame_bytes:
+                yield TTSResult(
+                    audio=bytes(view[offset : offset + frame_bytes]),
+                    sample_rate=sample_rate,
+                    latency_ms=(time.perf_counter() - start_time) * 1000,
+                )
+                offset += frame_bytes
+            pending = bytes(view[offset:])
+
+        if pending:
+            yield TTSResult(
+                audio=pending,
+                sample_rate=sample_rate,
+                latency_ms=(time.perf_counter() - start_time) * 1000,
+            )
+
+        logger.debug(
+            "tts_stream_complete",
+            text_length=len(text),
+            segments=len(segments),
+            latency_ms=round((time.perf_counter() - start_time) * 1000, 2),
         )
 
+    def stats(self) -> dict[str, Any]:
+        """Get executor, batching, phrase cache and front-end statistics."""
+        padded = self._batch_padded_tokens
+        stats: dict[str, Any] = {
+            "executor": self._executor.stats(),
+            "batching": {
+                **self._scheduler.stats(),
+                # Share of padded batch inputs that were real phonemes
+                "padding_efficiency": (
+                    round(self._batch_tokens / padded, 4) if padded else 1.0
+                ),
+            },
+        }
+        if self.cache is not None:
+            stats["cache"] = self.cache.stats()
+        if self.frontend_cache is not None:
+            stats["frontend"] = self.frontend_cache.stats()
+        return stats
+
+    def _to_pcm16(self, audio: np.ndarray) -> np.ndarray:
+        """Convert model output to int16 PCM samples."""
         # Handle different audio formats from the model
         # Style-BERT-VITS2 may return int16 or float32 depending on version
         if audio.dtype == np.int16:
@@ -227,20 +550,4 @@ class StyleBertVits2TTS(BaseTTS):
             logger.warning("tts_unknown_audio_dtype", dtype=str(audio.dtype))
             audio_int16 = audio.astype(np.int16)
 
-        audio_bytes = audio_int16.tobytes()
-
-        latency_ms = (time.perf_counter() - start_time) * 1000
-
-        logger.debug(
-            "tts_synthesis_complete",
-            text_length=len(text),
-            audio_length=len(audio_bytes),
-            sample_rate=sample_rate,
-            latency_ms=round(latency_ms, 2),
-        )
-
-        return TTSResult(
-            audio=audio_bytes,
-            sample_rate=sample_rate,
-            latency_ms=latency_ms,
-        )
+        return audio_int16
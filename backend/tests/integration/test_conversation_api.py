@@ -130,6 +130,21 @@ class TestGetConversation:
         assert response.status_code == 200
         assert response.json()["messages"] == []
 
+    def test_includes_messages_still_queued(self, client, temp_db, monkeypatch):
+        """Should return a message written through the queue just before."""
+        from voice_assistant.db import get_write_behind_queue
+
+        write_queue = get_write_behind_queue()
+        # Without a flush the writes would wait this long to be committed
+        monkeypatch.setattr(write_queue, "flush_interval_ms", 2000.0)
+        write_queue.create_conversation("queued-conv", title="Queued")
+        write_queue.create_message("queued-msg", "queued-conv", "user", "こんにちは")
+
+        response = client.get("/api/v1/conversations/queued-conv")
+
+        assert response.status_code == 200
+        assert [m["id"] for m in response.json()["messages"]] == ["queued-msg"]
+
 
 class TestListConversations:
     """Tests for GET /api/v1/conversations."""
@@ -7,6 +7,17 @@ import pytest
 from fastapi.testclient import TestClient
 
 from voice_assistant.main import app
+from voice_assistant.tts.base import BaseTTS
+
+
+class FakeTTS(BaseTTS):
+    """TTS test double delegating synthesize to a coroutine function."""
+
+    def __init__(self, synthesize) -> None:
+        self._synthesize = synthesize
+
+    async def synthesize(self, text: str):
+        return await self._synthesize(text)
 
 
 @pytest.fixture
@@ -318,8 +329,7 @@ class TestSttIntegration:
         async def mock_synthesize(text: str):
             return TTSResult(audio=b"\x00\x01", sample_rate=44100, latency_ms=10.0)
 
-        mock_tts = MagicMock()
-        mock_tts.synthesize = mock_synthesize
+        mock_tts = FakeTTS(mock_synthesize)
 
         def mock_get_tts_service():
             return mock_tts
@@ -384,15 +394,12 @@ class TestLlmIntegration:
 
     def _mock_tts_service(self, monkeypatch):
         """Set up mock TTS service for tests."""
-        from unittest.mock import MagicMock
-
         from voice_assistant.tts.base import TTSResult
 
         async def mock_synthesize(text: str):
             return TTSResult(audio=b"\x00\x01", sample_rate=44100, latency_ms=10.0)
 
-        mock_tts = MagicMock()
-        mock_tts.synthesize = mock_synthesize
+        mock_tts = FakeTTS(mock_synthesize)
 
         monkeypatch.setattr(
             "voice_assistant.api.websocket.get_tts_service", lambda: mock_tts
@@ -805,15 +812,12 @@ class TestE2ELatency:
 
     def _mock_tts_service(self, monkeypatch):
         """Set up mock TTS service for tests."""
-        from unittest.mock import MagicMock
-
         from voice_assistant.tts.base import TTSResult
 
         async def mock_synthesize(text: str):
             return TTSResult(audio=b"\x00\x01", sample_rate=44100, latency_ms=10.0)
 
-        mock_tts = MagicMock()
-        mock_tts.synthesize = mock_synthesize
+        mock_tts = FakeTTS(mock_synthesize)
 
         monkeypatch.setattr(
             "voice_assistant.api.websocket.get_tts_service", lambda: mock_tts
@@ -907,17 +911,1117 @@ class TestE2ELatency:
             events.append(websocket.receive_json())  # stt.final
             events.append(websocket.receive_json())  # llm.start
             events.append(websocket.receive_json())  # llm.delta
-            events.append(websocket.receive_json())  # tts.chunk (from sentence ending)
-            events.append(websocket.receive_json())  # llm.end
+            events.append(websocket.receive_json())  # tts.chunk / llm.end
+            events.append(websocket.receive_json())  # llm.end / tts.chunk
             events.append(websocket.receive_json())  # tts.end
 
-            # Verify event types in order
+            # Verify event types in order (TTS runs concurrently with the LLM,
+            # so tts.chunk and llm.end may arrive in either order)
             event_types = [e["type"] for e in events]
-            assert event_types == [
-                "stt.final",
-                "llm.start",
-                "llm.delta",
-                "tts.chunk",
-                "llm.end",
-                "tts.end",
-            ]
+            assert event_types[:3] == ["stt.final", "llm.start", "llm.delta"]
+            assert sorted(event_types[3:5]) == ["llm.end", "tts.chunk"]
+            assert event_types[5] == "tts.end"
+
+    def test_llm_deltas_not_blocked_by_tts(self, client: TestClient, monkeypatch):
+        """Test LLM tokens are forwarded while slow TTS synthesis is running."""
+        import asyncio
+        from collections.abc import AsyncIterator
+        from unittest.mock import MagicMock
+
+        from voice_assistant.stt import TranscriptionResult
+        from voice_assistant.tts.base import TTSResult
+
+        async def mock_transcribe(audio_data: bytes, sample_rate: int):
+            return TranscriptionResult(text="テスト", latency_ms=50.0)
+
+        mock_stt = MagicMock()
+        mock_stt.transcribe = mock_transcribe
+
+        async def mock_stream_completion(messages) -> AsyncIterator[str]:
+            for token in ["一文目。", "二文目。", "三文目。"]:
+                await asyncio.sleep(0.01)
+                yield token
+
+        mock_llm = MagicMock()
+        mock_llm.stream_completion = mock_stream_completion
+
+        synthesized = []
+
+        async def mock_synthesize(text: str):
+            await asyncio.sleep(0.2)
+            synthesized.append(text)
+            return TTSResult(audio=b"\x00\x01", sample_rate=44100, latency_ms=200.0)
+
+        mock_tts = FakeTTS(mock_synthesize)
+
+        monkeypatch.setattr(
+            "voice_assistant.api.websocket.get_stt_service", lambda: mock_stt
+        )
+        monkeypatch.setattr(
+            "voice_assistant.api.websocket.get_llm_service", lambda: mock_llm
+        )
+        monkeypatch.setattr(
+            "voice_assistant.api.websocket.get_tts_service", lambda: mock_tts
+        )
+
+        with client.websocket_connect("/api/v1/ws/chat") as websocket:
+            import numpy as np
+
+            websocket.send_text(json.dumps({"type": "vad.start", "timestamp": 1}))
+            audio = np.zeros(4000, dtype=np.float32)
+            websocket.send_bytes(self._create_audio_message(audio.tobytes()))
+            websocket.send_text(json.dumps({"type": "vad.end", "timestamp": 2}))
+
+            event_types = []
+            while not event_types or event_types[-1] != "tts.end":
+                event_types.append(websocket.receive_json()["type"])
+
+        # All tokens and llm.end arrive before the first (slow) tts.chunk
+        first_chunk = event_types.index("tts.chunk")
+        assert event_types[:3] == ["stt.final", "llm.start", "llm.delta"]
+        assert event_types[first_chunk - 1] == "llm.end"
+        assert set(event_types[3 : first_chunk - 1]) <= {"llm.delta"}
+        assert event_types[first_chunk:] == [
+            "tts.chunk",
+            "tts.chunk",
+            "tts.chunk",
+            "tts.end",
+        ]
+        # Sentences are still synthesized in order
+        assert synthesized == ["一文目。", "二文目。", "三文目。"]
+
+
+class TestBackgroundTurns:
+    """Tests for running turns in the background of the receive loop."""
+
+    def _create_audio_message(self, audio_data: bytes, sample_rate: int = 16000) -> bytes:
+        """Create binary audio message with header."""
+        header = json.dumps({"type": "vad.audio", "sampleRate": sample_rate}).encode()
+        header_length = len(header).to_bytes(4, byteorder="little")
+        return header_length + header + audio_data
+
+    def test_frames_received_while_turn_running(self, client: TestClient, monkeypatch):
+        """Test inbound frames are read while STT for the previous turn runs."""
+        import asyncio
+        from unittest.mock import MagicMock
+
+        import voice_assistant.api.websocket as ws_module
+        from voice_assistant.stt import TranscriptionResult
+
+        frames_seen: list[int] = []
+        original_handle_binary = ws_module.handle_binary_message
+
+        async def tracking_handle_binary(data, audio_buffer, client_info):
+            frames_seen.append(len(data))
+            await original_handle_binary(data, audio_buffer, client_info)
+
+        async def mock_transcribe(audio_data: bytes, sample_rate: int):
+            # Wait for the second utterance's audio to arrive mid-turn
+            for _ in range(100):
+                if len(frames_seen) >= 2:
+                    return TranscriptionResult(text="", latency_ms=10.0)
+                await asyncio.sleep(0.01)
+            return TranscriptionResult(text="", latency_ms=1000.0)
+
+        mock_stt = MagicMock()
+        mock_stt.transcribe = mock_transcribe
+
+        monkeypatch.setattr(ws_module, "handle_binary_message", tracking_handle_binary)
+        monkeypatch.setattr(ws_module, "get_stt_service", lambda: mock_stt)
+
+        with client.websocket_connect("/api/v1/ws/chat") as websocket:
+            import numpy as np
+
+            audio = np.zeros(4000, dtype=np.float32)
+            websocket.send_text(json.dumps({"type": "vad.start", "timestamp": 1}))
+            websocket.send_bytes(self._create_audio_message(audio.tobytes()))
+            websocket.send_text(json.dumps({"type": "vad.end", "timestamp": 2}))
+
+            # Next utterance starts while the first one is still in STT
+            websocket.send_bytes(self._create_audio_message(audio.tobytes()))
+
+            stt_final = websocket.receive_json()
+            assert stt_final["type"] == "stt.final"
+            # STT saw the second frame before finishing, i.e. it did not block
+            assert stt_final["latency_ms"] == 10.0
+
+    def test_turns_run_in_order(self, client: TestClient, monkeypatch):
+        """Test back-to-back turns are processed one at a time, in order."""
+        import asyncio
+        from unittest.mock import MagicMock
+
+        from voice_assistant.stt import TranscriptionResult
+
+        calls: list[int] = []
+
+        async def mock_transcribe(audio_data: bytes, sample_rate: int):
+            calls.append(len(audio_data))
+            await asyncio.sleep(0.05)
+            return TranscriptionResult(text="", latency_ms=float(len(audio_data)))
+
+        mock_stt = MagicMock()
+        mock_stt.transcribe = mock_transcribe
+
+        monkeypatch.setattr(
+            "voice_assistant.api.websocket.get_stt_service", lambda: mock_stt
+        )
+
+        with client.websocket_connect("/api/v1/ws/chat") as websocket:
+            import numpy as np
+
+            websocket.send_text(json.dumps({"type": "vad.start", "timestamp": 1}))
+            for samples in (4000, 2000):
+                audio = np.zeros(samples, dtype=np.float32)
+                websocket.send_bytes(self._create_audio_message(audio.tobytes()))
+                websocket.send_text(json.dumps({"type": "vad.end", "timestamp": 2}))
+
+            first = websocket.receive_json()
+            second = websocket.receive_json()
+
+        assert calls == [16000, 8000]
+        assert first["latency_ms"] == 16000.0
+        assert second["latency_ms"] == 8000.0
+
+
+class TestBargeIn:
+    """Tests for cancelling a running turn (cancel event / new vad.start)."""
+
+    def _create_audio_message(self, audio_data: bytes, sample_rate: int = 16000) -> bytes:
+        """Create binary audio message with header."""
+        header = json.dumps({"type": "vad.audio", "sampleRate": sample_rate}).encode()
+        header_length = len(header).to_bytes(4, byteorder="little")
+        return header_length + header + audio_data
+
+    def _setup_endless_turn(self, monkeypatch) -> dict:
+        """Mock STT/LLM/TTS so the turn keeps streaming until cancelled."""
+        import asyncio
+        from unittest.mock import MagicMock
+
+        from voice_assistant.stt import TranscriptionResult
+        from voice_assistant.tts.base import TTSResult
+
+        state = {"llm_closed": False, "synthesized": []}
+
+        async def mock_transcribe(audio_data: bytes, sample_rate: int):
+            return TranscriptionResult(text="長い話をして", latency_ms=10.0)
+
+        async def mock_stream_completion(messages):
+            try:
+                while True:
+                    await asyncio.sleep(0.01)
+                    yield "文。"
+            finally:
+                state["llm_closed"] = True
+
+        async def mock_synthesize(text: str):
+            await asyncio.sleep(0.05)
+            state["synthesized"].append(text)
+            return TTSResult(audio=b"\x00\x01", sample_rate=44100, latency_ms=50.0)
+
+        mock_stt = MagicMock()
+        mock_stt.transcribe = mock_transcribe
+        mock_llm = MagicMock()
+        mock_llm.stream_completion = mock_stream_completion
+        mock_tts = FakeTTS(mock_synthesize)
+
+        monkeypatch.setattr(
+            "voice_assistant.api.websocket.get_stt_service", lambda: mock_stt
+        )
+        monkeypatch.setattr(
+            "voice_assistant.api.websocket.get_llm_service", lambda: mock_llm
+        )
+        monkeypatch.setattr(
+            "voice_assistant.api.websocket.get_tts_service", lambda: mock_tts
+        )
+        return state
+
+    def _start_turn(self, websocket) -> None:
+        """Send one utterance and wait until the LLM is streaming."""
+        import numpy as np
+
+        websocket.send_text(json.dumps({"type": "vad.start", "timestamp": 1}))
+        audio = np.zeros(4000, dtype=np.float32)
+        websocket.send_bytes(self._create_audio_message(audio.tobytes()))
+        websocket.send_text(json.dumps({"type": "vad.end", "timestamp": 2}))
+
+        assert websocket.receive_json()["type"] == "stt.final"
+        assert websocket.receive_json()["type"] == "llm.start"
+        assert websocket.receive_json()["type"] == "llm.delta"
+
+    def _receive_until_cancelled(self, websocket) -> dict:
+        """Skip in-flight events until turn.cancelled arrives."""
+        for _ in range(1000):
+            event = websocket.receive_json()
+            if event["type"] == "turn.cancelled":
+                return event
+            assert event["type"] in ("llm.delta", "tts.chunk", "error")
+        raise AssertionError("turn.cancelled not received")
+
+    def test_cancel_stops_llm_and_tts(self, client: TestClient, monkeypatch):
+        """Test cancel closes the LLM stream and drops queued TTS sentences."""
+        state = self._setup_endless_turn(monkeypatch)
+
+        with client.websocket_connect("/api/v1/ws/chat") as websocket:
+            self._start_turn(websocket)
+            websocket.send_text(json.dumps({"type": "cancel"}))
+
+            event = self._receive_until_cancelled(websocket)
+            assert event["reason"] == "cancel"
+            assert event["assistant_text"].startswith("文。")
+            assert "user_message_id" in event
+            assert "assistant_message_id" in event
+
+            # The LLM generator was closed before turn.cancelled was sent
+            assert state["llm_closed"]
+            synthesized_at_cancel = len(state["synthesized"])
+
+            # No TTS keeps running for the cancelled turn
+            import time
+
+            time.sleep(0.2)
+            assert len(state["synthesized"]) == synthesized_at_cancel
+            # Queued sentences were dropped rather than synthesized
+            assert synthesized_at_cancel < event["assistant_text"].count("。")
+
+    def test_cancel_during_tts_drain_keeps_one_assistant_message(
+        self, client: TestClient, monkeypatch
+    ):
+        """Test a cancel after llm.end does not add the reply to context twice."""
+        import asyncio
+        from unittest.mock import MagicMock
+
+        from voice_assistant.llm import ConversationContext
+        from voice_assistant.tts.base import TTSResult
+
+        self._setup_endless_turn(monkeypatch)
+        contexts = []
+
+        class RecordingContext(ConversationContext):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                contexts.append(self)
+
+        async def short_completion(messages):
+            yield "短い返事。"
+
+        async def slow_synthesize(text: str):
+            await asyncio.sleep(5)
+            return TTSResult(audio=b"\x00\x01", sample_rate=44100, latency_ms=0.0)
+
+        mock_llm = MagicMock()
+        mock_llm.stream_completion = short_completion
+        monkeypatch.setattr(
+            "voice_assistant.api.websocket.get_llm_service", lambda: mock_llm
+        )
+        monkeypatch.setattr(
+            "voice_assistant.api.websocket.get_tts_service",
+            lambda: FakeTTS(slow_synthesize),
+        )
+        monkeypatch.setattr(
+            "voice_assistant.api.websocket.ConversationContext", RecordingContext
+        )
+
+        with client.websocket_connect("/api/v1/ws/chat") as websocket:
+            self._start_turn(websocket)
+            assert websocket.receive_json()["type"] == "llm.end"
+            # TTS is still draining the reply
+            websocket.send_text(json.dumps({"type": "cancel"}))
+            event = self._receive_until_cancelled(websocket)
+
+        assert event["assistant_text"] == "短い返事。"
+        messages = contexts[0].get_messages()
+        assistant = [m for m in messages if m["role"] == "assistant"]
+        assert [m["content"] for m in assistant] == ["短い返事。"]
+
+    def test_vad_start_barges_in(self, client: TestClient, monkeypatch):
+        """Test a new vad.start during a turn cancels it as barge-in."""
+        state = self._setup_endless_turn(monkeypatch)
+
+        with client.websocket_connect("/api/v1/ws/chat") as websocket:
+            self._start_turn(websocket)
+            websocket.send_text(json.dumps({"type": "vad.start", "timestamp": 3}))
+
+            event = self._receive_until_cancelled(websocket)
+            assert event["reason"] == "barge_in"
+            assert state["llm_closed"]
+
+    def test_cancel_without_turn_sends_nothing(self, client: TestClient, monkeypatch):
+        """Test cancel outside a turn only clears the buffer."""
+        from unittest.mock import AsyncMock, MagicMock
+
+        from voice_assistant.stt import TranscriptionResult
+
+        mock_stt = MagicMock()
+        mock_stt.transcribe = AsyncMock(
+            return_value=TranscriptionResult(text="", latency_ms=1.0)
+        )
+        monkeypatch.setattr(
+            "voice_assistant.api.websocket.get_stt_service", lambda: mock_stt
+        )
+
+        with client.websocket_connect("/api/v1/ws/chat") as websocket:
+            websocket.send_text(json.dumps({"type": "cancel"}))
+
+            # Next event is from a fresh turn, not a turn.cancelled
+            import numpy as np
+
+            audio = np.zeros(4000, dtype=np.float32)
+            websocket.send_bytes(self._create_audio_message(audio.tobytes()))
+            websocket.send_text(json.dumps({"type": "vad.end", "timestamp": 2}))
+            assert websocket.receive_json()["type"] == "stt.final"
+
+
+class TestBinaryTtsFrames:
+    """Tests for the opt-in binary tts.chunk transport."""
+
+    def _create_audio_message(self, audio_data: bytes, sample_rate: int = 16000) -> bytes:
+        """Create binary audio message with header."""
+        header = json.dumps({"type": "vad.audio", "sampleRate": sample_rate}).encode()
+        header_length = len(header).to_bytes(4, byteorder="little")
+        return header_length + header + audio_data
+
+    def _mock_services(self, monkeypatch, pcm: bytes) -> None:
+        """Mock STT/LLM/TTS for a single-sentence reply."""
+        from collections.abc import AsyncIterator
+        from unittest.mock import MagicMock
+
+        from voice_assistant.stt import TranscriptionResult
+        from voice_assistant.tts.base import TTSResult
+
+        async def mock_transcribe(audio_data: bytes, sample_rate: int):
+            return TranscriptionResult(text="テスト", latency_ms=10.0)
+
+        async def mock_stream_completion(messages) -> AsyncIterator[str]:
+            yield "応答"
+
+        async def mock_synthesize(text: str):
+            return TTSResult(audio=pcm, sample_rate=44100, latency_ms=10.0)
+
+        mock_stt = MagicMock()
+        mock_stt.transcribe = mock_transcribe
+        mock_llm = MagicMock()
+        mock_llm.stream_completion = mock_stream_completion
+        mock_tts = FakeTTS(mock_synthesize)
+
+        monkeypatch.setattr(
+            "voice_assistant.api.websocket.get_stt_service", lambda: mock_stt
+        )
+        monkeypatch.setattr(
+            "voice_assistant.api.websocket.get_llm_service", lambda: mock_llm
+        )
+        monkeypatch.setattr(
+            "voice_assistant.api.websocket.get_tts_service", lambda: mock_tts
+        )
+
+    def _run_turn(self, websocket) -> list[dict]:
+        """Send one utterance and collect raw messages until tts.end."""
+        import numpy as np
+
+        websocket.send_text(json.dumps({"type": "vad.start", "timestamp": 1}))
+        audio = np.zeros(4000, dtype=np.float32)
+        websocket.send_bytes(self._create_audio_message(audio.tobytes()))
+        websocket.send_text(json.dumps({"type": "vad.end", "timestamp": 2}))
+
+        messages = []
+        while True:
+            message = websocket.receive()
+            messages.append(message)
+            if message.get("text") and json.loads(message["text"])["type"] == "tts.end":
+                return messages
+
+    def test_binary_tts_chunk_frame(self, client: TestClient, monkeypatch):
+        """Test tts.chunk is sent as [header length][JSON header][PCM] frame."""
+        pcm = bytes(range(256)) * 4
+        self._mock_services(monkeypatch, pcm)
+
+        with client.websocket_connect(
+            "/api/v1/ws/chat?tts_transport=binary"
+        ) as websocket:
+            messages = self._run_turn(websocket)
+
+        binary = [m["bytes"] for m in messages if m.get("bytes") is not None]
+        assert len(binary) == 1
+
+        frame = binary[0]
+        header_length = struct.unpack("<I", frame[:4])[0]
+        header = json.loads(frame[4 : 4 + header_length].decode("utf-8"))
+        assert header == {"type": "tts.chunk", "sampleRate": 44100, "format": "pcm16"}
+        assert frame[4 + header_length :] == pcm
+
+    def test_json_tts_chunk_is_default(self, client: TestClient, monkeypatch):
+        """Test tts.chunk falls back to base64 JSON without negotiation."""
+        import base64
+
+        pcm = b"\x01\x02\x03\x04"
+        self._mock_services(monkeypatch, pcm)
+
+        with client.websocket_connect(
+            "/api/v1/ws/chat?tts_transport=unknown"
+        ) as websocket:
+            messages = self._run_turn(websocket)
+
+        assert all(m.get("bytes") is None for m in messages)
+        events = [json.loads(m["text"]) for m in messages]
+        chunks = [e for e in events if e["type"] == "tts.chunk"]
+        assert len(chunks) == 1
+        assert base64.b64decode(chunks[0]["audio"]) == pcm
+
+    def test_negotiated_sample_rate_is_resampled(
+        self, client: TestClient, monkeypatch
+    ):
+        """Test tts_sample_rate converts tts.chunk audio to the client's rate."""
+        pcm = b"\x00\x10" * 4410
+        self._mock_services(monkeypatch, pcm)
+
+        with client.websocket_connect(
+            "/api/v1/ws/chat?tts_transport=binary&tts_sample_rate=16000"
+        ) as websocket:
+            messages = self._run_turn(websocket)
+
+        frames = [m["bytes"] for m in messages if m.get("bytes") is not None]
+        payload = b""
+        for frame in frames:
+            header_length = struct.unpack("<I", frame[:4])[0]
+            header = json.loads(frame[4 : 4 + header_length].decode("utf-8"))
+            assert header == {
+                "type": "tts.chunk",
+                "sampleRate": 16000,
+                "format": "pcm16",
+            }
+            payload += frame[4 + header_length :]
+        # 100 ms of audio at 16 kHz PCM16
+        assert abs(len(payload) - 3200) <= 2
+
+    def test_usage_counts_bytes_on_the_wire(self, client: TestClient, monkeypatch):
+        """Test downlink usage includes tts.chunk headers and base64."""
+        from voice_assistant.audio import DownlinkUsage
+
+        pcm = bytes(range(256)) * 4
+        self._mock_services(monkeypatch, pcm)
+
+        sent = {}
+        for transport in ("binary", "json"):
+            usage = DownlinkUsage()
+            monkeypatch.setattr(
+                "voice_assistant.api.websocket._tts_downlink_usage", usage
+            )
+            with client.websocket_connect(
+                f"/api/v1/ws/chat?tts_transport={transport}"
+            ) as websocket:
+                messages = self._run_turn(websocket)
+
+            if transport == "binary":
+                chunks = [m["bytes"] for m in messages if m.get("bytes") is not None]
+            else:
+                chunks = [
+                    m["text"].encode()
+                    for m in messages
+                    if json.loads(m["text"])["type"] == "tts.chunk"
+                ]
+            assert usage.payload_bytes == len(pcm)
+            assert usage.bytes_out == sum(len(c) for c in chunks)
+            sent[transport] = usage.bytes_out
+
+        assert len(pcm) < sent["binary"] < sent["json"]
+
+    def test_opus_falls_back_to_pcm16_when_unavailable(
+        self, client: TestClient, monkeypatch
+    ):
+        """Test tts_format=opus without an encoder sends labelled PCM16."""
+        import sys
+
+        pcm = b"\x01\x02\x03\x04"
+        self._mock_services(monkeypatch, pcm)
+        monkeypatch.setitem(sys.modules, "opuslib", None)
+
+        with client.websocket_connect(
+            "/api/v1/ws/chat?tts_format=opus&tts_sample_rate=44100"
+        ) as websocket:
+            messages = self._run_turn(websocket)
+
+        events = [json.loads(m["text"]) for m in messages]
+        chunks = [e for e in events if e["type"] == "tts.chunk"]
+        assert len(chunks) == 1
+        assert chunks[0]["format"] == "pcm16"
+        assert chunks[0]["sampleRate"] == 44100
+
+
+class TestDeltaCoalescing:
+    """Tests for coalesced llm.delta emission."""
+
+    def _create_audio_message(self, audio_data: bytes, sample_rate: int = 16000) -> bytes:
+        """Create binary audio message with header."""
+        header = json.dumps({"type": "vad.audio", "sampleRate": sample_rate}).encode()
+        header_length = len(header).to_bytes(4, byteorder="little")
+        return header_length + header + audio_data
+
+    def test_fast_tokens_are_coalesced(self, client: TestClient, monkeypatch, capsys):
+        """Test many fast tokens produce fewer llm.delta frames with same text."""
+        from collections.abc import AsyncIterator
+        from unittest.mock import MagicMock
+
+        from voice_assistant.stt import TranscriptionResult
+        from voice_assistant.tts.base import TTSResult
+
+        tokens = [f"t{i}" for i in range(50)]
+
+        async def mock_transcribe(audio_data: bytes, sample_rate: int):
+            return TranscriptionResult(text="テスト", latency_ms=10.0)
+
+        async def mock_stream_completion(messages) -> AsyncIterator[str]:
+            for token in tokens:
+                yield token
+
+        async def mock_synthesize(text: str):
+            return TTSResult(audio=b"\x00\x01", sample_rate=44100, latency_ms=1.0)
+
+        mock_stt = MagicMock()
+        mock_stt.transcribe = mock_transcribe
+        mock_llm = MagicMock()
+        mock_llm.stream_completion = mock_stream_completion
+        mock_tts = FakeTTS(mock_synthesize)
+
+        monkeypatch.setattr(
+            "voice_assistant.api.websocket.get_stt_service", lambda: mock_stt
+        )
+        monkeypatch.setattr(
+            "voice_assistant.api.websocket.get_llm_service", lambda: mock_llm
+        )
+        monkeypatch.setattr(
+            "voice_assistant.api.websocket.get_tts_service", lambda: mock_tts
+        )
+
+        with client.websocket_connect("/api/v1/ws/chat") as websocket:
+            import numpy as np
+
+            websocket.send_text(json.dumps({"type": "vad.start", "timestamp": 1}))
+            audio = np.zeros(4000, dtype=np.float32)
+            websocket.send_bytes(self._create_audio_message(audio.tobytes()))
+            websocket.send_text(json.dumps({"type": "vad.end", "timestamp": 2}))
+
+            events = []
+            while not events or events[-1]["type"] != "tts.end":
+                events.append(websocket.receive_json())
+
+        deltas = [e["text"] for e in events if e["type"] == "llm.delta"]
+        assert deltas[0] == "t0"
+        assert "".join(deltas) == "".join(tokens)
+        assert len(deltas) < len(tokens)
+
+        captured = capsys.readouterr()
+        assert "delta_frames" in captured.out
+
+
+class TestStreamingStt:
+    """Tests for stt.partial events with streaming STT enabled."""
+
+    def _create_audio_message(self, audio_data: bytes, sample_rate: int = 16000) -> bytes:
+        """Create binary audio message with header."""
+        header = json.dumps({"type": "vad.audio", "sampleRate": sample_rate}).encode()
+        header_length = len(header).to_bytes(4, byteorder="little")
+        return header_length + header + audio_data
+
+    def test_partials_sent_before_final(self, client: TestClient, monkeypatch):
+        """Test stt.partial events arrive while audio streams, then stt.final."""
+        from collections.abc import AsyncIterator
+        from unittest.mock import MagicMock
+
+        import numpy as np
+
+        from voice_assistant.core.config import settings
+        from voice_assistant.stt import TranscriptionResult
+        from voice_assistant.stt.base import BaseSTT
+
+        class SecondsSTT(BaseSTT):
+            """Transcribes each second of audio to one character."""
+
+            def __init__(self) -> None:
+                self.calls = 0
+
+            async def transcribe(
+                self, audio_data: bytes, sample_rate: int, use_cache: bool = True
+            ):
+                self.calls += 1
+                seconds = len(audio_data) // 4 // sample_rate
+                return TranscriptionResult(text="あ" * seconds, latency_ms=1.0)
+
+        async def mock_stream_completion(messages) -> AsyncIterator[str]:
+            return
+            yield
+
+        stt = SecondsSTT()
+        mock_llm = MagicMock()
+        mock_llm.stream_completion = mock_stream_completion
+
+        monkeypatch.setattr(settings, "stt_streaming", True)
+        monkeypatch.setattr(settings, "stt_partial_interval_ms", 1000.0)
+        monkeypatch.setattr(settings, "stt_window_sec", 30.0)
+        monkeypatch.setattr(
+            "voice_assistant.api.websocket.get_stt_service", lambda: stt
+        )
+        monkeypatch.setattr(
+            "voice_assistant.api.websocket.get_llm_service", lambda: mock_llm
+        )
+
+        with client.websocket_connect("/api/v1/ws/chat") as websocket:
+            websocket.send_text(json.dumps({"type": "vad.start", "timestamp": 1}))
+            one_second = np.zeros(16000, dtype=np.float32).tobytes()
+            partials = []
+            for _ in range(3):
+                websocket.send_bytes(self._create_audio_message(one_second))
+                partials.append(websocket.receive_json())
+            websocket.send_text(json.dumps({"type": "vad.end", "timestamp": 2}))
+            final = websocket.receive_json()
+
+        assert [p["type"] for p in partials] == ["stt.partial"] * 3
+        assert [p["text"] for p in partials] == ["あ", "ああ", "あああ"]
+        assert final["type"] == "stt.final"
+        assert final["text"] == "あああ"
+        # The final result reused the last partial decode
+        assert stt.calls == 3
+
+
+class TestTtsFrameStreaming:
+    """Tests for progressive tts.chunk frames within a sentence."""
+
+    def _create_audio_message(self, audio_data: bytes, sample_rate: int = 16000) -> bytes:
+        """Create binary audio message with header."""
+        header = json.dumps({"type": "vad.audio", "sampleRate": sample_rate}).encode()
+        header_length = len(header).to_bytes(4, byteorder="little")
+        return header_length + header + audio_data
+
+    def test_long_sentence_is_sent_in_frames(self, client: TestClient, monkeypatch):
+        """Test a sentence's audio arrives as several fixed-size tts.chunk frames."""
+        import base64
+        from collections.abc import AsyncIterator
+        from unittest.mock import MagicMock
+
+        import numpy as np
+
+        from voice_assistant.core.config import settings
+        from voice_assistant.stt import TranscriptionResult
+        from voice_assistant.tts.base import TTSResult
+
+        # 1 second at 16 kHz, 200 ms frames -> 5 frames
+        pcm = np.arange(16000, dtype=np.int16).tobytes()
+
+        async def mock_transcribe(audio_data: bytes, sample_rate: int):
+            return TranscriptionResult(text="テスト", latency_ms=10.0)
+
+        async def mock_stream_completion(messages) -> AsyncIterator[str]:
+            yield "長い応答です。"
+
+        async def mock_synthesize(text: str):
+            return TTSResult(audio=pcm, sample_rate=16000, latency_ms=10.0)
+
+        mock_stt = MagicMock()
+        mock_stt.transcribe = mock_transcribe
+        mock_llm = MagicMock()
+        mock_llm.stream_completion = mock_stream_completion
+
+        monkeypatch.setattr(settings, "tts_frame_ms", 200.0)
+        monkeypatch.setattr(
+            "voice_assistant.api.websocket.get_stt_service", lambda: mock_stt
+        )
+        monkeypatch.setattr(
+            "voice_assistant.api.websocket.get_llm_service", lambda: mock_llm
+        )
+        monkeypatch.setattr(
+            "voice_assistant.api.websocket.get_tts_service",
+            lambda: FakeTTS(mock_synthesize),
+        )
+
+        with client.websocket_connect("/api/v1/ws/chat") as websocket:
+            websocket.send_text(json.dumps({"type": "vad.start", "timestamp": 1}))
+            audio = np.zeros(4000, dtype=np.float32)
+            websocket.send_bytes(self._create_audio_message(audio.tobytes()))
+            websocket.send_text(json.dumps({"type": "vad.end", "timestamp": 2}))
+
+            events = []
+            while not events or events[-1]["type"] != "tts.end":
+                events.append(websocket.receive_json())
+
+        chunks = [e for e in events if e["type"] == "tts.chunk"]
+        frames = [base64.b64decode(c["audio"]) for c in chunks]
+        assert len(frames) == 5
+        assert {len(f) for f in frames} == {6400}
+        assert b"".join(frames) == pcm
+
+
+class TestAudioBuffer:
+    """Tests for the preallocated float32 AudioBuffer."""
+
+    def test_appends_memoryview_chunks(self):
+        """Test chunks (bytes or memoryview) are stored contiguously."""
+        import numpy as np
+
+        from voice_assistant.api.websocket import AudioBuffer
+
+        buffer = AudioBuffer(max_duration_sec=10)
+        first = np.arange(100, dtype=np.float32)
+        second = np.arange(100, 250, dtype=np.float32)
+        frame = b"header" + second.tobytes()
+
+        assert buffer.add_chunk(first.tobytes()) == 100
+        assert buffer.add_chunk(memoryview(frame)[6:]) == 150
+
+        np.testing.assert_array_equal(
+            buffer.get_array(), np.arange(250, dtype=np.float32)
+        )
+        assert len(buffer.get_audio()) == 250 * 4
+        assert buffer.chunk_count == 2
+
+    def test_audio_view_is_zero_copy(self):
+        """Test get_array and get_audio share memory with the buffer."""
+        import numpy as np
+
+        from voice_assistant.api.websocket import AudioBuffer
+
+        buffer = AudioBuffer(max_duration_sec=10)
+        buffer.add_chunk(np.ones(10, dtype=np.float32).tobytes())
+
+        view = buffer.get_array()
+        assert np.shares_memory(view, buffer.get_array())
+        assert np.shares_memory(np.frombuffer(buffer.get_audio(), np.float32), view)
+
+    def test_grows_geometrically(self):
+        """Test capacity doubles instead of growing per chunk."""
+        import numpy as np
+
+        from voice_assistant.api.websocket import AudioBuffer
+
+        buffer = AudioBuffer(max_duration_sec=60)
+        chunk = np.zeros(16000, dtype=np.float32).tobytes()
+        capacities = set()
+        for _ in range(12):
+            buffer.add_chunk(chunk)
+            capacities.add(len(buffer._data))
+
+        assert sorted(capacities) == [80000, 160000, 320000]
+        assert buffer.duration_sec == 12.0
+
+    def test_truncates_at_max_duration(self):
+        """Test audio past the max duration is dropped and reported."""
+        import numpy as np
+
+        from voice_assistant.api.websocket import AudioBuffer
+
+        buffer = AudioBuffer(max_duration_sec=1, overflow_policy="truncate")
+        chunk = np.zeros(12000, dtype=np.float32).tobytes()
+
+        assert buffer.add_chunk(chunk) == 12000
+        assert buffer.add_chunk(chunk) == 4000
+        assert buffer.add_chunk(chunk) == 0
+
+        assert buffer.overflowed
+        assert buffer.dropped_samples == 20000
+        assert len(buffer.get_array()) == 16000
+        assert len(buffer._data) == 16000
+
+    def test_detach_hands_over_samples(self):
+        """Test detach moves the array without copying and resets the buffer."""
+        import numpy as np
+
+        from voice_assistant.api.websocket import AudioBuffer
+
+        buffer = AudioBuffer(max_duration_sec=10)
+        buffer.add_chunk(np.ones(10, dtype=np.float32).tobytes())
+        view = buffer.get_array()
+
+        detached = buffer.detach()
+
+        assert np.shares_memory(detached.get_array(), view)
+        assert not buffer.has_audio()
+        assert detached.has_audio()
+
+        buffer.add_chunk(np.zeros(5, dtype=np.float32).tobytes())
+        np.testing.assert_array_equal(detached.get_array(), np.ones(10))
+
+    def test_mismatched_sample_rate_is_dropped(self):
+        """Test a chunk at another rate is not appended to buffered audio."""
+        import numpy as np
+
+        from voice_assistant.api.websocket import AudioBuffer
+
+        buffer = AudioBuffer(max_duration_sec=10)
+        assert buffer.add_chunk(np.ones(10, dtype=np.float32), 16000) == 10
+        assert buffer.add_chunk(np.ones(30, dtype=np.float32), 48000) == 0
+
+        assert buffer.sample_rate == 16000
+        assert len(buffer.get_array()) == 10
+
+    def test_error_policy_rejects_long_utterance(
+        self, client: TestClient, monkeypatch
+    ):
+        """Test the error policy sends AUDIO_TOO_LONG instead of running STT."""
+        from unittest.mock import AsyncMock, MagicMock
+
+        import numpy as np
+
+        from voice_assistant.core.config import settings
+
+        mock_stt = MagicMock()
+        mock_stt.transcribe = AsyncMock()
+
+        monkeypatch.setattr(settings, "audio_buffer_max_sec", 0.1)
+        monkeypatch.setattr(settings, "audio_buffer_overflow", "error")
+        monkeypatch.setattr(
+            "voice_assistant.api.websocket.get_stt_service", lambda: mock_stt
+        )
+
+        header = json.dumps({"type": "vad.audio", "sampleRate": 16000}).encode()
+        audio = np.zeros(4000, dtype=np.float32).tobytes()
+        message = len(header).to_bytes(4, byteorder="little") + header + audio
+
+        with client.websocket_connect("/api/v1/ws/chat") as websocket:
+            websocket.send_text(json.dumps({"type": "vad.start", "timestamp": 1}))
+            websocket.send_bytes(message)
+            websocket.send_text(json.dumps({"type": "vad.end", "timestamp": 2}))
+            response = websocket.receive_json()
+
+        assert response["type"] == "error"
+        assert response["code"] == "AUDIO_TOO_LONG"
+        mock_stt.transcribe.assert_not_called()
+
+
+class TestUplinkFormats:
+    """Tests for the vad.audio header format field."""
+
+    def _create_audio_message(
+        self,
+        audio_data: bytes,
+        audio_format: str | None = None,
+        sample_rate: int = 16000,
+    ) -> bytes:
+        """Create binary audio message with an optional format field."""
+        header: dict = {"type": "vad.audio", "sampleRate": sample_rate}
+        if audio_format is not None:
+            header["format"] = audio_format
+        header_bytes = json.dumps(header).encode()
+        header_length = len(header_bytes).to_bytes(4, byteorder="little")
+        return header_length + header_bytes + audio_data
+
+    def _transcribe_turn(self, client, monkeypatch, *messages: bytes):
+        """Send one utterance and return the float32 audio STT received."""
+        from unittest.mock import MagicMock
+
+        import numpy as np
+
+        from voice_assistant.stt import TranscriptionResult
+
+        received = []
+
+        async def mock_transcribe(audio_data, sample_rate: int):
+            assert sample_rate == 16000
+            received.append(np.frombuffer(audio_data, dtype=np.float32).copy())
+            return TranscriptionResult(text="", latency_ms=1.0)
+
+        mock_stt = MagicMock()
+        mock_stt.transcribe = mock_transcribe
+        monkeypatch.setattr(
+            "voice_assistant.api.websocket.get_stt_service", lambda: mock_stt
+        )
+
+        with client.websocket_connect("/api/v1/ws/chat") as websocket:
+            websocket.send_text(json.dumps({"type": "vad.start", "timestamp": 1}))
+            for message in messages:
+                websocket.send_bytes(message)
+            websocket.send_text(json.dumps({"type": "vad.end", "timestamp": 2}))
+            websocket.receive_json()  # stt.final
+
+        return received
+
+    def test_s16_audio_is_decoded(self, client: TestClient, monkeypatch):
+        """Test Int16 PCM frames reach STT as float32 samples."""
+        import numpy as np
+
+        pcm = np.array([0, 16384, -16384, -32768] * 100, dtype="<i2").tobytes()
+
+        received = self._transcribe_turn(
+            client, monkeypatch, self._create_audio_message(pcm, "s16")
+        )
+
+        assert len(received) == 1
+        np.testing.assert_allclose(received[0][:4], [0.0, 0.5, -0.5, -1.0])
+        assert len(received[0]) == 400
+
+    def test_other_sample_rates_are_resampled(self, client: TestClient, monkeypatch):
+        """Test 48 kHz and 44.1 kHz frames reach STT as 16 kHz audio."""
+        import numpy as np
+
+        messages = [
+            self._create_audio_message(
+                np.zeros(4800, dtype=np.float32).tobytes(), sample_rate=48000
+            ),
+            self._create_audio_message(
+                np.zeros(4410, dtype="<i2").tobytes(), "s16", sample_rate=44100
+            ),
+        ]
+
+        received = self._transcribe_turn(client, monkeypatch, *messages)
+
+        assert len(received) == 1
+        assert len(received[0]) == 3200
+
+    def test_unknown_format_is_dropped(self, client: TestClient, monkeypatch):
+        """Test frames with an unsupported format are not buffered."""
+        from unittest.mock import AsyncMock, MagicMock
+
+        import numpy as np
+
+        audio = np.ones(400, dtype=np.float32).tobytes()
+        mock_stt = MagicMock()
+        mock_stt.transcribe = AsyncMock()
+        monkeypatch.setattr(
+            "voice_assistant.api.websocket.get_stt_service", lambda: mock_stt
+        )
+
+        with client.websocket_connect("/api/v1/ws/chat") as websocket:
+            websocket.send_text(json.dumps({"type": "vad.start", "timestamp": 1}))
+            websocket.send_bytes(self._create_audio_message(audio, "mp3"))
+            websocket.send_text(json.dumps({"type": "vad.end", "timestamp": 2}))
+            websocket.send_text(json.dumps({"type": "vad.start", "timestamp": 3}))
+
+        mock_stt.transcribe.assert_not_called()
+
+
+class TestAudioBankPlayback:
+    """Tests for pre-rendered error audio."""
+
+    def _create_audio_message(self, audio_data: bytes, sample_rate: int = 16000) -> bytes:
+        """Create binary audio message with header."""
+        header = json.dumps({"type": "vad.audio", "sampleRate": sample_rate}).encode()
+        header_length = len(header).to_bytes(4, byteorder="little")
+        return header_length + header + audio_data
+
+    def _built_bank(self, pcm: bytes):
+        """Build an audio bank whose every utterance is ``pcm``."""
+        import asyncio
+
+        from voice_assistant.tts import AudioBank, TTSResult
+
+        async def render(text: str):
+            return TTSResult(audio=pcm, sample_rate=16000, latency_ms=1.0)
+
+        bank = AudioBank({"llm_rate_limit": "混雑中です。", "tts_error": "失敗です。"})
+        asyncio.run(bank.build(FakeTTS(render), model_version="v1"))
+        return bank
+
+    def _run_turn(self, client: TestClient, until: str) -> list[dict]:
+        import numpy as np
+
+        with client.websocket_connect("/api/v1/ws/chat") as websocket:
+            websocket.send_text(json.dumps({"type": "vad.start", "timestamp": 1}))
+            audio = np.zeros(4000, dtype=np.float32)
+            websocket.send_bytes(self._create_audio_message(audio.tobytes()))
+            websocket.send_text(json.dumps({"type": "vad.end", "timestamp": 2}))
+
+            events = [websocket.receive_json()]
+            while events[-1]["type"] != until:
+                events.append(websocket.receive_json())
+        return events
+
+    def test_llm_error_is_spoken_from_bank(self, client: TestClient, monkeypatch):
+        """Test the rate-limit error is followed by its pre-rendered audio."""
+        import base64
+        from unittest.mock import MagicMock
+
+        import numpy as np
+        from openai import RateLimitError
+
+        from voice_assistant.core.config import settings
+        from voice_assistant.stt import TranscriptionResult
+
+        pcm = np.arange(3200, dtype=np.int16).tobytes()  # 200 ms at 16 kHz
+
+        async def mock_transcribe(audio_data: bytes, sample_rate: int):
+            return TranscriptionResult(text="test", latency_ms=50.0)
+
+        async def mock_stream_completion(messages):
+            raise RateLimitError(
+                message="Rate limit exceeded",
+                response=MagicMock(status_code=429),
+                body=None,
+            )
+            yield  # Make it a generator
+
+        mock_stt = MagicMock()
+        mock_stt.transcribe = mock_transcribe
+        mock_llm = MagicMock()
+        mock_llm.stream_completion = mock_stream_completion
+        bank = self._built_bank(pcm)
+
+        monkeypatch.setattr(settings, "tts_frame_ms", 100.0)
+        monkeypatch.setattr(
+            "voice_assistant.api.websocket.get_stt_service", lambda: mock_stt
+        )
+        monkeypatch.setattr(
+            "voice_assistant.api.websocket.get_llm_service", lambda: mock_llm
+        )
+        monkeypatch.setattr(
+            "voice_assistant.api.websocket.get_audio_bank", lambda: bank
+        )
+
+        with client.websocket_connect("/api/v1/ws/chat") as websocket:
+            websocket.send_text(json.dumps({"type": "vad.start", "timestamp": 1}))
+            audio = np.zeros(4000, dtype=np.float32)
+            websocket.send_bytes(self._create_audio_message(audio.tobytes()))
+            websocket.send_text(json.dumps({"type": "vad.end", "timestamp": 2}))
+
+            events = [websocket.receive_json() for _ in range(5)]
+
+        assert [e["type"] for e in events] == [
+            "stt.final",
+            "llm.start",
+            "error",
+            "tts.chunk",
+            "tts.chunk",
+        ]
+        frames = [base64.b64decode(e["audio"]) for e in events[3:]]
+        assert b"".join(frames) == pcm
+        assert bank.stats()["plays"] == 1
+
+    def test_tts_failure_is_spoken_once_per_turn(
+        self, client: TestClient, monkeypatch
+    ):
+        """Test failing sentences produce one spoken TTS error, not one each."""
+        from collections.abc import AsyncIterator
+        from unittest.mock import MagicMock
+
+        from voice_assistant.stt import TranscriptionResult
+
+        async def mock_transcribe(audio_data: bytes, sample_rate: int):
+            return TranscriptionResult(text="test", latency_ms=50.0)
+
+        async def mock_stream_completion(messages) -> AsyncIterator[str]:
+            yield "一文目です。"
+            yield "二文目です。"
+
+        async def failing_synthesize(text: str):
+            raise RuntimeError("synthesis failed")
+
+        mock_stt = MagicMock()
+        mock_stt.transcribe = mock_transcribe
+        mock_llm = MagicMock()
+        mock_llm.stream_completion = mock_stream_completion
+        bank = self._built_bank(b"\x01\x00" * 160)
+
+        monkeypatch.setattr(
+            "voice_assistant.api.websocket.get_stt_service", lambda: mock_stt
+        )
+        monkeypatch.setattr(
+            "voice_assistant.api.websocket.get_llm_service", lambda: mock_llm
+        )
+        monkeypatch.setattr(
+            "voice_assistant.api.websocket.get_tts_service",
+            lambda: FakeTTS(failing_synthesize),
+        )
+        monkeypatch.setattr(
+            "voice_assistant.api.websocket.get_audio_bank", lambda: bank
+        )
+
+        events = self._run_turn(client, until="tts.end")
+
+        types = [e["type"] for e in events]
+        assert types.count("error") == 2
+        assert types.count("tts.chunk") == 1
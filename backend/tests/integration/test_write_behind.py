@@ -0,0 +1,137 @@
+"""Integration tests for the write-behind persistence queue."""
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from voice_assistant.db import (
+    ConversationRepository,
+    MessageRepository,
+    WriteBehindQueue,
+    get_engine,
+    init_db,
+)
+
+
+@pytest.fixture
+def temp_db():
+    """Create a temporary database for testing."""
+    import voice_assistant.db.repository as repo_module
+
+    # Reset the global engine
+    original_engine = repo_module._engine
+    repo_module._engine = None
+
+    with TemporaryDirectory() as tmpdir:
+        db_path = Path(tmpdir) / "test.db"
+        init_db(db_path)
+        engine = get_engine(db_path)
+        yield engine
+
+        # Reset engine after test
+        repo_module._engine = original_engine
+
+
+@pytest.fixture
+def write_queue(temp_db):
+    """Create a write-behind queue and stop it after the test."""
+    wq = WriteBehindQueue(flush_interval_ms=20, max_batch_size=10)
+    yield wq
+    wq.stop()
+
+
+class TestWriteBehindQueue:
+    """Tests for WriteBehindQueue."""
+
+    def test_writes_are_committed_after_flush(self, temp_db, write_queue):
+        """Should persist queued conversation and messages after flush."""
+        write_queue.create_conversation("conv-1")
+        write_queue.create_message(
+            "msg-1", "conv-1", "user", "こんにちは", stt_latency_ms=100
+        )
+        write_queue.create_message(
+            "msg-2", "conv-1", "assistant", "はい", llm_latency_ms=200
+        )
+        write_queue.update_conversation_title("conv-1", "こんにちは")
+
+        assert write_queue.flush()
+
+        with Session(temp_db) as session:
+            conv = ConversationRepository(session).get("conv-1")
+            messages = MessageRepository(session).list_by_conversation("conv-1")
+
+        assert conv is not None
+        assert conv.title == "こんにちは"
+        assert [m.id for m in messages] == ["msg-1", "msg-2"]
+        assert messages[0].stt_latency_ms == 100
+        assert messages[1].llm_latency_ms == 200
+
+    def test_writes_are_batched(self, temp_db, write_queue):
+        """Should commit writes queued together in a single batch."""
+        write_queue.create_conversation("conv-1")
+        for i in range(5):
+            write_queue.create_message(f"msg-{i}", "conv-1", "user", f"text {i}")
+
+        assert write_queue.flush()
+
+        stats = write_queue.stats()
+        assert stats["written"] == 6
+        assert stats["batches"] < 6
+        assert stats["depth"] == 0
+        assert stats["last_flush_latency_ms"] >= 0
+
+    def test_failed_write_does_not_drop_batch(self, temp_db, write_queue):
+        """Should keep valid writes when one write in the batch fails."""
+        write_queue.create_conversation("conv-1")
+        write_queue.create_message("msg-1", "missing-conv", "user", "orphan")
+        write_queue.create_message("msg-2", "conv-1", "user", "valid")
+
+        assert write_queue.flush()
+
+        with Session(temp_db) as session:
+            repo = MessageRepository(session)
+            assert repo.get("msg-2") is not None
+            assert repo.get("msg-1") is None
+
+        stats = write_queue.stats()
+        assert stats["written"] == 2
+        assert stats["failed"] == 1
+
+    def test_stop_commits_pending_writes(self, temp_db):
+        """Should commit queued writes when stopped."""
+        wq = WriteBehindQueue(flush_interval_ms=1000, max_batch_size=100)
+        wq.create_conversation("conv-1")
+        wq.stop()
+
+        with Session(temp_db) as session:
+            assert ConversationRepository(session).get("conv-1") is not None
+
+    def test_restarts_after_stop(self, temp_db, write_queue):
+        """Should start the writer again when used after stop."""
+        write_queue.create_conversation("conv-1")
+        write_queue.stop()
+
+        write_queue.create_conversation("conv-2")
+        assert write_queue.flush()
+
+        with Session(temp_db) as session:
+            assert ConversationRepository(session).get("conv-2") is not None
+
+
+class TestMetricsEndpoint:
+    """Tests for GET /api/v1/metrics."""
+
+    def test_metrics_include_persistence_stats(self, temp_db):
+        """Should expose write-behind queue depth and flush latency."""
+        from voice_assistant.main import app
+
+        client = TestClient(app)
+        response = client.get("/api/v1/metrics")
+
+        assert response.status_code == 200
+        persistence = response.json()["persistence"]
+        assert "depth" in persistence
+        assert "last_flush_latency_ms" in persistence
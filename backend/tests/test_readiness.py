@@ -0,0 +1,280 @@
+"""Tests for readiness endpoint and model preloading"""
+
+from collections.abc import AsyncGenerator
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from voice_assistant.core.readiness import readiness
+from voice_assistant.main import app
+
+
+@pytest.fixture
+async def client() -> AsyncGenerator[AsyncClient, None]:
+    """Create async test client."""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
+
+
+@pytest.fixture(autouse=True)
+def reset_readiness():
+    """Start and end each test with no registered components."""
+    readiness.reset()
+    yield
+    readiness.reset()
+
+
+class FakeEngine:
+    """Engine whose warmup records calls and optionally fails."""
+
+    def __init__(self, error: Exception | None = None) -> None:
+        self.warmed_up = False
+        self._error = error
+
+    async def warmup(self) -> None:
+        if self._error is not None:
+            raise self._error
+        self.warmed_up = True
+
+
+class TestReadinessEndpoint:
+    """Tests for /api/v1/ready."""
+
+    @pytest.mark.asyncio
+    async def test_ready_without_preloading(self, client: AsyncClient):
+        """Test the service is ready when no models are preloaded."""
+        response = await client.get("/api/v1/ready")
+
+        assert response.status_code == 200
+        assert response.json() == {"status": "ready", "components": {}}
+
+    @pytest.mark.asyncio
+    async def test_not_ready_while_loading(self, client: AsyncClient):
+        """Test 503 is returned until every component is ready."""
+        readiness.register("stt")
+        readiness.set_state("tts", "ready", warmup_ms=1.0)
+
+        response = await client.get("/api/v1/ready")
+
+        assert response.status_code == 503
+        assert response.json()["status"] == "starting"
+        assert response.json()["components"]["stt"] == {"state": "pending"}
+
+    @pytest.mark.asyncio
+    async def test_health_is_independent_of_readiness(self, client: AsyncClient):
+        """Test liveness stays ok while models are loading."""
+        readiness.register("stt")
+
+        response = await client.get("/api/v1/health")
+
+        assert response.status_code == 200
+
+
+class TestPreloadModels:
+    """Tests for preload_models."""
+
+    @pytest.mark.asyncio
+    async def test_warms_up_both_engines(self, monkeypatch):
+        """Test STT and TTS are warmed up and marked ready."""
+        from voice_assistant import main
+
+        stt, tts = FakeEngine(), FakeEngine()
+        monkeypatch.setattr(main, "get_stt_service", lambda: stt)
+        monkeypatch.setattr(main, "get_tts_service", lambda: tts)
+
+        await main.preload_models()
+
+        assert stt.warmed_up and tts.warmed_up
+        assert readiness.is_ready
+        assert set(readiness.snapshot()["components"]) == {"stt", "tts"}
+
+    @pytest.mark.asyncio
+    async def test_failure_is_reported(self, monkeypatch):
+        """Test a failed warm-up marks the service as failed, not ready."""
+        from voice_assistant import main
+
+        monkeypatch.setattr(
+            main, "get_stt_service", lambda: FakeEngine(RuntimeError("no gpu"))
+        )
+        monkeypatch.setattr(main, "get_tts_service", lambda: FakeEngine())
+
+        await main.preload_models()
+
+        snapshot = readiness.snapshot()
+        assert not readiness.is_ready
+        assert snapshot["status"] == "failed"
+        assert snapshot["components"]["stt"] == {"state": "failed", "error": "no gpu"}
+        assert snapshot["components"]["tts"]["state"] == "ready"
+
+    @pytest.mark.asyncio
+    async def test_missing_tts_model_is_failed(self, monkeypatch, tmp_path):
+        """Test missing TTS model files fail preload as they fail the bank."""
+        from voice_assistant import main
+        from voice_assistant.tts.style_bert_vits2 import StyleBertVits2TTS
+
+        tts = StyleBertVits2TTS(device="cpu", model_dir=tmp_path / "missing")
+        monkeypatch.setattr(main, "get_stt_service", lambda: FakeEngine())
+        monkeypatch.setattr(main, "get_tts_service", lambda: tts)
+
+        await main.preload_models()
+
+        assert readiness.snapshot()["components"]["tts"] == {
+            "state": "failed",
+            "error": "TTS model files not found",
+        }
+
+
+class TestBuildAudioBank:
+    """Tests for the audio bank startup stage."""
+
+    @pytest.mark.asyncio
+    async def test_bank_is_built_and_marked_ready(self, monkeypatch):
+        """Test the bank is rendered with the model hash and reported ready."""
+        from voice_assistant import main
+        from voice_assistant.tts import AudioBank, TTSResult
+
+        calls = []
+
+        class FakeTTS:
+            speaker_id = 0
+            style = "Neutral"
+
+            def model_identity(self):
+                return "model-hash", 1000
+
+            async def warmup(self):
+                calls.append("warmup")
+
+            async def synthesize(self, text):
+                calls.append("synthesize")
+                return TTSResult(audio=b"\x00\x00", sample_rate=1000, latency_ms=1.0)
+
+        bank = AudioBank({"wait": "少々お待ちください。"})
+        monkeypatch.setattr(main.settings, "preload_models", False)
+        monkeypatch.setattr(main, "get_tts_service", lambda: FakeTTS())
+        monkeypatch.setattr(main, "get_audio_bank", lambda: bank)
+
+        await main.build_audio_bank()
+
+        # The model is loaded through warmup (off the event loop) first
+        assert calls == ["warmup", "synthesize"]
+        assert bank.model_version == "model-hash:speaker=0:style=Neutral:rate=1000"
+        assert readiness.snapshot()["components"]["audio_bank"] == {
+            "state": "ready",
+            "entries": 1,
+        }
+
+    @pytest.mark.asyncio
+    async def test_voice_change_rerenders_stored_clips(self, monkeypatch, tmp_path):
+        """Test a new speaker or style re-renders clips of the same model."""
+        from voice_assistant import main
+        from voice_assistant.tts import AudioBank, TTSResult
+
+        class FakeTTS:
+            def __init__(self, style):
+                self.speaker_id = 0
+                self.style = style
+                self.texts = []
+
+            def model_identity(self):
+                return "model-hash", 1000
+
+            async def warmup(self):
+                pass
+
+            async def synthesize(self, text):
+                self.texts.append(text)
+                return TTSResult(audio=b"\x00\x00", sample_rate=1000, latency_ms=1.0)
+
+        monkeypatch.setattr(main.settings, "preload_models", False)
+        rendered = {}
+        for style in ("Neutral", "Neutral", "Happy"):
+            tts = FakeTTS(style)
+            bank = AudioBank({"wait": "少々お待ちください。"}, disk_dir=tmp_path)
+            monkeypatch.setattr(main, "get_tts_service", lambda tts=tts: tts)
+            monkeypatch.setattr(main, "get_audio_bank", lambda bank=bank: bank)
+            await main.build_audio_bank()
+            rendered[style] = rendered.get(style, 0) + len(tts.texts)
+
+        # Rendered once in the first voice (then loaded), again in the new one
+        assert rendered == {"Neutral": 1, "Happy": 1}
+
+    @pytest.mark.asyncio
+    async def test_missing_model_fails(self, monkeypatch):
+        """Test the stage fails when the TTS model files are missing."""
+        from voice_assistant import main
+
+        class NoModelTTS:
+            def model_identity(self):
+                return None
+
+        monkeypatch.setattr(main, "get_tts_service", lambda: NoModelTTS())
+
+        await main.build_audio_bank()
+
+        assert readiness.snapshot()["components"]["audio_bank"]["state"] == "failed"
+
+
+class TestShutdown:
+    """Tests for resources released when the app shuts down."""
+
+    @pytest.mark.asyncio
+    async def test_stt_service_is_closed(self, monkeypatch):
+        """Test shutdown closes the STT service (stopping worker processes)."""
+        from voice_assistant import main
+        from voice_assistant.api import websocket
+
+        class ClosableSTT:
+            closed = False
+
+            def close(self):
+                self.closed = True
+
+        stt = ClosableSTT()
+        monkeypatch.setattr(main.settings, "preload_models", False)
+        monkeypatch.setattr(main.settings, "tts_audio_bank", False)
+        monkeypatch.setattr(websocket, "_stt_service", stt)
+
+        async with main.lifespan(main.app):
+            pass
+
+        assert stt.closed
+        assert websocket._stt_service is None
+
+
+class TestMetricsEndpoint:
+    """Tests for /api/v1/metrics."""
+
+    @pytest.mark.asyncio
+    async def test_metrics_do_not_create_engines(
+        self, client: AsyncClient, monkeypatch
+    ):
+        """Test engines and the bank are reported only once they exist."""
+        from voice_assistant.api import websocket
+
+        monkeypatch.setattr(websocket, "_stt_service", None)
+        monkeypatch.setattr(websocket, "_tts_service", None)
+        monkeypatch.setattr(websocket, "_audio_bank", None)
+
+        response = await client.get("/api/v1/metrics")
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["stt"] is None and body["tts"] is None
+        assert body["audio_bank"] is None
+        assert websocket.peek_stt_service() is None
+        assert websocket.peek_tts_service() is None
+        assert websocket.peek_audio_bank() is None
+
+    @pytest.mark.asyncio
+    async def test_metrics_report_existing_bank(self, client: AsyncClient, monkeypatch):
+        """Test a created component's stats are included."""
+        from voice_assistant.api import websocket
+        from voice_assistant.tts import AudioBank
+
+        monkeypatch.setattr(websocket, "_audio_bank", AudioBank({}))
+
+        response = await client.get("/api/v1/metrics")
+
+        assert response.json()["audio_bank"]["entries"] == 0
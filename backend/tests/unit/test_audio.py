@@ -0,0 +1,270 @@
+"""Unit tests for audio processing utilities."""
+
+import numpy as np
+import pytest
+
+
+class TestDecodePcm:
+    """Tests for decode_pcm."""
+
+    def test_f32_is_zero_copy(self) -> None:
+        """Test float32 payloads are returned as a view of the input."""
+        from voice_assistant.audio import decode_pcm
+
+        original = np.array([0.1, -0.2, 0.3], dtype=np.float32)
+        payload = bytearray(original.tobytes())
+
+        samples = decode_pcm(memoryview(payload), "f32")
+
+        np.testing.assert_array_equal(samples, original)
+        assert np.shares_memory(samples, np.frombuffer(payload, dtype=np.float32))
+
+    def test_s16_is_scaled_to_float(self) -> None:
+        """Test int16 payloads are converted to float32 in [-1, 1]."""
+        from voice_assistant.audio import decode_pcm
+
+        pcm = np.array([0, 16384, -32768, 32767], dtype="<i2").tobytes()
+
+        samples = decode_pcm(pcm, "s16")
+
+        assert samples.dtype == np.float32
+        np.testing.assert_allclose(samples, [0.0, 0.5, -1.0, 32767 / 32768])
+
+    def test_trailing_partial_sample_is_ignored(self) -> None:
+        """Test an incomplete trailing sample does not raise."""
+        from voice_assistant.audio import decode_pcm
+
+        assert len(decode_pcm(b"\x00" * 7, "f32")) == 1
+        assert len(decode_pcm(b"\x00" * 5, "s16")) == 2
+
+    def test_unknown_format_raises(self) -> None:
+        """Test unknown formats raise UnsupportedAudioFormatError."""
+        from voice_assistant.audio import UnsupportedAudioFormatError, decode_pcm
+
+        with pytest.raises(UnsupportedAudioFormatError):
+            decode_pcm(b"\x00\x00", "mp3")
+
+
+class TestStreamingResampler:
+    """Tests for StreamingResampler."""
+
+    @pytest.mark.parametrize("source_rate", [8000, 22050, 44100, 48000])
+    def test_chunked_output_matches_one_shot(self, source_rate: int) -> None:
+        """Test chunk boundaries do not change the resampled signal."""
+        from voice_assistant.audio import StreamingResampler
+
+        rng = np.random.default_rng(0)
+        audio = rng.standard_normal(source_rate // 2).astype(np.float32)
+
+        whole = StreamingResampler(source_rate, 16000).process(audio)
+        resampler = StreamingResampler(source_rate, 16000)
+        chunked = np.concatenate(
+            [resampler.process(chunk) for chunk in np.array_split(audio, 23)]
+        )
+
+        assert whole.dtype == np.float32
+        assert len(whole) == 8000
+        np.testing.assert_allclose(chunked, whole, atol=1e-6)
+
+    def test_preserves_passband_and_removes_alias(self) -> None:
+        """Test a 440 Hz tone survives and a 12 kHz tone is filtered out."""
+        from voice_assistant.audio import StreamingResampler
+
+        t = np.arange(48000) / 48000
+        low = np.sin(2 * np.pi * 440 * t).astype(np.float32)
+        high = np.sin(2 * np.pi * 12000 * t).astype(np.float32)
+
+        low_out = StreamingResampler(48000, 16000).process(low)[1000:]
+        high_out = StreamingResampler(48000, 16000).process(high)[1000:]
+
+        assert np.max(np.abs(low_out)) == pytest.approx(1.0, abs=0.01)
+        assert np.max(np.abs(high_out)) < 1e-3
+
+    def test_filter_bank_is_shared(self) -> None:
+        """Test filter banks are cached per rate pair."""
+        from voice_assistant.audio import StreamingResampler
+
+        first = StreamingResampler(44100, 16000)
+        second = StreamingResampler(44100, 16000)
+
+        assert first._bank is second._bank
+        assert not first._bank.flags.writeable
+
+
+class TestUplinkDecoder:
+    """Tests for UplinkDecoder."""
+
+    def test_counts_ingress_bytes(self) -> None:
+        """Test bytes in and samples out are tracked."""
+        from voice_assistant.audio import UplinkDecoder
+
+        decoder = UplinkDecoder()
+        samples, sample_rate = decoder.decode(b"\x00\x00" * 160, "s16", 16000)
+
+        assert len(samples) == 160
+        assert sample_rate == 16000
+        assert decoder.stats()["bytes_in"] == 320
+        assert decoder.stats()["samples_out"] == 160
+
+    def test_resamples_to_target_rate(self) -> None:
+        """Test audio at other rates is returned at the STT rate."""
+        from voice_assistant.audio import UplinkDecoder
+
+        decoder = UplinkDecoder()
+        pcm = np.zeros(480, dtype=np.float32).tobytes()
+
+        for _ in range(3):
+            samples, sample_rate = decoder.decode(pcm, "f32", 48000)
+            assert len(samples) == 160
+            assert sample_rate == 16000
+        assert decoder.stats()["source_rate"] == 48000
+
+    def test_invalid_sample_rate_raises(self) -> None:
+        """Test non-positive or non-integer rates are rejected."""
+        from voice_assistant.audio import UplinkDecoder
+
+        decoder = UplinkDecoder()
+        for rate in (0, -16000, "16000", 16000.5):
+            with pytest.raises(ValueError):
+                decoder.decode(b"\x00" * 4, "f32", rate)
+
+    def test_nonstandard_sample_rate_raises(self) -> None:
+        """Test rates outside the standard set are rejected before resampling."""
+        from voice_assistant.audio import UplinkDecoder
+        from voice_assistant.audio.resample import polyphase_filter_bank
+
+        decoder = UplinkDecoder()
+        cached = polyphase_filter_bank.cache_info().currsize
+        for rate in (383999, 44101, 7999):
+            with pytest.raises(ValueError):
+                decoder.decode(b"\x00" * 4, "f32", rate)
+
+        # No filter bank was designed for them
+        assert polyphase_filter_bank.cache_info().currsize == cached
+        assert decoder.source_rate is None
+
+    def test_opus_round_trip(self) -> None:
+        """Test Opus packets are decoded with a persistent decoder."""
+        opuslib = pytest.importorskip("opuslib")
+        from voice_assistant.audio import UplinkDecoder
+
+        encoder = opuslib.Encoder(16000, 1, opuslib.APPLICATION_VOIP)
+        pcm = (np.sin(np.arange(320) / 5) * 8000).astype(np.int16).tobytes()
+
+        decoder = UplinkDecoder()
+        for _ in range(3):
+            samples, sample_rate = decoder.decode(
+                encoder.encode(pcm, 320), "opus", 16000
+            )
+            assert len(samples) == 320
+            assert sample_rate == 16000
+
+    def test_opus_unavailable_raises(self, monkeypatch) -> None:
+        """Test Opus frames raise a format error when opuslib is missing."""
+        import sys
+
+        from voice_assistant.audio import UnsupportedAudioFormatError, UplinkDecoder
+
+        monkeypatch.setitem(sys.modules, "opuslib", None)
+        decoder = UplinkDecoder()
+
+        for _ in range(2):
+            with pytest.raises(UnsupportedAudioFormatError):
+                decoder.decode(b"\xfc\xff\xfe", "opus", 16000)
+
+
+class TestDownlinkEncoder:
+    """Tests for DownlinkEncoder."""
+
+    def test_native_pcm16_is_passed_through(self) -> None:
+        """Test PCM16 at the engine's rate is sent unchanged."""
+        from voice_assistant.audio import DownlinkEncoder
+
+        pcm = bytes(range(256)) * 4
+        encoder = DownlinkEncoder()
+
+        payloads, sample_rate = encoder.encode(pcm, 44100)
+
+        assert payloads == [pcm]
+        assert sample_rate == 44100
+        assert encoder.flush() == []
+        assert encoder.usage.stats()["payload_bytes"] == len(pcm)
+
+    def test_pcm16_is_resampled(self) -> None:
+        """Test PCM16 is converted to the negotiated rate across frames."""
+        from voice_assistant.audio import DownlinkEncoder
+
+        t = np.arange(44100) / 44100
+        tone = (np.sin(2 * np.pi * 440 * t) * 16000).astype("<i2").tobytes()
+        encoder = DownlinkEncoder(sample_rate=16000)
+
+        out = b""
+        for start in range(0, len(tone), 8820):
+            payloads, sample_rate = encoder.encode(tone[start : start + 8820], 44100)
+            assert sample_rate == 16000
+            out += b"".join(payloads)
+
+        samples = np.frombuffer(out, dtype="<i2")
+        assert abs(len(samples) - 16000) <= 1
+        # The tone survives resampling at its original level
+        assert 15000 < np.abs(samples[1000:]).max() < 17000
+        stats = encoder.usage.stats()
+        assert stats["bytes_in"] == len(tone)
+        assert stats["payload_bytes"] == len(out)
+
+    def test_unknown_format_raises(self) -> None:
+        """Test unknown formats raise UnsupportedAudioFormatError."""
+        from voice_assistant.audio import DownlinkEncoder, UnsupportedAudioFormatError
+
+        with pytest.raises(UnsupportedAudioFormatError):
+            DownlinkEncoder("mp3")
+
+    def test_opus_unavailable_raises(self, monkeypatch) -> None:
+        """Test Opus raises a format error when opuslib is missing."""
+        import sys
+
+        from voice_assistant.audio import (
+            DownlinkEncoder,
+            UnsupportedAudioFormatError,
+            opus_encoder_available,
+        )
+
+        monkeypatch.setitem(sys.modules, "opuslib", None)
+
+        assert not opus_encoder_available()
+        with pytest.raises(UnsupportedAudioFormatError):
+            DownlinkEncoder("opus")
+
+    def test_opus_packets_decode_back(self) -> None:
+        """Test Opus packets are fixed 20 ms frames and the tail is flushed."""
+        opuslib = pytest.importorskip("opuslib")
+        from voice_assistant.audio import DownlinkEncoder, unpack_opus_packets
+
+        pcm = (np.sin(np.arange(44100 // 4) / 5) * 8000).astype("<i2").tobytes()
+        encoder = DownlinkEncoder("opus", 24000, chunk_ms=100)
+
+        payloads, sample_rate = encoder.encode(pcm, 44100)
+        payloads += encoder.flush()
+        packets = [p for payload in payloads for p in unpack_opus_packets(payload)]
+
+        assert sample_rate == 24000
+        # 250 ms of audio (minus the resampler delay) in 20 ms packets,
+        # grouped into payloads of up to 100 ms
+        assert len(packets) == 13
+        assert len(payloads) < len(packets)
+        assert all(len(unpack_opus_packets(p)) <= 5 for p in payloads)
+        decoder = opuslib.Decoder(24000, 1)
+        assert all(len(decoder.decode(p, 480)) == 960 for p in packets)
+        assert encoder.usage.payload_bytes < len(pcm) // 4
+
+    def test_opus_packets_pack_round_trip(self) -> None:
+        """Test packed Opus payloads split back into the same packets."""
+        from voice_assistant.audio import pack_opus_packets, unpack_opus_packets
+
+        packets = [b"\x01" * 60, b"", b"\x02" * 300]
+        payload = pack_opus_packets(packets)
+
+        assert len(payload) == 360 + 3 * 2
+        assert unpack_opus_packets(payload) == packets
+        with pytest.raises(ValueError):
+            unpack_opus_packets(payload[:-1])
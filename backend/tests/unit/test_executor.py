@@ -0,0 +1,122 @@
+"""Unit tests for the inference executor."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+
+class TestInferenceExecutor:
+    """Tests for InferenceExecutor."""
+
+    @pytest.mark.asyncio
+    async def test_runs_on_named_worker(self) -> None:
+        """Test calls run on the executor's own threads with their arguments."""
+        from voice_assistant.core.executor import InferenceExecutor
+
+        executor = InferenceExecutor("stt")
+        try:
+            name = await executor.run(lambda: threading.current_thread().name)
+            total = await executor.run(sum, [1, 2], start=3)
+        finally:
+            executor.shutdown()
+
+        assert name.startswith("stt-inference")
+        assert total == 6
+
+    @pytest.mark.asyncio
+    async def test_bounds_concurrency(self) -> None:
+        """Test no more than max_workers calls run at once."""
+        from voice_assistant.core.executor import InferenceExecutor
+
+        executor = InferenceExecutor("tts", max_workers=2)
+        lock = threading.Lock()
+        running = 0
+        peak = 0
+
+        def work() -> None:
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.02)
+            with lock:
+                running -= 1
+
+        try:
+            await asyncio.gather(*(executor.run(work) for _ in range(6)))
+        finally:
+            executor.shutdown()
+
+        assert peak == 2
+        assert executor.stats()["tasks"] == 6
+
+    @pytest.mark.asyncio
+    async def test_separates_queue_wait_from_inference(self) -> None:
+        """Test queued calls report wait time apart from run time."""
+        from voice_assistant.core.executor import InferenceExecutor
+
+        executor = InferenceExecutor("stt", max_workers=1)
+        try:
+            await asyncio.gather(*(executor.run(time.sleep, 0.03) for _ in range(3)))
+        finally:
+            executor.shutdown()
+
+        stats = executor.stats()
+        assert stats["queued"] == 0
+        assert stats["in_flight"] == 0
+        assert stats["avg_inference_ms"] >= 25
+        # Second and third calls waited for one and two earlier calls
+        assert stats["max_queue_wait_ms"] >= 50
+        assert stats["avg_queue_wait_ms"] >= 25
+
+    @pytest.mark.asyncio
+    async def test_errors_propagate_and_are_counted(self) -> None:
+        """Test exceptions reach the caller and are counted."""
+        from voice_assistant.core.executor import InferenceExecutor
+
+        def fail() -> None:
+            raise ValueError("bad input")
+
+        executor = InferenceExecutor("stt")
+        try:
+            with pytest.raises(ValueError, match="bad input"):
+                await executor.run(fail)
+        finally:
+            executor.shutdown()
+
+        assert executor.stats()["errors"] == 1
+
+    def test_set_torch_threads_applies_process_wide_once(self, monkeypatch) -> None:
+        """Test the torch thread limit is set once, not by executor workers."""
+        import torch
+
+        from voice_assistant.core.executor import set_torch_threads
+
+        calls = []
+        monkeypatch.setattr(torch, "set_num_threads", calls.append)
+
+        set_torch_threads(0)
+        set_torch_threads(2)
+
+        assert calls == [2]
+
+    @pytest.mark.asyncio
+    async def test_workers_leave_torch_threads_alone(self, monkeypatch) -> None:
+        """Test starting a worker does not change torch's thread count."""
+        import torch
+
+        from voice_assistant.core.executor import InferenceExecutor
+
+        calls = []
+        monkeypatch.setattr(torch, "set_num_threads", calls.append)
+
+        executor = InferenceExecutor("tts")
+        try:
+            await executor.run(lambda: None)
+        finally:
+            executor.shutdown()
+
+        assert calls == []
+        assert "torch_threads" not in executor.stats()
@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from voice_assistant.llm.base import BaseLLM, ConversationContext
+from voice_assistant.llm.delta_coalescer import DeltaCoalescer
 from voice_assistant.llm.openai_compat import OpenAICompatLLM
 
 
@@ -139,6 +140,39 @@ class TestOpenAICompatLLM:
 
             assert tokens == []
 
+    @pytest.mark.asyncio
+    async def test_stream_completion_closes_stream_on_early_exit(self) -> None:
+        """Test the upstream stream is closed when the consumer stops early."""
+        from contextlib import aclosing
+
+        llm = OpenAICompatLLM(api_key="test")
+
+        mock_chunk = MagicMock()
+        mock_chunk.choices = [MagicMock(delta=MagicMock(content="token"))]
+
+        class MockStream:
+            def __init__(self) -> None:
+                self.close = AsyncMock()
+
+            async def __aiter__(self) -> AsyncIterator[MagicMock]:
+                while True:
+                    yield mock_chunk
+
+        mock_stream = MockStream()
+
+        with patch.object(
+            llm.client.chat.completions,
+            "create",
+            new_callable=AsyncMock,
+            return_value=mock_stream,
+        ):
+            messages = [{"role": "user", "content": "Hi"}]
+            async with aclosing(llm.stream_completion(messages)) as tokens:
+                async for _ in tokens:
+                    break
+
+        mock_stream.close.assert_awaited_once()
+
 
 class TestBaseLLM:
     """Tests for BaseLLM abstract class."""
@@ -147,3 +181,92 @@ class TestBaseLLM:
         """Test BaseLLM cannot be instantiated directly."""
         with pytest.raises(TypeError):
             BaseLLM()  # type: ignore
+
+
+class TestDeltaCoalescer:
+    """Tests for DeltaCoalescer token batching."""
+
+    @pytest.mark.asyncio
+    async def test_first_token_sent_immediately(self) -> None:
+        """Test the first token is flushed without waiting for the window."""
+        sent: list[str] = []
+
+        async def send(text: str) -> None:
+            sent.append(text)
+
+        coalescer = DeltaCoalescer(send, flush_ms=1000, flush_chars=100)
+        await coalescer.add("こ")
+        assert sent == ["こ"]
+
+        await coalescer.add("ん")
+        assert sent == ["こ"]
+        coalescer.close()
+
+    @pytest.mark.asyncio
+    async def test_size_triggers_flush(self) -> None:
+        """Test buffered tokens are flushed once flush_chars is reached."""
+        sent: list[str] = []
+
+        async def send(text: str) -> None:
+            sent.append(text)
+
+        coalescer = DeltaCoalescer(send, flush_ms=1000, flush_chars=4)
+        for token in ["a", "b", "c", "d", "e"]:
+            await coalescer.add(token)
+
+        assert sent == ["a", "bcde"]
+        assert coalescer.frame_count == 2
+        assert coalescer.token_count == 5
+        coalescer.close()
+
+    @pytest.mark.asyncio
+    async def test_time_window_triggers_flush(self) -> None:
+        """Test buffered tokens are flushed after flush_ms without new tokens."""
+        import asyncio
+
+        sent: list[str] = []
+
+        async def send(text: str) -> None:
+            sent.append(text)
+
+        coalescer = DeltaCoalescer(send, flush_ms=20, flush_chars=100)
+        await coalescer.add("a")
+        await coalescer.add("b")
+        await coalescer.add("c")
+        assert sent == ["a"]
+
+        await asyncio.sleep(0.05)
+        assert sent == ["a", "bc"]
+
+    @pytest.mark.asyncio
+    async def test_flush_sends_remaining(self) -> None:
+        """Test flush sends buffered tokens and cancels the timer."""
+        import asyncio
+
+        sent: list[str] = []
+
+        async def send(text: str) -> None:
+            sent.append(text)
+
+        coalescer = DeltaCoalescer(send, flush_ms=20, flush_chars=100)
+        await coalescer.add("a")
+        await coalescer.add("b")
+        await coalescer.flush()
+        assert sent == ["a", "b"]
+
+        await asyncio.sleep(0.05)
+        assert sent == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_zero_window_sends_every_token(self) -> None:
+        """Test flush_ms=0 disables coalescing."""
+        sent: list[str] = []
+
+        async def send(text: str) -> None:
+            sent.append(text)
+
+        coalescer = DeltaCoalescer(send, flush_ms=0, flush_chars=100)
+        for token in ["a", "b", "c"]:
+            await coalescer.add(token)
+
+        assert sent == ["a", "b", "c"]
@@ -1,10 +1,13 @@
 """Unit tests for STT module."""
 
+import asyncio
+import os
+
 import numpy as np
 import pytest
 
 from voice_assistant.stt import get_stt_device
-from voice_assistant.stt.base import TranscriptionResult
+from voice_assistant.stt.base import BaseSTT, TranscriptionResult
 
 
 class TestGetSttDevice:
@@ -130,3 +133,776 @@ class TestReazonSpeechSTTTranscribe:
         reconstructed = np.frombuffer(audio_bytes, dtype=np.float32)
         assert reconstructed.min() >= -1.0
         assert reconstructed.max() <= 1.0
+
+
+class CharSTT:
+    """Fake STT that transcribes each sample value to one letter."""
+
+    def __init__(self) -> None:
+        self.decoded_lengths: list[int] = []
+        self.cached_calls = 0
+
+    async def transcribe(
+        self, audio_data: bytes, sample_rate: int, use_cache: bool = True
+    ) -> TranscriptionResult:
+        audio = np.frombuffer(audio_data, dtype=np.float32)
+        self.decoded_lengths.append(len(audio))
+        self.cached_calls += use_cache
+        text = "".join(chr(ord("a") + int(v)) for v in audio)
+        return TranscriptionResult(text=text, latency_ms=1.0)
+
+
+class TestStitchTranscripts:
+    """Tests for stitch_transcripts overlap de-duplication."""
+
+    def test_removes_overlap(self) -> None:
+        """Test the overlapping part is kept only once."""
+        from voice_assistant.stt import stitch_transcripts
+
+        assert stitch_transcripts("今日はいい天気", "天気ですね") == "今日はいい天気ですね"
+
+    def test_no_overlap_concatenates(self) -> None:
+        """Test transcripts without common text are joined as is."""
+        from voice_assistant.stt import stitch_transcripts
+
+        assert stitch_transcripts("こんにちは", "さようなら") == "こんにちはさようなら"
+
+    def test_empty_parts(self) -> None:
+        """Test empty prefix or text returns the other part."""
+        from voice_assistant.stt import stitch_transcripts
+
+        assert stitch_transcripts("", "abc") == "abc"
+        assert stitch_transcripts("abc", "") == "abc"
+
+
+class TestWindowedSTTStream:
+    """Tests for WindowedSTTStream incremental transcription."""
+
+    SAMPLE_RATE = 10
+
+    def _chunk(self, start: int, size: int) -> bytes:
+        return np.arange(start, start + size, dtype=np.float32).tobytes()
+
+    @pytest.mark.asyncio
+    async def test_emits_partials_and_final(self) -> None:
+        """Test partial text is reported while audio arrives."""
+        import asyncio
+
+        from voice_assistant.stt import WindowedSTTStream
+
+        stt = CharSTT()
+        partials: list[str] = []
+
+        async def on_partial(text: str) -> None:
+            partials.append(text)
+
+        stream = WindowedSTTStream(
+            stt, on_partial, partial_interval_ms=300, window_sec=10, overlap_sec=1
+        )
+        for start in range(0, 9, 3):
+            stream.feed(self._chunk(start, 3), self.SAMPLE_RATE)
+            await asyncio.sleep(0)
+
+        result = await stream.finish()
+
+        assert partials == ["abc", "abcdef", "abcdefghi"]
+        assert result.text == "abcdefghi"
+        # Last partial covered all audio, so nothing is left to decode
+        assert len(stt.decoded_lengths) == 3
+        # Window decodes are one-off and bypass the transcript cache
+        assert stt.cached_calls == 0
+
+    @pytest.mark.asyncio
+    async def test_final_decodes_only_tail(self) -> None:
+        """Test committed windows are not decoded again at the end."""
+        import asyncio
+
+        from voice_assistant.stt import WindowedSTTStream
+
+        stt = CharSTT()
+
+        async def on_partial(text: str) -> None:
+            pass
+
+        stream = WindowedSTTStream(
+            stt, on_partial, partial_interval_ms=1000, window_sec=1, overlap_sec=0.2
+        )
+        for start in range(0, 25, 5):
+            stream.feed(self._chunk(start, 5), self.SAMPLE_RATE)
+            await asyncio.sleep(0)
+
+        result = await stream.finish()
+
+        assert result.text == "abcdefghijklmnopqrstuvwxy"
+        # Final decode covers the overlap plus the last chunk only
+        assert stt.decoded_lengths[-1] < 10
+
+    @pytest.mark.asyncio
+    async def test_without_partials_decodes_once(self) -> None:
+        """Test a stream without on_partial decodes all audio at the end."""
+        from voice_assistant.stt import WindowedSTTStream
+
+        stt = CharSTT()
+        stream = WindowedSTTStream(stt, partial_interval_ms=100)
+        stream.feed(self._chunk(0, 4), self.SAMPLE_RATE)
+        stream.feed(self._chunk(4, 4), self.SAMPLE_RATE)
+
+        result = await stream.finish()
+
+        assert result.text == "abcdefgh"
+        assert stt.decoded_lengths == [8]
+
+    @pytest.mark.asyncio
+    async def test_close_cancels_decode(self) -> None:
+        """Test close stops reporting partials."""
+        import asyncio
+
+        from voice_assistant.stt import WindowedSTTStream
+
+        partials: list[str] = []
+
+        async def on_partial(text: str) -> None:
+            partials.append(text)
+
+        stream = WindowedSTTStream(CharSTT(), on_partial, partial_interval_ms=100)
+        stream.feed(self._chunk(0, 4), self.SAMPLE_RATE)
+        stream.close()
+        stream.feed(self._chunk(4, 4), self.SAMPLE_RATE)
+        await asyncio.sleep(0.01)
+
+        assert partials == []
+
+
+class TestBatchScheduler:
+    """Tests for BatchScheduler micro-batching."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_batch(self) -> None:
+        """Test requests within the wait window run as one batch."""
+        import asyncio
+
+        from voice_assistant.stt import BatchScheduler
+
+        batches: list[list[int]] = []
+
+        def run_batch(items: list[int]) -> list[int]:
+            batches.append(items)
+            return [item * 10 for item in items]
+
+        scheduler = BatchScheduler(run_batch, max_batch_size=4, max_wait_ms=50)
+        results = await asyncio.gather(*(scheduler.submit(i) for i in range(3)))
+
+        assert results == [0, 10, 20]
+        assert batches == [[0, 1, 2]]
+
+        stats = scheduler.stats()
+        assert stats["batches"] == 1
+        assert stats["items"] == 3
+        assert stats["avg_batch_size"] == 3.0
+        assert stats["batch_size_counts"] == {3: 1}
+
+    @pytest.mark.asyncio
+    async def test_batch_size_is_capped(self) -> None:
+        """Test requests beyond max_batch_size go to the next batch."""
+        import asyncio
+
+        from voice_assistant.stt import BatchScheduler
+
+        batches: list[list[int]] = []
+
+        def run_batch(items: list[int]) -> list[int]:
+            batches.append(items)
+            return items
+
+        scheduler = BatchScheduler(run_batch, max_batch_size=2, max_wait_ms=50)
+        results = await asyncio.gather(*(scheduler.submit(i) for i in range(5)))
+
+        assert results == [0, 1, 2, 3, 4]
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+
+    @pytest.mark.asyncio
+    async def test_error_is_raised_for_each_caller(self) -> None:
+        """Test a failing batch raises the error in every waiting caller."""
+        import asyncio
+
+        from voice_assistant.stt import BatchScheduler
+
+        def run_batch(items: list[int]) -> list[int]:
+            raise ValueError("model error")
+
+        scheduler = BatchScheduler(run_batch, max_batch_size=4, max_wait_ms=10)
+        results = await asyncio.gather(
+            scheduler.submit(1), scheduler.submit(2), return_exceptions=True
+        )
+
+        assert all(isinstance(r, ValueError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_request_is_skipped(self) -> None:
+        """Test a caller cancelled while waiting is left out of the batch."""
+        import asyncio
+
+        from voice_assistant.stt import BatchScheduler
+
+        batches: list[list[int]] = []
+
+        def run_batch(items: list[int]) -> list[int]:
+            batches.append(items)
+            return items
+
+        scheduler = BatchScheduler(run_batch, max_batch_size=4, max_wait_ms=50)
+        cancelled = asyncio.create_task(scheduler.submit(1))
+        kept = asyncio.create_task(scheduler.submit(2))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+
+        assert await kept == 2
+        assert batches == [[2]]
+
+    @pytest.mark.asyncio
+    async def test_groups_items_of_similar_length(self) -> None:
+        """Test items far longer than the oldest one wait for a later batch."""
+        import asyncio
+
+        from voice_assistant.stt import BatchScheduler
+
+        batches: list[list[str]] = []
+
+        def run_batch(items: list[str]) -> list[str]:
+            batches.append(items)
+            return items
+
+        scheduler = BatchScheduler(
+            run_batch,
+            max_batch_size=4,
+            max_wait_ms=50,
+            item_length=len,
+            max_length_ratio=2.0,
+        )
+        texts = ["aaaa", "a" * 20, "aaaaaa", "a" * 30]
+        results = await asyncio.gather(*(scheduler.submit(t) for t in texts))
+
+        assert results == texts
+        assert batches == [["aaaa", "aaaaaa"], ["a" * 20, "a" * 30]]
+        assert scheduler.stats()["occupancy"] == 0.5
+
+    @pytest.mark.asyncio
+    async def test_batches_run_concurrently_on_executor_workers(self) -> None:
+        """Test one batch per executor worker runs at the same time."""
+        import asyncio
+        import threading
+        import time
+
+        from voice_assistant.core.executor import InferenceExecutor
+        from voice_assistant.stt import BatchScheduler
+
+        lock = threading.Lock()
+        running = 0
+        peak = 0
+
+        def run_batch(items: list[int]) -> list[int]:
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.2)
+            with lock:
+                running -= 1
+            return items
+
+        executor = InferenceExecutor("stt", max_workers=4)
+        scheduler = BatchScheduler(
+            run_batch, max_batch_size=1, max_wait_ms=0, executor=executor
+        )
+        try:
+            start = time.perf_counter()
+            results = await asyncio.gather(*(scheduler.submit(i) for i in range(4)))
+            elapsed = time.perf_counter() - start
+        finally:
+            executor.shutdown()
+
+        assert results == [0, 1, 2, 3]
+        assert peak > 1
+        assert elapsed < 0.6
+        assert scheduler.stats()["max_running_batches_seen"] == 4
+
+    @pytest.mark.asyncio
+    async def test_concurrent_batches_are_capped(self) -> None:
+        """Test no more than max_concurrent_batches batches run at once."""
+        import asyncio
+        import time
+
+        from voice_assistant.core.executor import InferenceExecutor
+        from voice_assistant.stt import BatchScheduler
+
+        def run_batch(items: list[int]) -> list[int]:
+            time.sleep(0.05)
+            return items
+
+        executor = InferenceExecutor("stt", max_workers=4)
+        scheduler = BatchScheduler(
+            run_batch,
+            max_batch_size=1,
+            max_wait_ms=0,
+            executor=executor,
+            max_concurrent_batches=2,
+        )
+        try:
+            results = await asyncio.gather(*(scheduler.submit(i) for i in range(6)))
+        finally:
+            executor.shutdown()
+
+        assert results == list(range(6))
+        assert scheduler.stats()["max_running_batches_seen"] == 2
+
+
+class TestSpeechGate:
+    """Tests for SpeechGate silence trimming and speech detection."""
+
+    SAMPLE_RATE = 16000
+
+    def _tone(self, seconds: float, amplitude: float = 0.3) -> np.ndarray:
+        t = np.arange(int(seconds * self.SAMPLE_RATE)) / self.SAMPLE_RATE
+        return (amplitude * np.sin(2 * np.pi * 220 * t)).astype(np.float32)
+
+    def _silence(self, seconds: float) -> np.ndarray:
+        return np.zeros(int(seconds * self.SAMPLE_RATE), dtype=np.float32)
+
+    def test_trims_edge_silence(self) -> None:
+        """Test leading and trailing silence is trimmed (keeping padding)."""
+        from voice_assistant.stt import SpeechGate
+
+        gate = SpeechGate(pad_ms=100)
+        audio = np.concatenate(
+            [self._silence(1.0), self._tone(1.0), self._silence(0.5)]
+        )
+
+        result = gate.process(audio, self.SAMPLE_RATE)
+
+        assert result.has_speech
+        assert result.start == int(0.9 * self.SAMPLE_RATE)
+        assert result.end == int(2.1 * self.SAMPLE_RATE)
+        assert result.speech_ms == 1000.0
+        assert gate.stats()["trimmed_ms"] == 1300.0
+
+    def test_rejects_silence(self) -> None:
+        """Test an utterance without speech is rejected."""
+        from voice_assistant.stt import SpeechGate
+
+        gate = SpeechGate()
+        result = gate.process(self._silence(1.0), self.SAMPLE_RATE)
+
+        assert not result.has_speech
+        assert gate.stats()["skipped"] == 1
+        assert gate.stats()["skipped_ms"] == 1000.0
+
+    def test_rejects_short_click(self) -> None:
+        """Test a burst shorter than min_speech_ms is treated as no speech."""
+        from voice_assistant.stt import SpeechGate
+
+        gate = SpeechGate(min_speech_ms=200)
+        audio = np.concatenate(
+            [self._silence(0.5), self._tone(0.06, amplitude=0.9), self._silence(0.5)]
+        )
+
+        assert not gate.process(audio, self.SAMPLE_RATE).has_speech
+
+    def test_keeps_quiet_fricatives_at_edges(self) -> None:
+        """Test quiet high-ZCR audio next to speech is not trimmed."""
+        from voice_assistant.stt import SpeechGate
+
+        gate = SpeechGate(threshold_db=-30, pad_ms=0)
+        # Alternating samples: maximal zero-crossing rate, about -37 dBFS
+        hiss = np.tile(np.array([0.014, -0.014], dtype=np.float32), 1600)
+        audio = np.concatenate([self._silence(0.5), hiss, self._tone(0.5)])
+
+        result = gate.process(audio, self.SAMPLE_RATE)
+
+        assert result.start == int(0.5 * self.SAMPLE_RATE)
+
+    @pytest.mark.asyncio
+    async def test_transcribe_skips_model_without_speech(self) -> None:
+        """Test silent audio returns empty text without loading the model."""
+        from voice_assistant.stt import ReazonSpeechSTT, SpeechGate
+
+        stt = ReazonSpeechSTT(device="cpu", speech_gate=SpeechGate())
+        result = await stt.transcribe(self._silence(1.0).tobytes(), self.SAMPLE_RATE)
+
+        assert result.text == ""
+        assert not stt.is_model_loaded
+        assert stt.stats()["speech_gate"]["skipped"] == 1
+
+
+class TestSplitSegments:
+    """Tests for long-form segmentation."""
+
+    SAMPLE_RATE = 16000
+
+    def test_short_audio_is_one_segment(self) -> None:
+        """Test audio within segment_sec is not split."""
+        from voice_assistant.stt import split_segments
+
+        audio = np.ones(5 * self.SAMPLE_RATE, dtype=np.float32)
+
+        assert split_segments(audio, self.SAMPLE_RATE, segment_sec=10) == [
+            (0, len(audio))
+        ]
+
+    def test_cuts_at_pauses_with_overlap(self) -> None:
+        """Test cuts fall in pauses and neighbours overlap around them."""
+        from voice_assistant.stt import split_segments
+
+        sr = self.SAMPLE_RATE
+        speech = np.full(4 * sr, 0.5, dtype=np.float32)
+        pause = np.zeros(sr // 5, dtype=np.float32)
+        # Pauses at 4.0-4.2 s and 8.4-8.6 s
+        audio = np.concatenate([speech, pause, speech, pause, speech])
+
+        segments = split_segments(
+            audio, sr, segment_sec=5, overlap_sec=0.1, search_sec=2
+        )
+
+        assert len(segments) == 3
+        assert segments[0][0] == 0
+        assert segments[-1][1] == len(audio)
+        for (_, end), (next_start, _) in zip(segments, segments[1:], strict=False):
+            cut = (end + next_start) // 2
+            assert end - next_start == int(0.1 * sr) // 2 * 2
+            assert np.all(audio[cut - 100 : cut + 100] == 0)
+        assert all(end - start <= 5 * sr for start, end in segments)
+
+    def test_covers_audio_without_pauses(self) -> None:
+        """Test continuous audio is still split into bounded segments."""
+        from voice_assistant.stt import split_segments
+
+        sr = self.SAMPLE_RATE
+        audio = np.full(31 * sr, 0.5, dtype=np.float32)
+
+        segments = split_segments(audio, sr, segment_sec=10, overlap_sec=0.5)
+
+        assert segments[0][0] == 0
+        assert segments[-1][1] == len(audio)
+        for (_, end), (next_start, _) in zip(segments, segments[1:], strict=False):
+            assert next_start < end
+        assert all(end - start <= 10 * sr for start, end in segments)
+
+    @pytest.mark.asyncio
+    async def test_long_form_is_faster_than_single_pass(self) -> None:
+        """Test segments decode concurrently on a multi-worker executor."""
+        import time
+
+        from voice_assistant.core.executor import InferenceExecutor
+        from voice_assistant.stt import ReazonSpeechSTT
+
+        class SleepySTT(ReazonSpeechSTT):
+            """Decodes in 10 ms per second of audio, without a model."""
+
+            async def _ensure_model_loaded(self) -> None:
+                pass
+
+            def _transcribe_arrays(self, items):
+                time.sleep(sum(len(audio) / rate for audio, rate in items) / 100)
+                return ["あ" for _ in items]
+
+        sr = self.SAMPLE_RATE
+        audio = np.full(40 * sr, 0.5, dtype=np.float32).tobytes()
+
+        elapsed = {}
+        for segment_sec in (None, 15.0):
+            executor = InferenceExecutor("stt", max_workers=4)
+            stt = SleepySTT(device="cpu", segment_sec=segment_sec, executor=executor)
+            try:
+                start = time.perf_counter()
+                await stt.transcribe(audio, sr)
+                elapsed[segment_sec] = time.perf_counter() - start
+            finally:
+                executor.shutdown()
+
+        assert stt.stats()["long_form"]["segments"] > 1
+        assert elapsed[15.0] < elapsed[None] * 0.6
+
+
+class TestQuantizeEncoder:
+    """Tests for int8 dynamic quantization of the encoder."""
+
+    def _model(self):
+        from types import SimpleNamespace
+
+        import torch
+
+        torch.manual_seed(0)
+        encoder = torch.nn.Sequential(
+            torch.nn.Linear(16, 32), torch.nn.ReLU(), torch.nn.Linear(32, 8)
+        )
+        return SimpleNamespace(encoder=encoder)
+
+    def test_linear_layers_are_quantized(self) -> None:
+        """Test Linear layers are replaced and outputs stay close."""
+        import torch
+
+        from voice_assistant.stt import quantize_encoder
+
+        model = self._model()
+        x = torch.randn(4, 16)
+        expected = model.encoder(x).detach()
+
+        assert quantize_encoder(model) is False
+
+        assert isinstance(model.encoder[0], torch.ao.nn.quantized.dynamic.Linear)
+        torch.testing.assert_close(model.encoder(x), expected, atol=0.05, rtol=0.1)
+
+    def test_cached_encoder_is_reused(self, tmp_path, monkeypatch) -> None:
+        """Test a second load reads the cache instead of quantizing again."""
+        import torch
+
+        from voice_assistant.stt import quantize_encoder
+
+        assert quantize_encoder(self._model(), tmp_path) is False
+        assert len(list(tmp_path.glob("encoder-int8-*.pt"))) == 1
+
+        def fail(*args, **kwargs):
+            raise AssertionError("quantized again")
+
+        monkeypatch.setattr(torch.ao.quantization, "quantize_dynamic", fail)
+        model = self._model()
+        assert quantize_encoder(model, tmp_path) is True
+        assert isinstance(model.encoder[0], torch.ao.nn.quantized.dynamic.Linear)
+
+    def test_cache_is_keyed_by_weights(self, tmp_path) -> None:
+        """Test different weights get a different cache entry."""
+        import torch
+
+        from voice_assistant.stt import quantize_encoder
+
+        quantize_encoder(self._model(), tmp_path)
+        other = self._model()
+        with torch.no_grad():
+            other.encoder[0].weight.add_(1.0)
+
+        assert quantize_encoder(other, tmp_path) is False
+        assert len(list(tmp_path.glob("encoder-int8-*.pt"))) == 2
+
+
+class TestTranscriptCache:
+    """Tests for the content-addressed transcript cache."""
+
+    def test_key_depends_on_samples_rate_and_model(self) -> None:
+        """Test keys change with audio, sample rate and model version."""
+        from voice_assistant.stt import TranscriptCache
+
+        audio = np.linspace(-1, 1, 1600, dtype=np.float32)
+        key = TranscriptCache.key(audio, 16000, "v1")
+
+        assert key == TranscriptCache.key(audio.copy(), 16000, "v1")
+        assert key != TranscriptCache.key(audio, 8000, "v1")
+        assert key != TranscriptCache.key(audio, 16000, "v2")
+        changed = audio.copy()
+        changed[800] += 1e-6
+        assert key != TranscriptCache.key(changed, 16000, "v1")
+
+    def test_evicts_least_recently_used_over_budget(self) -> None:
+        """Test the byte budget evicts the least recently used entry."""
+        from voice_assistant.stt import TranscriptCache
+
+        size = TranscriptCache._entry_size("a" * 40, "テキスト")
+        cache = TranscriptCache(max_bytes=size * 2)
+        cache.put("a" * 40, "テキスト")
+        cache.put("b" * 40, "テキスト")
+        assert cache.get("a" * 40) == "テキスト"  # b is now least recent
+        cache.put("c" * 40, "テキスト")
+
+        assert cache.get("b" * 40) is None
+        assert cache.get("a" * 40) == "テキスト"
+        stats = cache.stats()
+        assert stats["entries"] == 2
+        assert stats["bytes"] <= stats["max_bytes"]
+        assert stats["evictions"] == 1
+        assert stats["hit_rate"] == round(2 / 3, 4)
+
+    def test_disk_tier_survives_restart(self, tmp_path) -> None:
+        """Test a new cache instance finds entries written to disk."""
+        from voice_assistant.stt import TranscriptCache
+
+        TranscriptCache(disk_dir=tmp_path).put("ab" * 20, "こんにちは")
+
+        cache = TranscriptCache(disk_dir=tmp_path)
+        assert cache.get("ab" * 20) == "こんにちは"
+        assert cache.get("ab" * 20) == "こんにちは"
+        assert cache.stats()["disk_hits"] == 1
+        assert cache.stats()["hits"] == 2
+
+    @pytest.mark.asyncio
+    async def test_async_access_keeps_disk_io_off_the_loop(self, tmp_path) -> None:
+        """Test disk reads and writes run in a thread, memory hits inline."""
+        import threading
+
+        from voice_assistant.stt import TranscriptCache
+
+        TranscriptCache(disk_dir=tmp_path).put("cd" * 20, "さようなら")
+        cache = TranscriptCache(disk_dir=tmp_path)
+        threads = []
+        read_disk, write_disk = cache._read_disk, cache._write_disk
+
+        def record(func):
+            def wrapper(*args):
+                threads.append(threading.current_thread())
+                return func(*args)
+
+            return wrapper
+
+        cache._read_disk = record(read_disk)
+        cache._write_disk = record(write_disk)
+
+        await cache.put_async("ab" * 20, "こんにちは")
+        assert await cache.get_async("ab" * 20) == "こんにちは"
+        assert await cache.get_async("cd" * 20) == "さようなら"
+        assert await cache.get_async("ef" * 20) is None
+
+        # One write and two disk reads; the memory hit touched no thread
+        assert len(threads) == 3
+        assert threading.main_thread() not in threads
+        stats = cache.stats()
+        assert (stats["hits"], stats["disk_hits"], stats["misses"]) == (2, 1, 1)
+
+    @pytest.mark.asyncio
+    async def test_transcribe_returns_cached_result(self) -> None:
+        """Test a cached utterance is returned without loading the model."""
+        from voice_assistant.stt import ReazonSpeechSTT, TranscriptCache
+
+        cache = TranscriptCache()
+        stt = ReazonSpeechSTT(device="cpu", cache=cache)
+        audio = np.full(1600, 0.25, dtype=np.float32)
+        cache.put(cache.key(audio, 16000, stt.model_version), "キャッシュ")
+
+        result = await stt.transcribe(audio.tobytes(), 16000)
+
+        assert result.text == "キャッシュ"
+        assert not stt.is_model_loaded
+        assert stt.stats()["cache"]["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_uncached_transcribe_leaves_cache_alone(self) -> None:
+        """Test use_cache=False neither reads nor fills the cache."""
+        from voice_assistant.stt import ReazonSpeechSTT, TranscriptCache
+
+        class FixedSTT(ReazonSpeechSTT):
+            async def _ensure_model_loaded(self) -> None:
+                pass
+
+            def _transcribe_arrays(self, items):
+                return ["デコード" for _ in items]
+
+        cache = TranscriptCache()
+        stt = FixedSTT(device="cpu", cache=cache)
+        audio = np.full(1600, 0.25, dtype=np.float32)
+        cache.put(cache.key(audio, 16000, stt.model_version), "キャッシュ")
+        other = np.full(1600, 0.5, dtype=np.float32)
+
+        result = await stt.transcribe(audio.tobytes(), 16000, use_cache=False)
+        await stt.transcribe(other.tobytes(), 16000, use_cache=False)
+
+        assert result.text == "デコード"
+        stats = cache.stats()
+        assert stats["entries"] == 1
+        assert stats["hits"] == stats["misses"] == 0
+
+    def test_cache_key_depends_on_speech_gate(self) -> None:
+        """Test transcripts are keyed by whether and how audio is gated."""
+        from voice_assistant.stt import ReazonSpeechSTT, SpeechGate, TranscriptCache
+
+        cache = TranscriptCache()
+        audio = np.full(1600, 0.25, dtype=np.float32)
+        versions = [
+            ReazonSpeechSTT(device="cpu", speech_gate=gate).model_version
+            for gate in (None, SpeechGate(), SpeechGate(threshold_db=-55.0))
+        ]
+
+        keys = {cache.key(audio, 16000, version) for version in versions}
+        assert len(keys) == 3
+
+
+class EchoSTT(BaseSTT):
+    """Fake engine for worker processes: reports what it received.
+
+    A first sample of -1 crashes the process; 2 raises in the engine.
+    """
+
+    async def transcribe(
+        self,
+        audio_data: bytes | memoryview,
+        sample_rate: int,
+        use_cache: bool = True,
+    ) -> TranscriptionResult:
+        audio = np.frombuffer(audio_data, dtype=np.float32)
+        if audio[0] == -1.0:
+            os._exit(1)
+        if audio[0] == 2.0:
+            raise ValueError("bad audio")
+        return TranscriptionResult(
+            text=f"{len(audio)}@{sample_rate}:{audio.sum():.1f}", latency_ms=1.0
+        )
+
+
+def create_echo_stt() -> BaseSTT:
+    """Module-level engine factory (picklable for spawned workers)."""
+    return EchoSTT()
+
+
+class TestProcessPoolSTT:
+    """Tests for the out-of-process STT worker pool."""
+
+    @pytest.mark.asyncio
+    async def test_transcribes_in_workers(self) -> None:
+        """Test audio reaches a worker intact and the text comes back."""
+        from voice_assistant.stt import ProcessPoolSTT
+
+        pool = ProcessPoolSTT(create_echo_stt, workers=2, request_timeout_sec=30)
+        try:
+            audio = np.full(16000, 0.5, dtype=np.float32)
+            results = await asyncio.gather(
+                *(pool.transcribe(audio.tobytes(), 16000) for _ in range(4))
+            )
+
+            assert [r.text for r in results] == ["16000@16000:8000.0"] * 4
+            stats = pool.stats()
+            assert stats["alive"] == 2
+            assert stats["requests"] == 4
+        finally:
+            pool.close()
+
+    @pytest.mark.asyncio
+    async def test_crashed_worker_is_restarted(self) -> None:
+        """Test a crash fails only its request and the worker comes back."""
+        from voice_assistant.stt import ProcessPoolSTT, WorkerCrashedError
+
+        pool = ProcessPoolSTT(create_echo_stt, workers=1, request_timeout_sec=30)
+        try:
+            with pytest.raises(WorkerCrashedError):
+                await pool.transcribe(np.full(10, -1.0, np.float32).tobytes(), 16000)
+            # The error did not wait for the replacement process to start
+            assert pool.stats()["idle"] == 0
+
+            result = await pool.transcribe(np.ones(10, np.float32).tobytes(), 16000)
+
+            assert result.text == "10@16000:10.0"
+            assert pool.stats()["restarts"] == 1
+            assert pool.stats()["alive"] == 1
+        finally:
+            pool.close()
+
+    @pytest.mark.asyncio
+    async def test_engine_error_keeps_worker(self) -> None:
+        """Test an exception in the engine is reported without a restart."""
+        from voice_assistant.stt import ProcessPoolSTT
+
+        pool = ProcessPoolSTT(create_echo_stt, workers=1, request_timeout_sec=30)
+        try:
+            with pytest.raises(RuntimeError, match="bad audio"):
+                await pool.transcribe(np.full(10, 2.0, np.float32).tobytes(), 16000)
+
+            result = await pool.transcribe(np.ones(10, np.float32).tobytes(), 16000)
+
+            assert result.text == "10@16000:10.0"
+            assert pool.stats()["restarts"] == 0
+        finally:
+            pool.close()
@@ -210,6 +210,87 @@ class TestStyleBertVits2TTS:
         assert result.latency_ms >= 0
 
 
+class TestSynthesizeStream:
+    """Tests for frame-by-frame TTS synthesis."""
+
+    def test_iter_pcm16_frames(self):
+        """Test PCM16 audio is split into fixed-duration frames."""
+        from voice_assistant.tts.base import iter_pcm16_frames
+
+        audio = bytes(range(250)) * 4  # 500 samples
+        frames = list(iter_pcm16_frames(audio, sample_rate=1000, frame_ms=200))
+
+        assert [len(f) for f in frames] == [400, 400, 200]
+        assert b"".join(frames) == audio
+
+    def test_iter_pcm16_frames_without_framing(self):
+        """Test frame_ms <= 0 yields the audio as one frame."""
+        from voice_assistant.tts.base import iter_pcm16_frames
+
+        assert list(iter_pcm16_frames(b"\x00\x01", 44100, frame_ms=0)) == [
+            b"\x00\x01"
+        ]
+        assert list(iter_pcm16_frames(b"", 44100, frame_ms=0)) == []
+
+    @pytest.mark.asyncio
+    async def test_base_stream_splits_synthesize_result(self):
+        """Test the default synthesize_stream frames the synthesize result."""
+        from voice_assistant.tts.base import BaseTTS, TTSResult
+
+        class WholeTTS(BaseTTS):
+            async def synthesize(self, text: str) -> TTSResult:
+                return TTSResult(audio=b"\x00" * 1000, sample_rate=1000, latency_ms=5.0)
+
+        frames = [f async for f in WholeTTS().synthesize_stream("テスト", frame_ms=100)]
+
+        assert [len(f.audio) for f in frames] == [200] * 5
+        assert all(f.sample_rate == 1000 for f in frames)
+
+    @pytest.mark.asyncio
+    async def test_long_sentence_synthesized_per_clause(self):
+        """Test clauses are synthesized separately and framed continuously."""
+        from voice_assistant.tts.style_bert_vits2 import StyleBertVits2TTS
+
+        tts = StyleBertVits2TTS(device="cpu", clause_min_chars=5)
+        text = "今日はとても良い天気ですね、散歩に出かけましょう。"
+
+        with patch.object(tts, "_load_model") as mock_load:
+            mock_model = MagicMock()
+            # 150 samples per clause at 1 kHz
+            mock_model.infer.return_value = (1000, np.zeros(150, dtype=np.int16))
+            mock_load.return_value = mock_model
+
+            frames = [f async for f in tts.synthesize_stream(text, frame_ms=100)]
+
+        inferred = [c.kwargs["text"] for c in mock_model.infer.call_args_list]
+        assert inferred == ["今日はとても良い天気ですね、", "散歩に出かけましょう。"]
+        # 300 samples -> three 100-sample frames (remainder carried over)
+        assert [len(f.audio) for f in frames] == [200, 200, 200]
+        assert frames[0].latency_ms <= frames[-1].latency_ms
+
+    @pytest.mark.asyncio
+    async def test_stream_empty_text_yields_nothing(self):
+        """Test empty text yields no frames."""
+        from voice_assistant.tts.style_bert_vits2 import StyleBertVits2TTS
+
+        tts = StyleBertVits2TTS(device="cpu")
+
+        assert [f async for f in tts.synthesize_stream("")] == []
+
+    def test_split_clauses(self):
+        """Test sentences split at clause punctuation, merging short clauses."""
+        from voice_assistant.tts.sentence_buffer import split_clauses
+
+        assert split_clauses("はい、そうです。", min_chars=5) == ["はい、そうです。"]
+        assert split_clauses("今日は晴れです、明日は雨です。", min_chars=5) == [
+            "今日は晴れです、",
+            "明日は雨です。",
+        ]
+        assert split_clauses("長めの最初の節です、はい。", min_chars=5) == [
+            "長めの最初の節です、はい。"
+        ]
+
+
 class TestGetTTSDevice:
     """Tests for get_tts_device function."""
 
@@ -226,3 +307,496 @@ class TestGetTTSDevice:
 
         device = get_tts_device()
         assert device in ("cuda", "cpu")
+
+
+def write_fake_model(model_dir, sample_rate=1000, weights=b"weights"):
+    """Create placeholder model files (enough for hashing, not loading)."""
+    import json
+
+    model_dir.mkdir(parents=True, exist_ok=True)
+    (model_dir / "config.json").write_text(
+        json.dumps({"data": {"sampling_rate": sample_rate}})
+    )
+    (model_dir / "model.safetensors").write_bytes(weights)
+    (model_dir / "style_vectors.npy").write_bytes(b"styles")
+
+
+class TestPhraseCache:
+    """Tests for the TTS phrase cache."""
+
+    def test_key_normalizes_text_and_depends_on_voice(self):
+        """Test keys ignore width/whitespace but not model, voice or rate."""
+        from voice_assistant.tts import PhraseCache
+
+        cache = PhraseCache()
+        key = cache.key("ＯＫです。", "m1", 0, "Neutral", 44100)
+
+        assert key == cache.key("  OKです。 ", "m1", 0, "Neutral", 44100)
+        assert key != cache.key("OKです。", "m2", 0, "Neutral", 44100)
+        assert key != cache.key("OKです。", "m1", 1, "Neutral", 44100)
+        assert key != cache.key("OKです。", "m1", 0, "Happy", 44100)
+        assert key != cache.key("OKです。", "m1", 0, "Neutral", 22050)
+
+    def test_long_phrases_are_not_cached(self):
+        """Test phrases over max_chars get no key."""
+        from voice_assistant.tts import PhraseCache
+
+        cache = PhraseCache(max_chars=5)
+
+        assert cache.key("はい。", "m", 0, "Neutral", 44100) is not None
+        assert cache.key("今日はいい天気ですね。", "m", 0, "Neutral", 44100) is None
+
+    def test_evicts_least_recently_used_over_budget(self):
+        """Test the byte budget evicts the least recently used entry."""
+        from voice_assistant.tts import PhraseCache
+
+        audio = b"\x01\x00" * 100
+        cache = PhraseCache(max_bytes=PhraseCache._entry_size("a" * 40, audio) * 2)
+        cache.put("a" * 40, audio)
+        cache.put("b" * 40, audio)
+        assert cache.get("a" * 40) == audio
+        cache.put("c" * 40, audio)
+
+        assert cache.get("b" * 40) is None
+        stats = cache.stats()
+        assert stats["entries"] == 2
+        assert stats["evictions"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_disk_tier_survives_restart(self, tmp_path):
+        """Test a new cache instance finds PCM written to disk."""
+        from voice_assistant.tts import PhraseCache
+
+        PhraseCache(disk_dir=tmp_path).put("ab" * 20, b"\x01\x02")
+
+        cache = PhraseCache(disk_dir=tmp_path)
+        assert cache.get("ab" * 20) == b"\x01\x02"
+        assert cache.stats()["disk_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_async_access_keeps_disk_io_off_the_loop(self, tmp_path):
+        """Test disk reads and writes run in a thread, memory hits inline."""
+        import threading
+
+        from voice_assistant.tts import PhraseCache
+
+        cache = PhraseCache(disk_dir=tmp_path)
+        threads = []
+        read_disk, write_disk = cache._read_disk, cache._write_disk
+
+        def record(func):
+            def wrapper(*args):
+                threads.append(threading.current_thread())
+                return func(*args)
+
+            return wrapper
+
+        cache._read_disk = record(read_disk)
+        cache._write_disk = record(write_disk)
+
+        await cache.put_async("ab" * 20, b"\x01\x02")
+        assert await cache.get_async("ab" * 20) == b"\x01\x02"
+        cache._entries.clear()
+        assert await cache.get_async("ab" * 20) == b"\x01\x02"
+
+        # One write and one disk read; the memory hit touched no thread
+        assert len(threads) == 2
+        assert threading.main_thread() not in threads
+        assert cache.stats()["disk_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_hit_skips_inference(self, tmp_path):
+        """Test a repeated phrase is synthesized once."""
+        from voice_assistant.tts import PhraseCache, StyleBertVits2TTS
+
+        write_fake_model(tmp_path)
+        tts = StyleBertVits2TTS(device="cpu", model_dir=tmp_path, cache=PhraseCache())
+
+        with patch.object(tts, "_load_model") as mock_load:
+            mock_model = MagicMock()
+            mock_model.infer.return_value = (1000, np.ones(100, dtype=np.int16))
+            mock_load.return_value = mock_model
+
+            first = await tts.synthesize("はい。")
+            second = await tts.synthesize("はい。")
+            frames = [f async for f in tts.synthesize_stream("はい。", frame_ms=0)]
+
+        assert mock_model.infer.call_count == 1
+        assert second.audio == first.audio
+        assert second.sample_rate == 1000
+        assert b"".join(f.audio for f in frames) == first.audio
+        assert tts.stats()["cache"]["hits"] == 2
+
+    @pytest.mark.asyncio
+    async def test_model_change_invalidates_entries(self, tmp_path):
+        """Test entries on disk are not reused after the weights change."""
+        from voice_assistant.tts import PhraseCache, StyleBertVits2TTS
+
+        cache_dir = tmp_path / "cache"
+        for weights in (b"v1", b"v2"):
+            write_fake_model(tmp_path / "model", weights=weights)
+            tts = StyleBertVits2TTS(
+                device="cpu",
+                model_dir=tmp_path / "model",
+                cache=PhraseCache(disk_dir=cache_dir),
+            )
+            with patch.object(tts, "_load_model") as mock_load:
+                mock_load.return_value.infer.return_value = (
+                    1000,
+                    np.ones(10, dtype=np.int16),
+                )
+                await tts.synthesize("はい。")
+
+            assert mock_load.return_value.infer.call_count == 1
+
+
+class CountingTTS:
+    """Fake engine rendering each text to two bytes per character."""
+
+    def __init__(self):
+        self.texts = []
+
+    async def synthesize(self, text):
+        from voice_assistant.tts.base import TTSResult
+
+        self.texts.append(text)
+        audio = b"\x01\x00" * len(text)
+        return TTSResult(audio=audio, sample_rate=1000, latency_ms=1.0)
+
+
+class TestAudioBank:
+    """Tests for the pre-rendered utterance bank."""
+
+    @pytest.mark.asyncio
+    async def test_build_renders_every_utterance(self):
+        """Test utterances are rendered once and served from memory."""
+        from voice_assistant.tts import AudioBank
+
+        tts = CountingTTS()
+        bank = AudioBank({"wait": "少々お待ちください。", "greeting": "こんにちは。"})
+        await bank.build(tts, model_version="v1")
+
+        clip = bank.get("wait")
+        assert clip.audio == b"\x01\x00" * 10
+        assert clip.sample_rate == 1000
+        assert clip.latency_ms == 0.0
+        assert bank.get("missing") is None
+        assert len(tts.texts) == 2
+        assert bank.stats()["plays"] == 1
+
+    @pytest.mark.asyncio
+    async def test_rebuild_loads_from_disk_for_same_model(self, tmp_path):
+        """Test a restart reuses stored audio unless model or text changed."""
+        from voice_assistant.tts import AudioBank
+
+        phrases = {"wait": "少々お待ちください。", "greeting": "こんにちは。"}
+        await AudioBank(phrases, disk_dir=tmp_path).build(CountingTTS(), "v1")
+
+        tts = CountingTTS()
+        bank = AudioBank(phrases, disk_dir=tmp_path)
+        await bank.build(tts, "v1")
+        assert tts.texts == []
+        assert bank.get("greeting").audio == b"\x01\x00" * 6
+        assert bank.stats()["loaded"] == 2
+
+        tts = CountingTTS()
+        changed = {**phrases, "greeting": "ようこそ。"}
+        await AudioBank(changed, disk_dir=tmp_path).build(tts, "v1")
+        assert tts.texts == ["ようこそ。"]
+
+        tts = CountingTTS()
+        await AudioBank(changed, disk_dir=tmp_path).build(tts, "v2")
+        assert sorted(tts.texts) == sorted(changed.values())
+
+
+class TestBatchedSynthesis:
+    """Tests for batched Style-BERT-VITS2 inference."""
+
+    def test_pad_and_split_round_trip(self):
+        """Test inputs are zero-padded and outputs trimmed per text."""
+        import torch
+
+        from voice_assistant.tts.batch_infer import (
+            TextFeatures,
+            pad_features,
+            split_audio,
+        )
+
+        def features(length):
+            ids = torch.arange(1, length + 1)
+            bert = torch.ones(3, length)
+            return TextFeatures(ids, ids, ids, bert, bert, bert)
+
+        batch = pad_features([features(2), features(4)])
+
+        assert batch["x"].tolist() == [[1, 2, 0, 0], [1, 2, 3, 4]]
+        assert batch["x_lengths"].tolist() == [2, 4]
+        assert batch["bert"].shape == (2, 3, 4)
+        assert batch["bert"][0, :, 2:].abs().sum() == 0
+
+        # 3 and 5 spectrogram frames, 4 samples per frame
+        y_mask = torch.zeros(2, 1, 5)
+        y_mask[0, 0, :3] = 1
+        y_mask[1, 0, :] = 1
+        audio = torch.arange(40, dtype=torch.float32).reshape(2, 1, 20)
+        audios = split_audio(audio, y_mask, hop_length=4)
+
+        assert [len(a) for a in audios] == [12, 20]
+        assert audios[0].tolist() == list(range(12))
+
+    @pytest.mark.asyncio
+    async def test_concurrent_sentences_share_a_forward_pass(self):
+        """Test concurrent synthesize calls are batched and split back."""
+        import asyncio
+
+        from voice_assistant.tts import StyleBertVits2TTS
+        from voice_assistant.tts.batch_infer import BatchOutput
+
+        tts = StyleBertVits2TTS(device="cpu", max_batch_size=4, batch_wait_ms=50)
+        mock_model = MagicMock()
+        mock_model.hyper_parameters.data.sampling_rate = 1000
+        calls = []
+
+        def fake_infer_batch(model, texts, speaker_id, style_vector, frontend=None):
+            calls.append(texts)
+            audios = [np.full(len(t), 0.5, dtype=np.float32) for t in texts]
+            longest = max(len(t) for t in texts)
+            return BatchOutput(audios, sum(map(len, texts)), len(texts) * longest)
+
+        with (
+            patch.object(tts, "_load_model", return_value=mock_model),
+            patch.object(tts, "_style_vector", return_value=np.zeros(4)),
+            patch(
+                "voice_assistant.tts.style_bert_vits2.infer_batch", fake_infer_batch
+            ),
+        ):
+            results = await asyncio.gather(
+                tts.synthesize("はい。"), tts.synthesize("そうですね。")
+            )
+
+        assert calls == [["はい。", "そうですね。"]]
+        assert [len(r.audio) for r in results] == [6, 12]
+        assert all(r.sample_rate == 1000 for r in results)
+        mock_model.infer.assert_not_called()
+        stats = tts.stats()["batching"]
+        assert stats["batches"] == 1
+        assert stats["occupancy"] == 0.5
+        assert stats["padding_efficiency"] == 0.75
+
+
+class TestLookaheadSynthesizer:
+    """Tests for LookaheadSynthesizer."""
+
+    @staticmethod
+    def make_stream(delays, started):
+        """Frames per sentence after a per-sentence delay."""
+        import asyncio
+
+        from voice_assistant.tts import TTSResult
+
+        async def synthesize_stream(text):
+            started.append(text)
+            await asyncio.sleep(delays.get(text, 0))
+            for char in text:
+                yield TTSResult(audio=char.encode(), sample_rate=1000, latency_ms=0)
+
+        return synthesize_stream
+
+    @staticmethod
+    async def feed(lookahead, texts):
+        """Submit texts, then end the turn."""
+        for text in texts:
+            await lookahead.submit(text)
+        lookahead.end()
+
+    async def collect(self, lookahead, texts):
+        """Submit texts and read every sentence's frames in order."""
+        import asyncio
+
+        feeder = asyncio.create_task(self.feed(lookahead, texts))
+        out = []
+        async for text, frames in lookahead.sentences():
+            out.append((text, b"".join([f.audio async for f in frames])))
+        await feeder
+        return out
+
+    @pytest.mark.asyncio
+    async def test_emits_in_submission_order(self):
+        """Sentences that finish early wait for earlier ones."""
+        from voice_assistant.tts import LookaheadSynthesizer
+
+        started = []
+        stream = self.make_stream({"ab": 0.05}, started)
+        lookahead = LookaheadSynthesizer(stream, lookahead=3)
+
+        out = await self.collect(lookahead, ["ab", "c", "de"])
+
+        assert out == [("ab", b"ab"), ("c", b"c"), ("de", b"de")]
+
+    @pytest.mark.asyncio
+    async def test_lookahead_bounds_sentences_in_flight(self):
+        """The next sentence starts during the current one only with K > 1."""
+        import asyncio
+
+        from voice_assistant.tts import LookaheadSynthesizer
+
+        for k, expected in ((1, ["a"]), (2, ["a", "b"])):
+            started = []
+            lookahead = LookaheadSynthesizer(self.make_stream({}, started), k)
+            feeder = asyncio.create_task(self.feed(lookahead, ["a", "b", "c"]))
+            sentences = lookahead.sentences()
+
+            text, _ = await anext(sentences)
+            await asyncio.sleep(0.01)
+
+            assert text == "a"
+            assert started == expected
+            await sentences.aclose()
+            feeder.cancel()
+            lookahead.cancel()
+
+    @pytest.mark.asyncio
+    async def test_error_is_raised_for_its_sentence_only(self):
+        """A failed sentence raises from its frames; later ones still play."""
+        import asyncio
+
+        from voice_assistant.tts import LookaheadSynthesizer, TTSResult
+
+        async def synthesize_stream(text):
+            yield TTSResult(audio=b"x", sample_rate=1000, latency_ms=0)
+            if text == "bad":
+                raise RuntimeError("synthesis failed")
+
+        lookahead = LookaheadSynthesizer(synthesize_stream, lookahead=2)
+        feeder = asyncio.create_task(self.feed(lookahead, ["bad", "good"]))
+        results = {}
+        async for text, frames in lookahead.sentences():
+            received = []
+            try:
+                async for frame in frames:
+                    received.append(frame.audio)
+            except RuntimeError as e:
+                received.append(str(e))
+            results[text] = received
+        await feeder
+
+        assert results == {"bad": [b"x", "synthesis failed"], "good": [b"x"]}
+
+
+class TestChunkGaps:
+    """Tests for ChunkGaps."""
+
+    def test_tracks_sentence_boundary_gaps(self):
+        """Gaps before a sentence's first chunk are also counted separately."""
+        from voice_assistant.tts import ChunkGaps
+
+        gaps = ChunkGaps()
+        with patch(
+            "voice_assistant.tts.lookahead.time.perf_counter",
+            side_effect=[0.0, 0.01, 0.05, 0.06],
+        ):
+            gaps.record(sentence_start=True)
+            gaps.record(sentence_start=False)
+            gaps.record(sentence_start=True)
+            gaps.record(sentence_start=False)
+
+        total = ChunkGaps()
+        total.add(gaps)
+        stats = total.stats()
+        assert stats["chunks"] == 4
+        assert stats["avg_gap_ms"] == 20.0
+        assert stats["max_gap_ms"] == 40.0
+        assert stats["sentence_boundaries"] == 1
+        assert stats["avg_boundary_gap_ms"] == 40.0
+
+
+class TestTextFrontendCache:
+    """Tests for TextFrontendCache."""
+
+    @staticmethod
+    def features(length):
+        """Front-end output for a text of ``length`` phonemes."""
+        import torch
+
+        from voice_assistant.tts.batch_infer import TextFeatures
+
+        ids = torch.arange(length)
+        bert = torch.zeros(4, length)
+        return TextFeatures(ids, ids, ids, bert, bert, bert)
+
+    def test_hit_by_normalized_text(self):
+        """Test width and whitespace variants share an entry."""
+        from voice_assistant.tts import TextFrontendCache
+
+        cache = TextFrontendCache()
+        features = self.features(5)
+        cache.put("はい、ＯＫです。", features, compute_ms=80.0)
+
+        assert cache.get(" はい、OKです。 ") is features
+        assert cache.get("いいえ。") is None
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+        assert stats["saved_ms"] == 80.0
+
+    def test_evicts_least_recently_used_over_budget(self):
+        """Test the memory budget evicts the least recently used text."""
+        from voice_assistant.tts import TextFrontendCache
+
+        cache = TextFrontendCache()
+        cache.put("一", self.features(10), 1.0)
+        # Room for about two entries
+        cache.max_bytes = int(cache.stats()["bytes"] * 2.5)
+        cache.put("二", self.features(10), 1.0)
+        cache.get("一")
+        cache.put("三", self.features(10), 1.0)
+
+        assert cache.get("一") is not None
+        assert cache.get("二") is None
+        assert cache.stats()["evictions"] == 1
+        assert cache.stats()["bytes"] <= cache.max_bytes
+
+    def test_text_features_uses_cache(self):
+        """Test cached texts skip the front-end entirely."""
+        from voice_assistant.tts import TextFrontendCache
+        from voice_assistant.tts.batch_infer import text_features
+
+        cache = TextFrontendCache()
+        features = self.features(3)
+        cache.put("こんにちは。", features, 50.0)
+
+        assert text_features(MagicMock(), "こんにちは。", cache) is features
+
+    @pytest.mark.asyncio
+    async def test_single_text_skips_model_infer(self):
+        """Test a front-end cache routes single texts through infer_batch."""
+        from voice_assistant.tts import StyleBertVits2TTS, TextFrontendCache
+        from voice_assistant.tts.batch_infer import BatchOutput
+
+        cache = TextFrontendCache()
+        tts = StyleBertVits2TTS(device="cpu", frontend_cache=cache)
+        mock_model = MagicMock()
+        mock_model.hyper_parameters.data.sampling_rate = 1000
+        calls = []
+
+        def fake_infer_batch(model, texts, speaker_id, style_vector, frontend):
+            calls.append((texts, frontend))
+            audios = [np.full(len(t), 0.5, dtype=np.float32) for t in texts]
+            return BatchOutput(audios, len(texts[0]), len(texts[0]))
+
+        with (
+            patch.object(tts, "_load_model", return_value=mock_model),
+            patch.object(tts, "_style_vector", return_value=np.zeros(4)),
+            patch(
+                "voice_assistant.tts.style_bert_vits2.infer_batch", fake_infer_batch
+            ),
+        ):
+            result = await tts.synthesize("はい。")
+
+        assert calls == [(["はい。"], cache)]
+        assert len(result.audio) == 6
+        assert result.sample_rate == 1000
+        mock_model.infer.assert_not_called()
+        assert tts.stats()["batching"]["padding_efficiency"] == 1.0
+        assert "frontend" in tts.stats()